@@ -0,0 +1,58 @@
+"""Build src/id_validation/data/belfiore.bin from ANPR-derived JSON.
+
+The source files are ``municipalities.json``, ``countries.json`` and
+``deleted-countries.json`` as shipped in the ``data`` directory of the MIT-licensed
+python-codicefiscale package (https://github.com/fabiocaccamo/python-codicefiscale).
+They are compiled from ANPR's "Archivio storico dei comuni" and ISTAT's list of
+foreign states.
+
+    python scripts/build_belfiore_table.py path/to/codicefiscale/data
+
+A code that was reused over time (e.g. after a comune was merged or renamed) keeps
+the current entry if there is one, otherwise the most recently deleted one.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from id_validation.belfiore import DEFAULT_PATH, Municipality, build_table, pack_code  # noqa: E402
+
+
+def _rank(record: dict) -> tuple:
+    # Current entries first, then the latest deletion date ("" sorts first otherwise).
+    return (record["active"] or not record["date_deleted"], record["date_deleted"], record["date_created"])
+
+
+def main(source: Path, output: Path) -> None:
+    records = []
+    for name in ("municipalities.json", "countries.json", "deleted-countries.json"):
+        records += json.loads((source / name).read_text(encoding="utf-8"))
+
+    best: dict[str, dict] = {}
+    for record in records:
+        code = record["code"]
+        if pack_code(code) < 0:
+            continue  # placeholder codes such as "ND"
+        if code not in best or _rank(record) > _rank(best[code]):
+            best[code] = record
+
+    entries = [
+        Municipality(
+            code=code,
+            name=r["name"],
+            province=r["province"],
+            active=bool(r["active"] or not r["date_deleted"]),
+        )
+        for code, r in best.items()
+    ]
+    output.write_bytes(build_table(entries))
+    print(f"Wrote {len(entries)} codes to {output}")
+
+
+if __name__ == "__main__":
+    main(Path(sys.argv[1]), Path(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_PATH)
@@ -0,0 +1,283 @@
+"""Memory footprint of parse results and validator tables, checked against JSON budgets.
+
+    python scripts/memory_benchmark.py                 # report
+    python scripts/memory_benchmark.py --check         # exit 1 if a budget is exceeded
+    python scripts/memory_benchmark.py --update        # rewrite the budgets from this run
+    python scripts/memory_benchmark.py -n 20000 ZA PL  # fewer rows, some countries
+
+For each registered country, ``n`` results of ``parse()`` are kept in a list
+while ``tracemalloc`` traces allocations. Figures are scaled to 1M results:
+
+- ``peak``: peak traced memory while parsing.
+- ``retained``: memory still held by the results afterwards.
+- A ``sys.getsizeof`` breakdown of the retained memory: ``parsed_id`` (instances
+  and their ``__dict__``), ``extra`` (dicts and their values), ``dates`` and
+  ``strings``. Objects shared between results, such as interned labels, are
+  counted once.
+
+Input strings are built before tracing starts, so they are not counted.
+
+Two import-time figures are also reported:
+
+- ``import``: bytes allocated while importing each module of the package,
+  traced in a fresh interpreter.
+- ``tables``: the deep size of each module-level lookup table
+  (``_REGION_LOOKUP``, ``_COUNTY_NAMES``, ``_STATE_CODES``, ``_PROVINCES``, ...).
+
+Budgets live in ``scripts/memory_budgets.json``. A measurement fails the check
+when it exceeds its budget by more than the file's ``tolerance``. Figures depend
+on the Python version, so the file records the version it was made with, and a
+mismatch is reported.
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as _dt
+import gc
+import json
+import platform
+import random
+import subprocess
+import sys
+import tracemalloc
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Iterable
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+sys.path.insert(0, str(SRC))
+
+import id_validation  # noqa: E402
+from id_validation import VALIDATORS, ValidatorFactory  # noqa: E402
+from id_validation.layout import LAYOUTS  # noqa: E402
+
+BUDGETS_PATH = Path(__file__).with_name("memory_budgets.json")
+PER = 1_000_000
+
+# One valid ID per country without a layout generator.
+SAMPLES = {
+    "AR": "20123456786",
+    "BE": "85073003328",
+    "BR": "52998224725",
+    "CA": "046454286",
+    "CL": "60803000K",
+    "CO": "0303068942075",
+    "CZ": "7801011230",
+    "DK": "010203-4123",
+    "EC": "1710034065",
+    "ES": "12345678Z",
+    "FI": "131052-308T",
+    "FR": "185057800608491",
+    "HR": "02070803628",
+    "IT": "RSSMRA85M01H501Q",
+    "LV": "010203-11234",
+    "MX": "GODE900101HDFRRN08",
+    "NG": "12345678901",
+    "NL": "111222333",
+    "NO": "30078510036",
+    "PT": "123456789",
+    "RO": "1800101221144",
+    "SE": "9003739134",
+    "SI": "0101006500006",
+    "SK": "7801011230",
+    "TR": "10000000146",
+    "ZA": "7106245929185",
+    "ZA_OLD": "4102068120179",
+    "ZW": "50025544Q12",
+}
+
+_CONTAINERS = (dict, list, tuple, set, frozenset)
+
+
+def deep_size(obj: Any, seen: set[int]) -> int:
+    """``sys.getsizeof`` of ``obj`` and everything it contains, skipping objects in ``seen``."""
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_size(k, seen) + deep_size(v, seen) for k, v in obj.items())
+    elif isinstance(obj, _CONTAINERS):
+        size += sum(deep_size(v, seen) for v in obj)
+    return size
+
+
+def _inputs(country: str, n: int) -> list[str]:
+    layout = LAYOUTS.get(country)
+    if layout is not None:
+        rng = random.Random(country)
+        return [layout.generate(rng) for _ in range(n)]
+    sample = SAMPLES[country]
+    return ["".join(sample) for _ in range(n)]  # distinct objects, like rows read from a file
+
+
+def measure_parse(country: str, n: int) -> dict[str, int]:
+    """Peak, retained and broken-down bytes for 1M ``parse()`` results of ``country``."""
+    validator = ValidatorFactory.get_validator(country)
+    inputs = _inputs(country, n)
+    for v in inputs[:10]:
+        validator.parse(v)  # warm caches and lazily loaded tables
+    parse = validator.parse
+
+    gc.collect()
+    tracemalloc.start()
+    results = [parse(v) for v in inputs]
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    seen: set[int] = set()
+    parsed_id = extra = dates = strings = 0
+    for p in results:
+        parsed_id += sys.getsizeof(p) + sys.getsizeof(p.__dict__)
+        for value in (p.country_code, p.id_number, p.id_type, p.gender):
+            strings += deep_size(value, seen) if value is not None else 0
+        if p.dob is not None:
+            dates += deep_size(p.dob, seen)
+        if p.extra is not None:
+            for value in p.extra.values():
+                if isinstance(value, _dt.date) and id(value) not in seen:
+                    dates += deep_size(value, seen)
+            extra += deep_size(p.extra, seen)
+
+    def scale(v: int) -> int:
+        return round(v * PER / n)
+
+    return {
+        "peak": scale(peak),
+        "retained": scale(retained),
+        "parsed_id": scale(parsed_id),
+        "extra": scale(extra),
+        "dates": scale(dates),
+        "strings": scale(strings),
+        "list": scale(sys.getsizeof(results)),
+    }
+
+
+def _validator_modules() -> Iterable[ModuleType]:
+    for name, module in sorted(sys.modules.items()):
+        if module is None or not name.startswith("id_validation."):
+            continue
+        short = name.split(".", 1)[1]
+        if short.startswith("validate_") or short.startswith("validators."):
+            yield module
+
+
+def measure_tables(min_bytes: int = 1024) -> dict[str, int]:
+    """Deep size of every module-level table of at least ``min_bytes`` in the validator modules."""
+    out: dict[str, int] = {}
+    seen: set[int] = set()
+    for module in _validator_modules():
+        for attr, value in vars(module).items():
+            if not attr.lstrip("_")[:1].isupper() or attr.startswith("__"):
+                continue
+            if not isinstance(value, _CONTAINERS) and type(value).__name__ != "ndarray":
+                continue
+            if id(value) in seen:
+                continue  # public aliases such as REGION_LOOKUP = _REGION_LOOKUP
+            size = deep_size(value, seen)
+            if size >= min_bytes:
+                out[f"{module.__name__.split('.', 1)[1]}.{attr}"] = size
+    return out
+
+
+_IMPORT_PROBE = """
+import json, sys, tracemalloc
+tracemalloc.start()
+import id_validation
+snapshot = tracemalloc.take_snapshot()
+package = sys.argv[1]
+sizes = {}
+for stat in snapshot.statistics("filename"):
+    name = stat.traceback[0].filename
+    if name.startswith(package):
+        sizes[name[len(package) + 1 :]] = stat.size
+print(json.dumps(sizes))
+"""
+
+
+def measure_imports(min_bytes: int = 4096) -> dict[str, int]:
+    """Bytes allocated by each package module during ``import id_validation`` in a fresh interpreter."""
+    package = str(Path(id_validation.__file__).parent)
+    out = subprocess.run(
+        [sys.executable, "-c", _IMPORT_PROBE, package],
+        check=True,
+        capture_output=True,
+        text=True,
+        env={"PYTHONPATH": str(SRC)},
+    ).stdout
+    sizes = json.loads(out)
+    return {name: size for name, size in sorted(sizes.items()) if size >= min_bytes}
+
+
+def measure(countries: Iterable[str], n: int) -> dict[str, Any]:
+    return {
+        "python": platform.python_version_tuple()[0] + "." + platform.python_version_tuple()[1],
+        "parse_per_million": {country: measure_parse(country, n) for country in countries},
+        "import": measure_imports(),
+        "tables": measure_tables(),
+    }
+
+
+def check(measured: dict[str, Any], budgets: dict[str, Any]) -> list[str]:
+    """Messages for every measurement over budget by more than the tolerance."""
+    tolerance = budgets.get("tolerance", 0.1)
+    failures = []
+    for section in ("parse_per_million", "import", "tables"):
+        for name, value in measured[section].items():
+            budget = budgets.get(section, {}).get(name)
+            if budget is None:
+                continue
+            pairs = value.items() if isinstance(value, dict) else [(None, value)]
+            for key, bytes_ in pairs:
+                limit = budget.get(key) if key is not None else budget
+                if limit is not None and bytes_ > limit * (1 + tolerance):
+                    label = f"{section}.{name}" + (f".{key}" if key else "")
+                    failures.append(f"{label}: {bytes_:,} bytes exceeds budget {limit:,} (+{tolerance:.0%})")
+    return failures
+
+
+def _report(measured: dict[str, Any]) -> None:
+    columns = ("peak", "retained", "parsed_id", "extra", "dates", "strings")
+    print(f"Per {PER:,} parse() results (MB)")
+    print(f"{'country':8}" + "".join(f"{c:>11}" for c in columns))
+    for country, row in measured["parse_per_million"].items():
+        print(f"{country:8}" + "".join(f"{row[c] / 1e6:11.1f}" for c in columns))
+    print("\nImport-time allocations (KB)")
+    for name, size in measured["import"].items():
+        print(f"  {name:45}{size / 1e3:10.1f}")
+    print("\nModule tables (KB)")
+    for name, size in measured["tables"].items():
+        print(f"  {name:45}{size / 1e3:10.1f}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("countries", nargs="*", help="country codes (default: all registered)")
+    parser.add_argument("-n", type=int, default=100_000, help="results per country (scaled to 1M)")
+    parser.add_argument("--check", action="store_true", help="exit 1 if a budget is exceeded")
+    parser.add_argument("--update", action="store_true", help="write the measurements as the new budgets")
+    parser.add_argument("--budgets", type=Path, default=BUDGETS_PATH)
+    args = parser.parse_args(argv)
+
+    measured = measure(args.countries or sorted(VALIDATORS), args.n)
+    _report(measured)
+
+    if args.update:
+        budgets = json.loads(args.budgets.read_text()) if args.budgets.exists() else {"tolerance": 0.1}
+        budgets.update(measured)
+        args.budgets.write_text(json.dumps(budgets, indent=2) + "\n")
+        print(f"\nWrote {args.budgets}")
+    if args.check:
+        budgets = json.loads(args.budgets.read_text())
+        if budgets.get("python") != measured["python"]:
+            print(f"\nNote: budgets were recorded with Python {budgets.get('python')}, this is {measured['python']}")
+        failures = check(measured, budgets)
+        for failure in failures:
+            print(f"OVER BUDGET {failure}")
+        return 1 if failures else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
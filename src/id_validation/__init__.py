@@ -10,6 +10,7 @@ class ValidatorOptions(TypedDict, total=False):
     """Options that can be passed to validators."""
 
     strict_checksum: bool  # Used by DK (Denmark) CPR validator
+    strict_municipality: bool  # Used by IT (Italy) codice fiscale validator
 
 # Import validators (side-effect: register with registry)
 from .validate_botswana import BotswanaValidator
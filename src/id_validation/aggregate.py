@@ -0,0 +1,236 @@
+"""Demographic counts over ID columns, without keeping per-row results.
+
+``aggregate(country_code, ids)`` reads ``ids`` in chunks and runs one batch pass
+per chunk. It adds the decoded columns to a ``Demographics`` histogram, then
+discards the chunk. For countries with a batch kernel no ``ParsedID`` is built.
+Memory does not grow with the length of the input.
+
+The histogram is one NumPy ``int64`` array over four axes:
+
+- ``year``: the birth year, 1800 to 2099.
+- ``gender``.
+- ``citizenship``: ZA and ZA_OLD only.
+- ``region``: the country's region names (``REGION_COLUMNS``).
+
+Slot 0 of every axis means "not decoded", for example an ID format that has no
+birth date. Only valid rows are counted in the histogram. Every row, valid or
+not, is also counted by ``Reason`` (see ``id_validation.parallel``).
+
+``Demographics`` objects for the same country merge by addition (``a.merge(b)``
+or ``a + b``). Each process or shard can count its own part of the input, and
+the partial results can be combined afterwards. They pickle, and
+``to_dict``/``from_dict`` give a JSON-friendly form.
+
+Requires NumPy (``pip install id-validation[batch]``).
+"""
+
+from __future__ import annotations
+
+from itertools import islice
+from typing import Any, Iterable, Optional, Sequence
+
+import numpy as np
+
+from .batch import BatchResult, _default_pool, _parse_normalized, group_rows
+from .normalize import IDInput
+from .parallel import Reason, encoded_lengths, reasons
+from .pool import ValidatorPool
+from .validators.kernels import GENDERS
+
+
+YEAR_MIN = 1800
+YEAR_MAX = 2099
+AXES = ("year", "gender", "citizenship", "region")
+
+# Category column counted on the ``region`` axis, per country.
+REGION_COLUMNS = {
+    "EC": "province_name",
+    "MX": "state_name",
+    "RO": "county_name",
+    "ZW": "registration_region",
+}
+CITIZENSHIP_COLUMN = "citizenship"
+
+
+class Demographics:
+    """Mergeable counts of valid IDs by birth year, gender, citizenship and region."""
+
+    def __init__(self, country_code: str) -> None:
+        self.country_code = country_code
+        # Labels of slots 1.. on the categorical axes; slot 0 is "not decoded".
+        self.labels: dict[str, tuple[str, ...]] = {"gender": GENDERS, "citizenship": (), "region": ()}
+        self.counts = np.zeros((YEAR_MAX - YEAR_MIN + 2, len(GENDERS) + 1, 1, 1), dtype=np.int64)
+        self.reasons = np.zeros(len(Reason), dtype=np.int64)
+
+    def __repr__(self) -> str:
+        return f"Demographics({self.country_code!r}, rows={self.rows}, valid={self.valid})"
+
+    @property
+    def rows(self) -> int:
+        return int(self.reasons.sum())
+
+    @property
+    def valid(self) -> int:
+        return int(self.reasons[Reason.VALID])
+
+    def _slots(self, axis: str, labels: Sequence[str]) -> np.ndarray:
+        """Slot of each of ``labels`` on ``axis``, growing the axis for labels not seen before."""
+        known = self.labels[axis]
+        new = [label for label in labels if label not in known]
+        if new:
+            dim = AXES.index(axis)
+            pad = [(0, 0)] * self.counts.ndim
+            pad[dim] = (0, len(new))
+            self.counts = np.pad(self.counts, pad)
+            known = self.labels[axis] = known + tuple(dict.fromkeys(new))
+        index = {label: i + 1 for i, label in enumerate(known)}
+        return np.array([0] + [index[label] for label in labels], dtype=np.int64)
+
+    def _category(self, result: BatchResult, axis: str, name: Optional[str]) -> np.ndarray:
+        """Slot per valid row for category column ``name`` (all 0 if the country lacks it)."""
+        valid = result.valid
+        if name is None or name not in result.categories:
+            return np.zeros(int(valid.sum()), dtype=np.int64)
+        slots = self._slots(axis, result.categories[name])
+        return slots[result.columns[name][valid].astype(np.int64) + 1]
+
+    def add_result(self, result: BatchResult, reasons: np.ndarray) -> None:
+        """Count a ``BatchResult`` and its per-row ``Reason`` codes."""
+        self.reasons += np.bincount(reasons, minlength=len(Reason))
+        valid = result.valid
+        if "dob" in result.columns:
+            dob = result.columns["dob"][valid]
+            years = dob.astype("datetime64[Y]").astype(np.int64) + 1970
+            ok = ~np.isnat(dob) & (years >= YEAR_MIN) & (years <= YEAR_MAX)
+            year = np.where(ok, years - YEAR_MIN + 1, 0)
+        else:
+            year = np.zeros(int(valid.sum()), dtype=np.int64)
+        gender = self._category(result, "gender", "gender")
+        citizenship = self._category(result, "citizenship", CITIZENSHIP_COLUMN)
+        region = self._category(result, "region", REGION_COLUMNS.get(self.country_code))
+        flat = np.ravel_multi_index((year, gender, citizenship, region), self.counts.shape)
+        self.counts += np.bincount(flat, minlength=self.counts.size).reshape(self.counts.shape)
+
+    def update(self, ids: Sequence[IDInput], *, pool: ValidatorPool | None = None) -> None:
+        """Validate and count one chunk of ``ids``.
+
+        Raises:
+            ValueError: If no validator is registered for ``country_code``.
+        """
+        validator = (pool or _default_pool).get(self.country_code)
+        normalized = validator.normalize_many(ids)  # type: ignore[attr-defined]
+        result = _parse_normalized(self.country_code, validator, normalized, keep_ids=False)  # type: ignore[arg-type]
+        self.add_result(result, reasons(self.country_code, encoded_lengths(normalized), result.valid))
+
+    def merge(self, other: Demographics) -> Demographics:
+        """Add ``other``'s counts to this one (in place); returns ``self``.
+
+        Raises:
+            ValueError: If the two count different countries.
+        """
+        if other.country_code != self.country_code:
+            raise ValueError(f"Cannot merge {other.country_code} counts into {self.country_code}")
+        # Labels may be numbered differently on each side; slots are distinct, so plain fancy indexing adds.
+        slots = [self._slots(axis, other.labels[axis]) for axis in AXES[1:]]
+        self.counts[np.ix_(np.arange(self.counts.shape[0]), *slots)] += other.counts
+        self.reasons += other.reasons
+        return self
+
+    def __add__(self, other: Demographics) -> Demographics:
+        return self.copy().merge(other)
+
+    def copy(self) -> Demographics:
+        out = Demographics(self.country_code)
+        out.labels = dict(self.labels)
+        out.counts = self.counts.copy()
+        out.reasons = self.reasons.copy()
+        return out
+
+    def by(self, axis: str) -> dict[Any, int]:
+        """Counts of valid IDs along one axis; the "not decoded" slot is keyed ``None``.
+
+        Years are ``int`` keys, other axes their labels. Empty slots are left out.
+        """
+        dim = AXES.index(axis)
+        totals = self.counts.sum(axis=tuple(d for d in range(self.counts.ndim) if d != dim)).tolist()
+        if axis == "year":
+            keys: list[Any] = [None] + list(range(YEAR_MIN, YEAR_MAX + 1))
+        else:
+            keys = [None, *self.labels[axis]]
+        return {key: count for key, count in zip(keys, totals) if count}
+
+    def by_reason(self) -> dict[str, int]:
+        """Counts of all rows by ``Reason`` name."""
+        return {reason.name: int(self.reasons[reason]) for reason in Reason}
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-friendly form: the non-empty histogram cells as ``[year, gender, citizenship, region, count]``."""
+        cells = np.argwhere(self.counts)
+        return {
+            "country_code": self.country_code,
+            "labels": {axis: list(labels) for axis, labels in self.labels.items()},
+            "reasons": self.reasons.tolist(),
+            "cells": [[*cell, int(self.counts[tuple(cell)])] for cell in cells.tolist()],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Demographics:
+        out = cls(data["country_code"])
+        for axis, labels in data["labels"].items():
+            out._slots(axis, labels)
+        out.reasons[:] = data["reasons"]
+        for *cell, count in data["cells"]:
+            out.counts[tuple(cell)] = count
+        return out
+
+
+def _chunks(values: Iterable[Any], size: int) -> Iterable[list[Any]]:
+    it = iter(values)
+    while chunk := list(islice(it, size)):
+        yield chunk
+
+
+def aggregate(
+    country_code: str,
+    ids: Iterable[IDInput],
+    *,
+    chunk_size: int = 65536,
+    pool: ValidatorPool | None = None,
+) -> Demographics:
+    """Count a stream of IDs of one country, ``chunk_size`` rows at a time.
+
+    Raises:
+        ValueError: If no validator is registered for ``country_code``.
+    """
+    out = Demographics(country_code)
+    for chunk in _chunks(ids, chunk_size):
+        out.update(chunk, pool=pool)
+    return out
+
+
+def aggregate_mixed(
+    ids: Iterable[IDInput],
+    countries: Iterable[Any],
+    *,
+    chunk_size: int = 65536,
+    pool: ValidatorPool | None = None,
+) -> dict[str, Demographics]:
+    """Count a stream of ``(id, country)`` pairs; rows with unknown countries are skipped.
+
+    Raises:
+        ValueError: If ``ids`` and ``countries`` differ in length.
+    """
+    out: dict[str, Demographics] = {}
+    country_chunks = _chunks(countries, chunk_size)
+    for chunk in _chunks(ids, chunk_size):
+        codes = next(country_chunks, [])
+        if len(codes) != len(chunk):
+            raise ValueError("ids and countries differ in length")
+        values = np.empty(len(chunk), dtype=object)
+        values[:] = chunk
+        for code, positions in group_rows(codes):
+            if code is not None:
+                out.setdefault(code, Demographics(code)).update(values[positions].tolist(), pool=pool)
+    if next(country_chunks, None) is not None:
+        raise ValueError("ids and countries differ in length")
+    return out
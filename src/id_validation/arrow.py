@@ -0,0 +1,161 @@
+"""Apache Arrow entry points for validating string columns.
+
+``validate_arrow`` and ``parse_arrow`` accept a ``pyarrow`` ``StringArray``,
+``LargeStringArray`` or ``ChunkedArray`` of either. For countries with a batch
+kernel, the array's offsets and data buffers are viewed as NumPy arrays and rows
+of the kernel's width are gathered straight into the ``(n, width)`` byte matrix,
+without creating a Python ``str`` per row; the validator's normalizer byte table
+(upper-casing, for ``IT`` and ``MX``) is applied to the matrix as a whole. Only
+rows longer than the width (which may still normalize to a valid ID, e.g.
+``"529.982.247-25"``) or holding a separator, whitespace or non-ASCII byte are
+decoded and normalized individually.
+
+Results are Arrow arrays: a ``bool`` validity mask, ``date32`` dob and
+dictionary-encoded gender/id_type/categorical fields.
+
+Requires pyarrow and NumPy (``pip install id-validation[arrow]``).
+"""
+
+from __future__ import annotations
+
+from typing import Union
+
+import numpy as np
+import pyarrow as pa
+
+from .batch import BatchResult, _default_pool, encode_fixed_width, kernel_batch, parse_batch
+from .normalize import _ASCII_WHITESPACE_BYTES
+from .validators.kernels import KERNELS
+
+
+_IDENTITY = bytes(range(256))
+
+ArrowStrings = Union[pa.StringArray, pa.LargeStringArray, pa.ChunkedArray]
+
+
+def _buffers(array: pa.Array) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Zero-copy (offsets, data, is_null) views of a (large) string array."""
+    if pa.types.is_string(array.type):
+        offset_type = np.int32
+    elif pa.types.is_large_string(array.type):
+        offset_type = np.int64
+    else:
+        raise TypeError(f"Expected a string or large_string array, got {array.type}")
+
+    _, offsets_buf, data_buf = array.buffers()
+    n = len(array)
+    offsets = np.frombuffer(offsets_buf, dtype=offset_type)[array.offset : array.offset + n + 1]
+    data = np.frombuffer(data_buf, dtype=np.uint8) if data_buf is not None else np.zeros(0, dtype=np.uint8)
+    is_null = array.is_null().to_numpy(zero_copy_only=False)
+    return offsets.astype(np.int64, copy=False), data, is_null
+
+
+def _kernel_matrix(array: pa.Array, country_code: str) -> tuple[np.ndarray, np.ndarray]:
+    width = KERNELS[country_code].width
+    offsets, data, is_null = _buffers(array)
+    starts = offsets[:-1]
+    lengths = offsets[1:] - starts
+    n = len(starts)
+
+    fits = (lengths == width) & ~is_null
+    matrix = np.zeros((n, width), dtype=np.uint8)
+    if n and fits.all():
+        # Densely packed column: the data buffer already is the matrix.
+        matrix = data[starts[0] : starts[0] + n * width].reshape(n, width)
+    elif fits.any():
+        matrix[fits] = data[starts[fits, None] + np.arange(width)]
+
+    normalizer = _default_pool.get(country_code).normalizer  # type: ignore[attr-defined]
+    if fits.any():
+        # Rows of the exact width get the normalizer's byte table (e.g. upper-casing); rows holding
+        # a byte it would delete or strip, or a non-ASCII byte, are normalized one by one below.
+        special = np.zeros(256, dtype=bool)
+        special[list(normalizer._delete + _ASCII_WHITESPACE_BYTES)] = True
+        special[128:] = True
+        dirty = fits & special[matrix].any(axis=1)
+        fits &= ~dirty
+        if normalizer._table != _IDENTITY:
+            matrix = np.frombuffer(normalizer._table, dtype=np.uint8)[matrix]
+    else:
+        dirty = np.zeros(n, dtype=bool)
+
+    # Rows longer than the width may contain separators that normalization removes.
+    longer = np.flatnonzero(((lengths > width) | dirty) & ~is_null)
+    if len(longer):
+        normalized = [normalizer.apply(array[int(i)].as_py()) for i in longer]
+        if not matrix.flags.writeable:
+            matrix = matrix.copy()
+        sub_matrix, sub_fits = encode_fixed_width(normalized, width)
+        matrix[longer] = sub_matrix
+        fits[longer] = sub_fits
+    return matrix, fits
+
+
+def _parse_chunk(country_code: str, array: pa.Array) -> BatchResult:
+    k = KERNELS.get(country_code)
+    if k is not None and len(k.widths) == 1:
+        matrix, fits = _kernel_matrix(array, country_code)
+        return kernel_batch(country_code, matrix, fits)
+    values = ["" if v is None else v for v in array.to_pylist()]
+    return parse_batch(country_code, values)
+
+
+def _column_to_arrow(result: BatchResult, name: str) -> pa.Array:
+    col = result.columns[name]
+    if name in result.categories:
+        return pa.DictionaryArray.from_arrays(
+            pa.array(col, mask=col < 0),
+            pa.array(list(result.categories[name]), type=pa.string()),
+        )
+    if col.dtype.kind == "M":
+        return pa.array(col.astype(np.int64).astype(np.int32), type=pa.date32(), mask=np.isnat(col))
+    if col.ndim == 2:
+        missing = (col < 0).any(axis=1)
+        return pa.FixedSizeListArray.from_arrays(pa.array(col.ravel()), col.shape[1], mask=pa.array(missing))
+    if col.dtype.kind == "b":
+        return pa.array(col, type=pa.bool_(), mask=~result.valid)
+    if col.dtype.kind in "iu":
+        return pa.array(col, mask=col < 0)
+    if col.dtype.kind == "U":
+        return pa.array(col, type=pa.string(), mask=col == "")
+    return pa.array(list(col), from_pandas=True)
+
+
+def to_record_batch(result: BatchResult) -> pa.RecordBatch:
+    """Convert a ``BatchResult`` to an Arrow record batch (``valid`` first)."""
+    names = ["valid"]
+    arrays = [pa.array(result.valid, type=pa.bool_())]
+    for name in ("id_type", "dob", "gender"):
+        if name in result.columns:
+            names.append(name)
+            arrays.append(_column_to_arrow(result, name))
+    for name in result.columns:
+        if name not in names:
+            names.append(name)
+            arrays.append(_column_to_arrow(result, name))
+    return pa.RecordBatch.from_arrays(arrays, names=names)
+
+
+def parse_arrow(country_code: str, array: ArrowStrings) -> pa.Table:
+    """Validate and decode an Arrow string column; one output row per input row.
+
+    Null inputs are reported as invalid.
+
+    Raises:
+        ValueError: If no validator is registered for ``country_code``.
+    """
+    chunks = array.chunks if isinstance(array, pa.ChunkedArray) else [array]
+    if not chunks:
+        chunks = [pa.array([], type=pa.string())]
+    tables = [pa.Table.from_batches([to_record_batch(_parse_chunk(country_code, chunk))]) for chunk in chunks]
+    # Fallback columns are type-inferred per chunk; an all-null chunk must not fix the type.
+    return pa.concat_tables(tables, promote_options="default")
+
+
+def validate_arrow(country_code: str, array: ArrowStrings) -> pa.Array | pa.ChunkedArray:
+    """Boolean validity mask for an Arrow string column (chunked input gives chunked output)."""
+    if isinstance(array, pa.ChunkedArray):
+        return pa.chunked_array(
+            [pa.array(_parse_chunk(country_code, c).valid, type=pa.bool_()) for c in array.chunks], type=pa.bool_()
+        )
+    return pa.array(_parse_chunk(country_code, array).valid, type=pa.bool_())
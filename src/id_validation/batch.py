@@ -0,0 +1,445 @@
+"""Columnar batch validation and parsing.
+
+``parse_batch(country_code, ids)`` normalizes a sequence of IDs with the country's
+validator and returns a ``BatchResult`` of NumPy columns. Countries with a
+vectorized kernel in ``id_validation.validators.kernels`` are decoded in one pass
+over an ``(n, width)`` byte matrix (one pass per length for formats with several
+lengths); other countries fall back to the scalar ``parse`` applied once per
+distinct ID.
+
+``parse_mixed(ids, countries)`` handles a column of IDs from several countries. It
+groups the rows by country, runs ``parse_batch`` once per group and scatters the
+results back into input order. Rows whose country is missing or unknown are
+reported, not raised.
+
+This module requires NumPy (``pip install id-validation[batch]``).
+"""
+
+from __future__ import annotations
+
+import datetime as _dt
+from dataclasses import dataclass, field
+from typing import Any, Sequence
+
+import numpy as np
+
+from .blocklist import Blocklist
+from .normalize import IDInput
+from .pool import ValidatorPool
+from .registry import VALIDATORS
+from .validate import ValidationError
+from .validators.base import BaseValidator, ParsedID
+from .validators.kernels import GENDERS, KERNELS, Kernel, KernelResult, za_interpretations
+
+
+# Columns that map onto ParsedID attributes rather than ``extra``.
+STANDARD_COLUMNS = ("id_type", "dob", "gender")
+
+_default_pool = ValidatorPool()
+
+
+@dataclass
+class BatchResult:
+    """Parse results for a batch of IDs from one country, stored column-wise.
+
+    ``columns`` follow the conventions of ``id_validation.validators.kernels``;
+    values in rows where ``valid`` is False are missing.
+    """
+
+    country_code: str
+    id_numbers: np.ndarray | None
+    valid: np.ndarray
+    columns: dict[str, np.ndarray] = field(default_factory=dict)
+    categories: dict[str, tuple[str, ...]] = field(default_factory=dict)
+    optional: frozenset[str] = frozenset()
+    # Scalar results kept by the fallback path so to_parsed() is exact.
+    rows: list[ParsedID | None] | None = None
+
+    def __len__(self) -> int:
+        return len(self.valid)
+
+    def value(self, name: str, i: int) -> Any:
+        """Decoded value of column ``name`` at row ``i`` (``None`` when missing)."""
+        col = self.columns[name]
+        v = col[i]
+        if col.ndim == 2:
+            return None if (v < 0).any() else tuple(int(x) for x in v)
+        if col.dtype.kind == "b":
+            return bool(v)
+        if name in self.categories:
+            return None if v < 0 else self.categories[name][v]
+        if col.dtype.kind == "M":
+            return None if np.isnat(v) else v.astype(_dt.date)
+        if col.dtype.kind in "iu":
+            return None if v < 0 else int(v)
+        if col.dtype.kind == "U":
+            return str(v) if v else None
+        return v
+
+    def to_parsed(self, i: int) -> ParsedID | None:
+        """Rebuild the ``ParsedID`` for row ``i`` (``None`` if the row is invalid)."""
+        if self.rows is not None:
+            return self.rows[i]
+        if not self.valid[i]:
+            return None
+        if self.id_numbers is None:
+            raise ValueError("BatchResult was built without id_numbers")
+        extra: dict[str, Any] = {}
+        for name in self.columns:
+            if name in STANDARD_COLUMNS:
+                continue
+            v = self.value(name, i)
+            if v is None and name in self.optional:
+                continue
+            extra[name] = v
+        return ParsedID(
+            country_code=self.country_code,
+            id_number=str(self.id_numbers[i]),
+            id_type=self.value("id_type", i) if "id_type" in self.columns else None,
+            dob=self.value("dob", i) if "dob" in self.columns else None,
+            gender=self.value("gender", i) if "gender" in self.columns else None,
+            extra=extra or None,
+        )
+
+
+def encode_fixed_width(ids: Sequence[str], width: int) -> tuple[np.ndarray, np.ndarray]:
+    """Pack strings of length ``width`` into an ``(n, width)`` uint8 matrix.
+
+    Returns ``(matrix, fits)``; rows whose length differs from ``width`` are zero-filled
+    and flagged False in ``fits``. Non-ASCII characters become ``?`` so they can never
+    match a digit.
+    """
+    n = len(ids)
+    lengths = np.fromiter((len(v) for v in ids), dtype=np.int64, count=n)
+    fits = lengths == width
+    matrix = np.zeros((n, width), dtype=np.uint8)
+    if fits.any():
+        selected = [v for v, f in zip(ids, fits) if f] if not fits.all() else list(ids)
+        buf = "".join(selected).encode("ascii", errors="replace")
+        matrix[fits] = np.frombuffer(buf, dtype=np.uint8).reshape(-1, width)
+    return matrix, fits
+
+
+def _blank(col: np.ndarray, rows: np.ndarray) -> None:
+    """Set ``col[rows]`` to the column's missing value, in place."""
+    if col.dtype.kind == "M":
+        col[rows] = np.datetime64("NaT")
+    elif col.dtype.kind in "iu":
+        col[rows] = -1
+    elif col.dtype.kind == "U":
+        col[rows] = ""
+    elif col.dtype.kind == "O":
+        col[rows] = None
+
+
+def _mask_invalid(result: KernelResult, valid: np.ndarray) -> dict[str, np.ndarray]:
+    invalid = ~valid
+    columns = {}
+    for name, col in result.columns.items():
+        col = col.copy()
+        _blank(col, invalid)
+        columns[name] = col
+    return columns
+
+
+def kernel_batch(
+    country_code: str,
+    matrix: np.ndarray,
+    fits: np.ndarray,
+    id_numbers: Sequence[str] | None = None,
+) -> BatchResult:
+    """Run the country's kernel over an already-encoded ``(n, width)`` byte matrix.
+
+    Rows flagged False in ``fits`` are reported invalid. ``id_numbers`` is only
+    needed for ``BatchResult.to_parsed``.
+    """
+    return _from_kernel_result(country_code, KERNELS[country_code].func(matrix), fits, id_numbers)
+
+
+def _from_kernel_result(
+    country_code: str,
+    result: KernelResult,
+    fits: np.ndarray,
+    id_numbers: Sequence[str] | None,
+) -> BatchResult:
+    k = KERNELS[country_code]
+    valid = result.valid & fits
+    columns = _mask_invalid(result, valid)
+    categories = dict(result.categories)
+    if "id_type" not in columns and k.id_type is not None:
+        columns["id_type"] = np.where(valid, 0, -1).astype(np.int8)
+        categories["id_type"] = (k.id_type,)
+    return BatchResult(
+        country_code=country_code,
+        id_numbers=None if id_numbers is None else np.asarray(id_numbers, dtype=object),
+        valid=valid,
+        columns=columns,
+        categories=categories,
+        optional=result.optional,
+    )
+
+
+def _missing(template: np.ndarray, n: int) -> np.ndarray:
+    """An ``n``-row column shaped like ``template`` holding only missing values."""
+    shape = (n,) + template.shape[1:]
+    kind = template.dtype.kind
+    if kind == "M":
+        return np.full(shape, np.datetime64("NaT"), dtype=template.dtype)
+    if kind in "iu":
+        return np.full(shape, -1, dtype=template.dtype)
+    if kind == "U":
+        return np.full(shape, "", dtype=template.dtype)
+    if kind == "b":
+        return np.zeros(shape, dtype=bool)
+    return np.full(shape, None, dtype=object)
+
+
+def _bucketed(k: Kernel, normalized: list[str]) -> KernelResult:
+    """Run a multi-width kernel once per width over the rows of that length."""
+    n = len(normalized)
+    lengths = np.fromiter((len(v) for v in normalized), dtype=np.int64, count=n)
+    valid = np.zeros(n, dtype=bool)
+    columns: dict[str, np.ndarray] = {}
+    categories: dict[str, tuple[str, ...]] = {}
+    optional: frozenset[str] = frozenset()
+    for width in k.widths:
+        rows = np.flatnonzero(lengths == width)
+        matrix, _ = encode_fixed_width([normalized[i] for i in rows], width)
+        part = k.func(matrix)
+        valid[rows] = part.valid
+        for name, col in part.columns.items():
+            if name not in columns:
+                columns[name] = _missing(col, n)
+            elif col.dtype.kind == "U" and col.dtype.itemsize > columns[name].dtype.itemsize:
+                columns[name] = columns[name].astype(col.dtype)
+            columns[name][rows] = col
+        categories.update(part.categories)
+        optional |= part.optional
+    return KernelResult(valid, columns, categories, optional)
+
+
+def _run_scalar(country_code: str, validator: BaseValidator, normalized: list[str]) -> BatchResult:
+    cache: dict[str, ParsedID | None] = {}
+    rows: list[ParsedID | None] = []
+    for v in normalized:
+        if v not in cache:
+            try:
+                cache[v] = validator.parse(v)
+            except ValidationError:
+                cache[v] = None
+        rows.append(cache[v])
+
+    n = len(rows)
+    valid = np.fromiter((p is not None for p in rows), dtype=bool, count=n)
+    dob = np.array([p.dob if p is not None and p.dob is not None else None for p in rows], dtype="datetime64[D]")
+    gender = np.array(
+        [GENDERS.index(p.gender) if p is not None and p.gender in GENDERS else -1 for p in rows], dtype=np.int8
+    )
+    id_types = tuple(dict.fromkeys(p.id_type for p in rows if p is not None and p.id_type is not None))
+    id_type = np.array(
+        [id_types.index(p.id_type) if p is not None and p.id_type is not None else -1 for p in rows], dtype=np.int8
+    )
+    columns: dict[str, np.ndarray] = {"id_type": id_type, "dob": dob, "gender": gender}
+    names = dict.fromkeys(k for p in rows if p is not None and p.extra for k in p.extra)
+    for name in names:
+        col = np.empty(n, dtype=object)
+        col[:] = [p.extra.get(name) if p is not None and p.extra else None for p in rows]
+        columns[name] = col
+    return BatchResult(
+        country_code=country_code,
+        id_numbers=np.asarray(normalized, dtype=object),
+        valid=valid,
+        columns=columns,
+        categories={"id_type": id_types, "gender": GENDERS},
+        rows=rows,
+    )
+
+
+def parse_batch(
+    country_code: str,
+    ids: Sequence[IDInput],
+    *,
+    pool: ValidatorPool | None = None,
+    blocklist: Blocklist | None = None,
+) -> BatchResult:
+    """Validate and decode ``ids`` for one country.
+
+    Rows found in ``blocklist`` (see ``id_validation.blocklist``) are reported invalid.
+
+    Raises:
+        ValueError: If no validator is registered for ``country_code``.
+    """
+    validator = (pool or _default_pool).get(country_code)
+    normalized = validator.normalize_many(ids)  # type: ignore[attr-defined]
+    result = _parse_normalized(country_code, validator, normalized)  # type: ignore[arg-type]
+    if blocklist is not None:
+        _drop_blocked(result, normalized, blocklist)
+    return result
+
+
+def _parse_normalized(
+    country_code: str, validator: BaseValidator, normalized: list[str], *, keep_ids: bool = True
+) -> BatchResult:
+    """``parse_batch`` after normalization; ``keep_ids=False`` leaves ``id_numbers`` unset."""
+    k = KERNELS.get(country_code)
+    id_numbers = normalized if keep_ids else None
+    if k is not None and len(k.widths) > 1:
+        return _from_kernel_result(country_code, _bucketed(k, normalized), np.ones(len(normalized), bool), id_numbers)
+    if k is not None:
+        matrix, fits = encode_fixed_width(normalized, k.width)
+        return kernel_batch(country_code, matrix, fits, id_numbers)
+    result = _run_scalar(country_code, validator, normalized)
+    if not keep_ids:
+        result.id_numbers, result.rows = None, None
+    return result
+
+
+def _drop_blocked(result: BatchResult, normalized: Sequence[str], blocklist: Blocklist) -> None:
+    blocked = np.fromiter(blocklist.contains_many(normalized), dtype=bool, count=len(normalized))
+    if not blocked.any():
+        return
+    result.valid &= ~blocked
+    # Blocked rows must not leak decoded fields (dob, gender, region) into downstream outputs.
+    for col in result.columns.values():
+        _blank(col, blocked)
+    if result.rows is not None:
+        for i in np.flatnonzero(blocked).tolist():
+            result.rows[i] = None
+
+
+def validate_batch(
+    country_code: str,
+    ids: Sequence[IDInput],
+    *,
+    pool: ValidatorPool | None = None,
+    blocklist: Blocklist | None = None,
+) -> np.ndarray:
+    """Boolean validity mask for ``ids``."""
+    return parse_batch(country_code, ids, pool=pool, blocklist=blocklist).valid
+
+
+def parse_south_africa_batch(ids: Sequence[IDInput]) -> dict[str, BatchResult]:
+    """Decode ``ids`` as both ZA and ZA_OLD in a single pass.
+
+    Returns ``{"ZA": ..., "ZA_OLD": ...}``; the Luhn check and date decoding are
+    shared, so this costs little more than one ``parse_batch`` call. A row may be
+    valid under either, both or neither interpretation.
+    """
+    normalized = _default_pool.get("ZA").normalize_many(ids)  # type: ignore[attr-defined]
+    matrix, fits = encode_fixed_width(normalized, 13)
+    za, za_old = za_interpretations(matrix)
+    return {
+        "ZA": _from_kernel_result("ZA", za, fits, normalized),
+        "ZA_OLD": _from_kernel_result("ZA_OLD", za_old, fits, normalized),
+    }
+
+
+def group_rows(countries: Sequence[Any]) -> list[tuple[str | None, np.ndarray]]:
+    """Group row positions by country code: one bucket pass plus a stable argsort.
+
+    Returns ``(country_code, positions)`` pairs in order of first appearance,
+    with positions ascending within each group. Rows whose country is missing
+    (not a string) or has no registered validator are collected last under
+    ``None``.
+    """
+    keys: dict[str | None, int] = {}
+    n = len(countries)
+    bucket = np.fromiter(
+        (keys.setdefault(c if isinstance(c, str) else None, len(keys)) for c in countries), dtype=np.int64, count=n
+    )
+    order = np.argsort(bucket, kind="stable")
+    counts = np.bincount(bucket, minlength=len(keys))
+    groups: list[tuple[str | None, np.ndarray]] = []
+    unknown = []
+    start = 0
+    for code, count in zip(keys, counts.tolist()):
+        positions = order[start : start + count]
+        start += count
+        if code in VALIDATORS:
+            groups.append((code, positions))
+        else:
+            unknown.append(positions)
+    if unknown:
+        groups.append((None, np.sort(np.concatenate(unknown))))
+    return groups
+
+
+@dataclass
+class MixedBatchResult:
+    """Parse results for IDs from several countries, in input order.
+
+    ``known`` is False for rows whose country is missing or has no validator;
+    those rows are also invalid. ``groups`` maps each known country to its row
+    positions and its ``BatchResult``.
+    """
+
+    countries: np.ndarray
+    valid: np.ndarray
+    known: np.ndarray
+    groups: dict[str, tuple[np.ndarray, BatchResult]] = field(default_factory=dict)
+    # Row -> position within its country's BatchResult (-1 for unknown countries).
+    _group_row: np.ndarray | None = field(default=None, repr=False)
+
+    def __len__(self) -> int:
+        return len(self.valid)
+
+    @property
+    def unknown_countries(self) -> list[Any]:
+        """Distinct country values that have no validator, in order of first appearance."""
+        return list(dict.fromkeys(self.countries[~self.known].tolist()))
+
+    def to_parsed(self, i: int) -> ParsedID | None:
+        """The ``ParsedID`` for row ``i`` (``None`` if invalid or the country is unknown)."""
+        if not self.known[i]:
+            return None
+        _, result = self.groups[self.countries[i]]
+        return result.to_parsed(int(self._group_row[i]))  # type: ignore[index]
+
+
+def parse_mixed(
+    ids: Sequence[IDInput],
+    countries: Sequence[Any],
+    *,
+    pool: ValidatorPool | None = None,
+) -> MixedBatchResult:
+    """Validate and decode ``ids[i]`` for ``countries[i]``, one batch pass per country.
+
+    Raises:
+        ValueError: If ``ids`` and ``countries`` differ in length.
+    """
+    n = len(ids)
+    if len(countries) != n:
+        raise ValueError(f"ids and countries differ in length ({n} != {len(countries)})")
+    values = np.empty(n, dtype=object)
+    values[:] = list(ids)
+    country_values = np.empty(n, dtype=object)
+    country_values[:] = list(countries)
+
+    valid = np.zeros(n, dtype=bool)
+    known = np.zeros(n, dtype=bool)
+    group_row = np.full(n, -1, dtype=np.int64)
+    groups: dict[str, tuple[np.ndarray, BatchResult]] = {}
+    for code, positions in group_rows(country_values):
+        if code is None:
+            continue
+        result = parse_batch(code, values[positions].tolist(), pool=pool)
+        valid[positions] = result.valid
+        known[positions] = True
+        group_row[positions] = np.arange(len(positions))
+        groups[code] = (positions, result)
+    return MixedBatchResult(country_values, valid, known, groups, group_row)
+
+
+def validate_mixed(
+    ids: Sequence[IDInput],
+    countries: Sequence[Any],
+    *,
+    pool: ValidatorPool | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """``(valid, known)`` masks for ``ids`` against per-row ``countries``.
+
+    ``known`` is False where the country is missing or has no validator; those
+    rows are never valid. Nothing is raised for unknown countries.
+    """
+    result = parse_mixed(ids, countries, pool=pool)
+    return result.valid, result.known
@@ -0,0 +1,158 @@
+"""Belfiore (codice catastale) table for decoding Italian codice fiscale places of birth.
+
+Positions 12-15 of a codice fiscale hold the Belfiore code of the comune of birth,
+or ``Z`` plus three digits for people born abroad. The packaged table,
+``data/belfiore.bin``, covers current and former comuni and countries. It is built
+from ANPR data by ``scripts/build_belfiore_table.py``.
+
+The file is memory-mapped on first lookup, so importing this module costs nothing.
+Codes are packed into 16-bit keys (``letter index * 1000 + number``). A lookup is a
+binary search over the sorted key array.
+
+File layout (little-endian)::
+
+    header     b"BELF", u16 version, u16 reserved, u32 count, u32 reserved
+    offsets    (count + 1) x u32   start of each name within the names section
+    keys       count x u16         packed codes, ascending
+    provinces  count x 2 bytes     ASCII province abbreviation ("EE" abroad)
+    flags      count x u8          bit 0: the comune/country still exists
+    names      UTF-8
+"""
+
+from __future__ import annotations
+
+import mmap
+import struct
+from bisect import bisect_left
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, Union
+
+
+MAGIC = b"BELF"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sHHII")
+_ACTIVE = 0x01
+
+DEFAULT_PATH = Path(__file__).parent / "data" / "belfiore.bin"
+
+
+@dataclass(frozen=True)
+class Municipality:
+    """A comune (or, for ``Z`` codes, a foreign country) identified by its Belfiore code."""
+
+    code: str
+    name: str
+    province: str
+    active: bool
+
+
+def pack_code(code: str) -> int:
+    """Pack a Belfiore code such as ``"H501"`` into its 16-bit key; -1 if malformed."""
+    if len(code) != 4 or not ("A" <= code[0] <= "Z") or not (code[1:].isascii() and code[1:].isdigit()):
+        return -1
+    return (ord(code[0]) - 65) * 1000 + int(code[1:])
+
+
+def unpack_code(key: int) -> str:
+    letter, number = divmod(key, 1000)
+    return f"{chr(65 + letter)}{number:03d}"
+
+
+def build_table(entries: Iterable[Municipality]) -> bytes:
+    """Serialize municipalities into the binary table format (one entry per code)."""
+    by_key: dict[int, Municipality] = {}
+    for entry in entries:
+        key = pack_code(entry.code)
+        if key < 0:
+            raise ValueError(f"Invalid Belfiore code: {entry.code!r}")
+        if key in by_key:
+            raise ValueError(f"Duplicate Belfiore code: {entry.code!r}")
+        by_key[key] = entry
+
+    keys = sorted(by_key)
+    names = [by_key[k].name.encode("utf-8") for k in keys]
+    offsets = [0]
+    for name in names:
+        offsets.append(offsets[-1] + len(name))
+
+    count = len(keys)
+    parts = [
+        _HEADER.pack(MAGIC, VERSION, 0, count, 0),
+        struct.pack(f"<{count + 1}I", *offsets),
+        struct.pack(f"<{count}H", *keys),
+        b"".join(by_key[k].province.encode("ascii").ljust(2)[:2] for k in keys),
+        bytes(_ACTIVE if by_key[k].active else 0 for k in keys),
+        *names,
+    ]
+    return b"".join(parts)
+
+
+class BelfioreTable:
+    """Read-only view over a serialized Belfiore table (``bytes`` or an ``mmap``)."""
+
+    def __init__(self, buffer: Union[bytes, mmap.mmap]) -> None:
+        magic, version, _, count, _ = _HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Not a Belfiore table (or unsupported version)")
+
+        self._buffer = buffer
+        view = memoryview(buffer)
+        pos = _HEADER.size
+        self._offsets = view[pos : pos + 4 * (count + 1)].cast("I")
+        pos += 4 * (count + 1)
+        self.keys = view[pos : pos + 2 * count].cast("H")
+        pos += 2 * count
+        self._provinces = view[pos : pos + 2 * count]
+        pos += 2 * count
+        self._flags = view[pos : pos + count]
+        self._names = view[pos + count :]
+
+    @classmethod
+    def from_path(cls, path: Union[str, Path]) -> BelfioreTable:
+        with open(path, "rb") as f:
+            return cls(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __contains__(self, code: str) -> bool:
+        return self.index(code) >= 0
+
+    def index(self, code: str) -> int:
+        """Position of ``code`` in the table, or -1 if it is not a known code."""
+        key = pack_code(code)
+        i = bisect_left(self.keys, key)
+        return i if key >= 0 and i < len(self.keys) and self.keys[i] == key else -1
+
+    def name(self, i: int) -> str:
+        return bytes(self._names[self._offsets[i] : self._offsets[i + 1]]).decode("utf-8")
+
+    def province(self, i: int) -> str:
+        return bytes(self._provinces[2 * i : 2 * i + 2]).decode("ascii")
+
+    def entry(self, i: int) -> Municipality:
+        return Municipality(
+            code=unpack_code(self.keys[i]),
+            name=self.name(i),
+            province=self.province(i),
+            active=bool(self._flags[i] & _ACTIVE),
+        )
+
+    def lookup(self, code: str) -> Municipality | None:
+        """Decode ``code`` (e.g. ``"H501"``); ``None`` if no such comune or country exists."""
+        i = self.index(code)
+        return self.entry(i) if i >= 0 else None
+
+
+@lru_cache(maxsize=None)
+def default_table() -> BelfioreTable:
+    """The packaged table, memory-mapped on first use."""
+    return BelfioreTable.from_path(DEFAULT_PATH)
+
+
+def lookup(code: str) -> Municipality | None:
+    """Decode a Belfiore code with the packaged table."""
+    return default_table().lookup(code)
@@ -0,0 +1,196 @@
+"""Compact blocklists (fraud, deceased, ...) checked on the validation hot path.
+
+A blocklist is built offline from a list of IDs into one file, which is then
+memory-mapped. The file has two parts:
+
+- A Bloom filter, about 10 bits (1.2 bytes) per entry with a false-positive rate
+  near 1%. It answers "definitely not blocked" for almost every ID.
+- An exact table: the sorted, fixed-width normalized IDs, binary-searched only
+  when the Bloom filter reports a hit. Its pages are read from disk only when
+  needed.
+
+``BlocklistedValidator`` attaches a blocklist to any validator. It probes right
+after ``normalize()`` and before the validator's checksum and date work, and
+rejects blocked IDs with ``BlockedIDError`` (a ``ValidationError``).
+
+File layout (little-endian)::
+
+    header   b"IDBL", u16 version, u16 hash count, u32 record width, u32 reserved,
+             u64 entry count, u64 filter bits, 16-byte hash salt
+    filter   (filter bits / 8) bytes
+    records  entry count x record width bytes, UTF-8, NUL-padded, ascending
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Iterable, Sequence, Union
+
+from .normalize import IDInput, Normalizer
+from .validate import ValidationError
+from .validators.base import BaseValidator, ParsedID
+
+
+MAGIC = b"IDBL"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sHHIIQQ16s")
+_MASK64 = (1 << 64) - 1
+
+
+class BlockedIDError(ValidationError):
+    """The ID is well-formed or not, but it is on a blocklist."""
+
+
+def _hashes(key: bytes, salt: bytes) -> tuple[int, int]:
+    digest = int.from_bytes(hashlib.blake2b(key, digest_size=16, salt=salt).digest(), "little")
+    # Double hashing (h1 + i * h2); an odd h2 visits distinct positions for power-of-two sizes too.
+    return digest & _MASK64, (digest >> 64) | 1
+
+
+def build_blocklist(
+    ids: Iterable[str],
+    path: Union[str, Path, None] = None,
+    *,
+    normalizer: Normalizer | None = None,
+    bits_per_entry: int = 10,
+) -> bytes:
+    """Serialize ``ids`` into the blocklist file format, writing it to ``path`` if given.
+
+    IDs are normalized with ``normalizer`` (use the validator's, e.g.
+    ``ValidatorFactory.get_validator("ZA").normalizer``) so lookups match whatever
+    formatting the input had.
+    """
+    normalize = normalizer.apply if normalizer is not None else str.strip
+    records = sorted({normalize(v).encode("utf-8") for v in ids} - {b""})
+    count = len(records)
+    width = max(map(len, records), default=1)
+    bits = max(64, -(-count * bits_per_entry // 64) * 64)
+    k = max(1, round(bits / max(count, 1) * math.log(2))) if count else 1
+    k = min(k, 16)
+    salt = os.urandom(16)
+
+    filter_bytes = bytearray(bits // 8)
+    for key in records:
+        h1, h2 = _hashes(key, salt)
+        for i in range(k):
+            bit = (h1 + i * h2) % bits
+            filter_bytes[bit >> 3] |= 1 << (bit & 7)
+
+    data = b"".join(
+        [
+            _HEADER.pack(MAGIC, VERSION, k, width, 0, count, bits, salt),
+            bytes(filter_bytes),
+            b"".join(key.ljust(width, b"\0") for key in records),
+        ]
+    )
+    if path is not None:
+        Path(path).write_bytes(data)
+    return data
+
+
+class Blocklist:
+    """Read-only blocklist over a serialized file (``bytes`` or an ``mmap``).
+
+    Membership takes normalized IDs (``str`` or UTF-8 bytes).
+    """
+
+    def __init__(self, buffer: Union[bytes, mmap.mmap]) -> None:
+        magic, version, k, width, _, count, bits, salt = _HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Not a blocklist file (or unsupported version)")
+        self._buffer = buffer
+        view = memoryview(buffer)
+        start = _HEADER.size
+        self._filter = view[start : start + bits // 8]
+        # Records are compared as bytes slices of the buffer itself (bytes and mmap both slice to bytes).
+        self._records_start = start + bits // 8
+        self._k, self._width, self._count, self._bits, self._salt = k, width, count, bits, salt
+
+    @classmethod
+    def from_path(cls, path: Union[str, Path]) -> Blocklist:
+        with open(path, "rb") as f:
+            return cls(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    @classmethod
+    def from_ids(cls, ids: Iterable[str], *, normalizer: Normalizer | None = None, bits_per_entry: int = 10) -> Blocklist:
+        """Build an in-memory blocklist (mainly for tests and small lists)."""
+        return cls(build_blocklist(ids, normalizer=normalizer, bits_per_entry=bits_per_entry))
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the in-memory probe structure (the Bloom filter)."""
+        return len(self._filter)
+
+    def might_contain(self, v: str | bytes) -> bool:
+        """Bloom filter probe: False means definitely not blocked."""
+        key = v.encode("utf-8") if isinstance(v, str) else v
+        h1, h2 = _hashes(key, self._salt)
+        bits, bloom = self._bits, self._filter
+        for i in range(self._k):
+            bit = (h1 + i * h2) % bits
+            if not bloom[bit >> 3] & (1 << (bit & 7)):
+                return False
+        return True
+
+    def _exact(self, key: bytes) -> bool:
+        width = self._width
+        if len(key) > width:
+            return False
+        key = key.ljust(width, b"\0")
+        buffer, start = self._buffer, self._records_start
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            offset = start + mid * width
+            if buffer[offset : offset + width] < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        offset = start + lo * width
+        return lo < self._count and buffer[offset : offset + width] == key
+
+    def __contains__(self, v: object) -> bool:
+        if not isinstance(v, (str, bytes)):
+            return False
+        key = v.encode("utf-8") if isinstance(v, str) else v
+        return self.might_contain(key) and self._exact(key)
+
+    def contains_many(self, normalized: Sequence[str]) -> list[bool]:
+        return [v in self for v in normalized]
+
+
+class BlocklistedValidator(BaseValidator):
+    """Wraps a validator so that blocklisted IDs fail validation.
+
+    The blocklist is probed right after normalization, before any of the wrapped
+    validator's checksum or date work.
+    """
+
+    def __init__(self, validator: BaseValidator, blocklist: Blocklist) -> None:
+        self.validator = validator
+        self.blocklist = blocklist
+        self.country_code = validator.country_code
+        self.normalizer = validator.normalizer
+        self.checksum_spec = validator.checksum_spec
+        self.short_lengths = validator.short_lengths
+        self.max_length = validator.max_length
+        self.shape = validator.shape
+        self.date_field = validator.date_field
+
+    def normalize(self, id_number: IDInput) -> str:
+        return self.validator.normalize(id_number)
+
+    def parse(self, id_number: IDInput) -> ParsedID:
+        v = self.validator.normalize(id_number)
+        if v in self.blocklist:
+            raise BlockedIDError("ID number is blocklisted")
+        return self.validator.parse(v)
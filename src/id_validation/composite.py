@@ -0,0 +1,65 @@
+"""Validators for countries that issue several document types.
+
+Each document type registers itself with ``registry.register_document``, giving
+a ``Signature`` (possible lengths and first characters). ``CompositeValidator``
+turns the signatures into a table keyed by ``(length, first character)``. An ID
+is then routed with one dict lookup to the single document type that can match
+it, instead of trying each type's parser in turn.
+
+Spain (DNI, NIE, CIF) is the only composite country so far. Other countries
+are deliberately left as single-type validators:
+
+- ``AR``: CUIT and CUIL share one 11-digit format and checksum. The validator
+  parses once and derives the type from the prefix, with no trial parsing.
+- ``BR`` (CPF), ``CO`` (NIT) and ``EC`` (cédula): only one document type is
+  implemented. CNPJ, the Colombian cédula and the Ecuadorian RUC would be new
+  document types, and the batch kernels for these countries assume a single
+  fixed-width type, so adding them also means routing the batch path.
+"""
+
+from __future__ import annotations
+
+from .normalize import IDInput
+from .registry import document_types
+from .validate import ValidationError
+from .validators.base import BaseValidator, ParsedID
+
+
+class CompositeValidator(BaseValidator):
+    """Routes each ID to the registered document type whose signature it matches.
+
+    Subclasses set ``country_code`` and ``normalizer`` and are registered with
+    ``@register`` as usual; the document types are looked up from the registry
+    when the validator is created.
+    """
+
+    def __init__(self) -> None:
+        self.document_validators: dict[str, BaseValidator] = {}
+        self._routes: dict[tuple[int, str], tuple[BaseValidator, ...]] = {}
+        for doc in document_types(self.country_code):
+            validator = doc.validator()
+            self.document_validators[doc.id_type] = validator  # type: ignore[assignment]
+            for key in doc.signature.keys():
+                self._routes[key] = self._routes.get(key, ()) + (validator,)  # type: ignore[operator]
+
+    def route(self, id_number: IDInput) -> list[str]:
+        """Document types whose signature matches ``id_number`` (usually one, or none)."""
+        v = self.normalize(id_number)
+        candidates = self._routes.get((len(v), v[:1]), ())
+        return [name for name, validator in self.document_validators.items() if validator in candidates]
+
+    def parse(self, id_number: IDInput) -> ParsedID:
+        v = self.normalize(id_number)
+        candidates = self._routes.get((len(v), v[:1]))
+        if candidates is None:
+            raise ValidationError(f"Invalid {'/'.join(self.document_validators)} format")
+        if len(candidates) == 1:
+            return candidates[0].parse(v)
+        # Overlapping signatures: the first type that accepts the ID wins.
+        error: ValidationError | None = None
+        for validator in candidates:
+            try:
+                return validator.parse(v)
+            except ValidationError as e:
+                error = error or e
+        raise error  # type: ignore[misc]
@@ -0,0 +1,162 @@
+"""Dates of birth encoded at fixed digit positions.
+
+A ``DateField`` declares where the year, month and day digits of an ID sit and
+how the century is found. ``id_validation.layout`` uses it to parse and generate
+IDs. As-you-type validation uses ``DatePrefix`` to tell, after each digit,
+whether the digits typed so far can still complete to a real date.
+"""
+
+from __future__ import annotations
+
+import calendar
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Mapping, Sequence, Union
+
+
+@dataclass(frozen=True)
+class CenturyFromDigit:
+    """The digit at ``position`` selects the century (Estonia: 3 or 4 means the 1900s)."""
+
+    position: int
+    centuries: Mapping[int, int]
+
+    def digits_for(self, century: int) -> list[int]:
+        return sorted(digit for digit, c in self.centuries.items() if c == century)
+
+    def supported(self) -> list[int]:
+        return sorted(set(self.centuries.values()))
+
+
+@dataclass(frozen=True)
+class CenturyFromMonth:
+    """The century is an offset added to the month (PESEL: month + 20 means the 2000s)."""
+
+    offsets: Mapping[int, int]
+
+    def offset_for(self, century: int) -> int | None:
+        return next((offset for offset, c in self.offsets.items() if c == century), None)
+
+    def supported(self) -> list[int]:
+        return sorted(set(self.offsets.values()))
+
+
+@dataclass(frozen=True)
+class CenturyGuessed:
+    """The century is not encoded; the validator picks one of ``centuries`` (South Africa: by a pivot year).
+
+    With a three-digit year these are millennia (Slovenia: 1000 or 2000).
+    """
+
+    centuries: tuple[int, ...]
+
+    def supported(self) -> list[int]:
+        return sorted(self.centuries)
+
+
+CenturyRule = Union[CenturyFromDigit, CenturyFromMonth, CenturyGuessed]
+
+
+@dataclass(frozen=True)
+class DateField:
+    """Date of birth at fixed ``(start, stop)`` spans, with a two- or three-digit year and a century rule.
+
+    ``month_offsets`` are added to the month for reasons other than the century
+    (Czech rodné číslo: +50 for women, +20 for a second series).
+    """
+
+    year: tuple[int, int]
+    month: tuple[int, int]
+    day: tuple[int, int]
+    century: CenturyRule
+    month_offsets: tuple[int, ...] = (0,)
+
+
+# Days per month, February in a common year.
+_MONTH_DAYS = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+class DatePrefix:
+    """Whether a partly typed ID can still complete to a valid date of birth.
+
+    ``positions`` are the date digit positions (and the century digit, if any)
+    in ID order. The state of a partly typed ID is the tuple of digits typed at
+    those positions, so at most eight digits. The values each span can take,
+    for every typed prefix of the span, are computed once here; ``feasible``
+    costs the same however long the ID is.
+    """
+
+    def __init__(self, date: DateField) -> None:
+        rule = date.century
+        spans = [date.year, date.month, date.day]
+        if isinstance(rule, CenturyFromDigit):
+            spans.append((rule.position, rule.position + 1))
+        self.positions = tuple(sorted({i for start, stop in spans for i in range(start, stop)}))
+        index = {position: i for i, position in enumerate(self.positions)}
+        self._year, self._month, self._day = (
+            _SpanValues(tuple(index[i] for i in range(start, stop))) for start, stop in spans[:3]
+        )
+        self._digit: tuple[int, dict[int, tuple[int, ...]], tuple[int, ...]] | None = None
+        if isinstance(rule, CenturyFromDigit):
+            by_digit = {digit: (century,) for digit, century in rule.centuries.items()}
+            self._digit = (index[rule.position], by_digit, tuple(rule.supported()))
+
+        # (real month, centuries) for each raw month value; () means "from the century digit".
+        months: dict[int, list[tuple[int, tuple[int, ...]]]] = {}
+        if isinstance(rule, CenturyFromMonth):
+            offsets = [(offset, (century,)) for offset, century in rule.offsets.items()]
+        else:
+            centuries = tuple(rule.centuries) if isinstance(rule, CenturyGuessed) else ()
+            offsets = [(offset, centuries) for offset in date.month_offsets]
+        for offset, centuries in offsets:
+            for month in range(1, 13):
+                months.setdefault(offset + month, []).append((month, centuries))
+        self._months = months
+
+    def feasible(self, typed: Sequence[int]) -> bool:
+        """Whether some completion of ``typed`` (digits at ``positions[:len(typed)]``) is a valid date."""
+        centuries: tuple[int, ...] = ()
+        if self._digit is not None:
+            i, by_digit, supported = self._digit
+            if i < len(typed):
+                if typed[i] not in by_digit:
+                    return False
+                centuries = by_digit[typed[i]]
+            else:
+                centuries = supported
+        days = [day for day in self._day.values(typed) if day >= 1]
+        if not days:
+            return False
+        years = self._year.values(typed)
+        for raw in self._month.values(typed):
+            for month, month_centuries in self._months.get(raw, ()):
+                for day in days:
+                    if day <= _MONTH_DAYS[month]:
+                        return True
+                    if month == 2 and day == 29:
+                        if any(calendar.isleap(c + y) for c in month_centuries or centuries for y in years):
+                            return True
+        return False
+
+
+class _SpanValues:
+    """The values of one digit span, by the digits typed so far at ``indices`` (into the typed tuple)."""
+
+    def __init__(self, indices: tuple[int, ...]) -> None:
+        self.indices = indices
+        self.table = _values_by_prefix(len(indices))
+
+    def values(self, typed: Sequence[int]) -> list[int]:
+        n = len(typed)
+        return self.table[tuple(typed[i] for i in self.indices if i < n)]
+
+
+@lru_cache(maxsize=None)
+def _values_by_prefix(width: int) -> dict[tuple[int, ...], list[int]]:
+    """Every ``width``-digit value, keyed by each of its leading-digit prefixes (including the empty one)."""
+    table: dict[tuple[int, ...], list[int]] = {}
+    for value in range(10**width):
+        digits = tuple(value // 10 ** (width - 1 - j) % 10 for j in range(width))
+        for k in range(width + 1):
+            table.setdefault(digits[:k], []).append(value)
+    return table
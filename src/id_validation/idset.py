@@ -0,0 +1,233 @@
+"""Compact sets of validated IDs for membership tests, dedupe and reconciliation.
+
+An ``IdSet`` keeps every ID as one ``int64`` key in a sorted NumPy array, so
+100M IDs take 800 MB instead of the several GB of a Python ``set`` of strings.
+Each key holds the country, the length of the normalized ID (so leading zeros
+survive) and its digits as an integer::
+
+    bit 62..55  country (index into ``COUNTRY_CODES``)
+    bit 54..51  length, 1 to 15 digits
+    bit 50..0   digits
+
+Membership (``isin``) is one ``searchsorted`` over the keys. Set algebra and
+``dedupe`` are NumPy sorted-array operations. The few normalized forms that
+are not all-digit strings of at most 15 characters (``IT``, ``MX``, ``ES``, the
+check letter of ``FI``...) are kept in a small side set of strings and handled
+the same way.
+
+IDs are normalized with the country's validator on the way in. The keys decode
+back to exactly that canonical string.
+
+``COUNTRY_CODES`` is a fixed table, so keys mean the same in every process and
+release: an ``IdSet`` can be pickled, rebuilt with ``from_keys`` or merged with
+shards built elsewhere. Countries registered outside the table keep all their
+IDs in the side set.
+
+Requires NumPy (``pip install id-validation[batch]``).
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, Iterator, Sequence
+
+import numpy as np
+
+from .batch import _default_pool, _parse_normalized, encode_fixed_width
+from .normalize import IDInput
+from .pool import ValidatorPool
+
+
+_MAX_DIGITS = 15  # 10**15 < 2**51
+_VALUE_BITS = 51
+_LENGTH_BITS = 4
+_COUNTRY_SHIFT = _VALUE_BITS + _LENGTH_BITS
+_VALUE_MASK = (1 << _VALUE_BITS) - 1
+_LENGTH_MASK = (1 << _LENGTH_BITS) - 1
+
+# The country field of a key is an index into this table. Stored keys depend on it: append only,
+# never reorder (at most 256 entries).
+COUNTRY_CODES = (
+    "AR", "BE", "BG", "BR", "BW", "CA", "CL", "CO", "CZ", "DK", "EC", "EE", "ES", "FI", "FR", "HR", "IT",
+    "LT", "LV", "MX", "NG", "NL", "NO", "PL", "PT", "RO", "SE", "SI", "SK", "TR", "ZA", "ZA_OLD", "ZW",
+)
+_COUNTRY_INDEX = {code: i for i, code in enumerate(COUNTRY_CODES)}
+
+
+def pack(country_code: str, normalized: Sequence[str]) -> tuple[np.ndarray, np.ndarray]:
+    """Keys for normalized IDs of one country.
+
+    Returns ``(keys, packed)``; rows that cannot be packed (non-digits, empty or
+    longer than 15 characters) have ``packed`` False and key -1.
+
+    Raises:
+        ValueError: If ``country_code`` is not in ``COUNTRY_CODES``.
+    """
+    index = _COUNTRY_INDEX.get(country_code)
+    if index is None:
+        raise ValueError(f"{country_code!r} has no IdSet key slot (see COUNTRY_CODES)")
+    n = len(normalized)
+    keys = np.full(n, -1, dtype=np.int64)
+    packed = np.zeros(n, dtype=bool)
+    country = np.int64(index) << _COUNTRY_SHIFT
+    lengths = np.fromiter(map(len, normalized), dtype=np.int64, count=n)
+    for width in np.unique(lengths).tolist():
+        if not 1 <= width <= _MAX_DIGITS:
+            continue
+        rows = np.flatnonzero(lengths == width)
+        matrix, _ = encode_fixed_width([normalized[i] for i in rows], width)
+        digits = matrix.astype(np.int64) - 48
+        ok = ((digits >= 0) & (digits <= 9)).all(axis=1)
+        values = digits @ (10 ** np.arange(width - 1, -1, -1, dtype=np.int64))
+        keys[rows[ok]] = country | (width << _VALUE_BITS) | values[ok]
+        packed[rows[ok]] = True
+    return keys, packed
+
+
+def unpack(keys: np.ndarray) -> list[tuple[str, str]]:
+    """``(country_code, normalized_id)`` for each key."""
+    countries = (keys >> _COUNTRY_SHIFT).tolist()
+    lengths = ((keys >> _VALUE_BITS) & _LENGTH_MASK).tolist()
+    values = (keys & _VALUE_MASK).tolist()
+    return [(COUNTRY_CODES[c], f"{v:0{w}d}") for c, w, v in zip(countries, lengths, values)]
+
+
+def _pack(country_code: str, normalized: Sequence[str]) -> tuple[np.ndarray, np.ndarray]:
+    """``pack``, leaving every row unpacked for countries outside ``COUNTRY_CODES``."""
+    if country_code not in _COUNTRY_INDEX:
+        return np.full(len(normalized), -1, dtype=np.int64), np.zeros(len(normalized), dtype=bool)
+    return pack(country_code, normalized)
+
+
+def _normalize(
+    country_code: str, ids: Sequence[IDInput], validate: bool, pool: ValidatorPool | None
+) -> tuple[list[str], np.ndarray]:
+    validator = (pool or _default_pool).get(country_code)
+    normalized = validator.normalize_many(ids)  # type: ignore[attr-defined]
+    if validate:
+        keep = _parse_normalized(country_code, validator, normalized, keep_ids=False).valid  # type: ignore[arg-type]
+    else:
+        keep = np.fromiter(map(bool, normalized), dtype=bool, count=len(normalized))
+    return normalized, keep
+
+
+class IdSet:
+    """An immutable set of ``(country_code, normalized_id)`` pairs."""
+
+    def __init__(self, keys: np.ndarray | None = None, other: frozenset[tuple[str, str]] = frozenset()) -> None:
+        """``keys`` must be sorted and unique; use ``from_ids`` or ``from_keys`` to build one."""
+        self.keys = keys if keys is not None else np.zeros(0, dtype=np.int64)
+        self.other = other
+
+    @classmethod
+    def from_keys(cls, keys: np.ndarray, other: Iterable[tuple[str, str]] = ()) -> IdSet:
+        return cls(np.unique(np.asarray(keys, dtype=np.int64)), frozenset(other))
+
+    @classmethod
+    def from_ids(
+        cls,
+        country_code: str,
+        ids: Sequence[IDInput],
+        *,
+        validate: bool = True,
+        pool: ValidatorPool | None = None,
+    ) -> IdSet:
+        """Normalize ``ids`` with the country's validator and collect them.
+
+        Invalid IDs are dropped unless ``validate`` is False, in which case only
+        empty ones are.
+
+        Raises:
+            ValueError: If no validator is registered for ``country_code``.
+        """
+        normalized, keep = _normalize(country_code, ids, validate, pool)
+        keys, packed = _pack(country_code, normalized)
+        other = frozenset((country_code, normalized[i]) for i in np.flatnonzero(keep & ~packed).tolist())
+        return cls(np.unique(keys[keep & packed]), other)
+
+    def __len__(self) -> int:
+        return len(self.keys) + len(self.other)
+
+    def __iter__(self) -> Iterator[tuple[str, str]]:
+        """``(country_code, normalized_id)`` pairs; packed IDs first, in key order."""
+        yield from unpack(self.keys)
+        yield from sorted(self.other)
+
+    def __contains__(self, item: object) -> bool:
+        if not (isinstance(item, tuple) and len(item) == 2):
+            return False
+        country_code, id_number = item
+        return bool(self.isin(country_code, [id_number], validate=False)[0])
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, IdSet):
+            return NotImplemented
+        return np.array_equal(self.keys, other.keys) and self.other == other.other
+
+    def __repr__(self) -> str:
+        return f"IdSet({len(self)} IDs)"
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.keys.nbytes)
+
+    def countries(self) -> list[str]:
+        codes = np.unique(self.keys >> _COUNTRY_SHIFT).tolist()
+        return sorted({COUNTRY_CODES[c] for c in codes} | {c for c, _ in self.other})
+
+    def isin(
+        self,
+        country_code: str,
+        ids: Sequence[IDInput],
+        *,
+        validate: bool = False,
+        pool: ValidatorPool | None = None,
+    ) -> np.ndarray:
+        """Boolean mask: is each of ``ids`` (normalized for ``country_code``) in the set?"""
+        normalized, keep = _normalize(country_code, ids, validate, pool)
+        keys, packed = _pack(country_code, normalized)
+        found = np.zeros(len(normalized), dtype=bool)
+        if len(self.keys):
+            pos = np.searchsorted(self.keys, keys).clip(max=len(self.keys) - 1)
+            found = (self.keys[pos] == keys) & packed
+        if self.other:
+            for i in np.flatnonzero(~packed).tolist():
+                found[i] = (country_code, normalized[i]) in self.other
+        return found & keep
+
+    def union(self, other: IdSet) -> IdSet:
+        return IdSet(np.union1d(self.keys, other.keys), self.other | other.other)
+
+    def intersection(self, other: IdSet) -> IdSet:
+        return IdSet(np.intersect1d(self.keys, other.keys, assume_unique=True), self.other & other.other)
+
+    def difference(self, other: IdSet) -> IdSet:
+        return IdSet(np.setdiff1d(self.keys, other.keys, assume_unique=True), self.other - other.other)
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
+
+
+def dedupe(
+    country_code: str,
+    ids: Sequence[IDInput],
+    *,
+    validate: bool = True,
+    pool: ValidatorPool | None = None,
+) -> np.ndarray:
+    """Mask selecting the first row of each distinct normalized ID.
+
+    Rows that are invalid (or empty, with ``validate=False``) are not selected.
+    """
+    normalized, keep = _normalize(country_code, ids, validate, pool)
+    keys, packed = _pack(country_code, normalized)
+    first = np.zeros(len(normalized), dtype=bool)
+    rows = np.flatnonzero(keep & packed)
+    _, index = np.unique(keys[rows], return_index=True)
+    first[rows[index]] = True
+    seen: set[str] = set()
+    for i in np.flatnonzero(keep & ~packed).tolist():
+        if normalized[i] not in seen:
+            seen.add(normalized[i])
+            first[i] = True
+    return first
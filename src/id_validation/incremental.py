@@ -0,0 +1,334 @@
+"""As-you-type validation, one keystroke at a time.
+
+``validator.incremental()`` returns an ``IncrementalValidator``. Each call to
+``feed`` reports one of three states:
+
+- ``INVALID``: no completion of the input can be valid, e.g. the month is 13 or
+  a check digit is wrong. The state stays INVALID until characters are removed.
+- ``INCOMPLETE``: the input is shorter than a full ID and could still become valid.
+- ``COMPLETE_VALID``: the input is a valid ID.
+
+Characters that the country's normalizer drops (spaces, separators) are ignored,
+and ``backspace`` undoes the last kept character. How much work a keystroke
+costs depends on what the validator declares:
+
+- Validators defined by a declarative layout (``id_validation.layout``: PL, BG,
+  EE, LT, BW) track the position, running checksum residues and whether the
+  date of birth can still be completed. A wrong digit is reported as soon as it
+  is typed, and every keystroke does a constant amount of work.
+- Validators that declare a ``checksum_spec`` (fixed-length, all-digit formats
+  such as ZA, ZA_OLD, RO, SI, CZ, NL, ...) use ``ChecksumIncremental``. It keeps
+  the running checksum residue, so a keystroke is O(1). Length, non-digit and
+  check-digit errors are reported at once. Those that also declare a
+  ``date_field`` (ZA, ZA_OLD, RO, SI, CZ, SK) report an impossible date on the
+  digit that makes it so. The full ``validate`` runs only when the input
+  reaches a complete length, for the remaining rules.
+- Validators that declare a ``shape`` (IT, MX, ES, FI, TR, ...) use
+  ``ShapeIncremental``. It tracks which fixed-length forms of the format the
+  input still fits, so a character the format cannot hold at that position, or
+  input longer than the longest form, is reported at once. Each keystroke is
+  one table lookup; ``validate`` runs only when a form is complete.
+- Any other validator uses ``ReparseIncremental``, which re-validates the whole
+  input per keystroke and only reports INVALID past ``max_length``.
+"""
+
+from __future__ import annotations
+
+from enum import Enum
+from itertools import product
+from typing import TYPE_CHECKING, Any
+
+from .dates import DatePrefix
+from .normalize import Normalizer
+
+if TYPE_CHECKING:
+    from .validators.base import BaseValidator
+
+
+_DIGITS = frozenset("0123456789")
+
+
+class Shape:
+    """The characters each position of a format can hold, for as-you-type checks.
+
+    Built from a regular expression in a small subset: literal characters,
+    ``\\d``, ``[...]`` classes with ranges, groups with ``|``, and the
+    quantifiers ``?``, ``{n}`` and ``{m,n}``; ``^`` and ``$`` are ignored. Most
+    validators pass their own format regex. The pattern is expanded into its
+    fixed-length ``alternatives`` (one character set per position), so it only
+    suits formats with a handful of lengths.
+
+    Raises:
+        ValueError: If ``pattern`` uses anything outside the subset.
+    """
+
+    def __init__(self, pattern: str) -> None:
+        self.pattern = pattern
+        self._pos = 0
+        alternatives = self._alternation()
+        if self._pos != len(pattern):
+            raise ValueError(f"Unbalanced ')' in shape pattern {pattern!r}")
+        self.alternatives: tuple[tuple[frozenset[str], ...], ...] = tuple(dict.fromkeys(alternatives))
+
+    def __repr__(self) -> str:
+        return f"Shape({self.pattern!r})"
+
+    def _peek(self) -> str:
+        return self.pattern[self._pos : self._pos + 1]
+
+    def _take(self) -> str:
+        if self._pos >= len(self.pattern):
+            raise ValueError(f"Unexpected end of shape pattern {self.pattern!r}")
+        self._pos += 1
+        return self.pattern[self._pos - 1]
+
+    def _alternation(self) -> list[tuple[frozenset[str], ...]]:
+        out = self._sequence()
+        while self._peek() == "|":
+            self._pos += 1
+            out += self._sequence()
+        return out
+
+    def _sequence(self) -> list[tuple[frozenset[str], ...]]:
+        out: list[tuple[frozenset[str], ...]] = [()]
+        while self._peek() not in ("", "|", ")"):
+            atom = self._atom()
+            low, high = self._quantifier()
+            options = [sum(parts, ()) for n in range(low, high + 1) for parts in product(atom, repeat=n)]
+            out = [head + tail for head in out for tail in options]
+        return out
+
+    def _atom(self) -> list[tuple[frozenset[str], ...]]:
+        ch = self._take()
+        if ch in "^$":
+            return [()]
+        if ch == "(":
+            if self.pattern.startswith("?:", self._pos):
+                self._pos += 2
+            alternatives = self._alternation()
+            if self._take() != ")":
+                raise ValueError(f"Unbalanced '(' in shape pattern {self.pattern!r}")
+            return alternatives
+        if ch == "[":
+            return [(self._class(),)]
+        if ch == "\\":
+            escaped = self._take()
+            return [(_DIGITS if escaped == "d" else frozenset(escaped),)]
+        if ch in ".*+{}]":
+            raise ValueError(f"Unsupported {ch!r} in shape pattern {self.pattern!r}")
+        return [(frozenset(ch),)]
+
+    def _class(self) -> frozenset[str]:
+        if self._peek() == "^":
+            raise ValueError(f"Negated classes are not supported in shape pattern {self.pattern!r}")
+        chars: set[str] = set()
+        while (ch := self._take()) != "]":
+            if ch == "\\":
+                escaped = self._take()
+                if escaped == "d":
+                    chars |= _DIGITS
+                    continue
+                ch = escaped
+            if self._peek() == "-" and self.pattern[self._pos + 1 : self._pos + 2] not in ("", "]"):
+                self._pos += 1
+                last = self._take()
+                chars.update(map(chr, range(ord(ch), ord(last) + 1)))
+            else:
+                chars.add(ch)
+        return frozenset(chars)
+
+    def _quantifier(self) -> tuple[int, int]:
+        ch = self._peek()
+        if ch == "?":
+            self._pos += 1
+            return 0, 1
+        if ch != "{":
+            return 1, 1
+        end = self.pattern.index("}", self._pos)
+        low, _, high = self.pattern[self._pos + 1 : end].partition(",")
+        self._pos = end + 1
+        return int(low), int(high or low)
+
+
+class InputState(Enum):
+    INVALID = "invalid"
+    INCOMPLETE = "incomplete"
+    COMPLETE_VALID = "complete_valid"
+
+
+class IncrementalValidator:
+    """Keystroke-by-keystroke validation state for one input field.
+
+    Subclasses provide ``_initial`` and ``_step``. A step maps the previous state
+    and one normalized character to the next state. States are
+    ``(InputState, payload)`` pairs and are kept on a stack so ``backspace`` is
+    O(1) as well.
+    """
+
+    def __init__(self, normalizer: Normalizer) -> None:
+        self._normalize = normalizer.apply
+        self.reset()
+
+    def _initial(self) -> tuple[InputState, Any]:
+        raise NotImplementedError
+
+    def _step(self, payload: Any, ch: str) -> tuple[InputState, Any]:
+        raise NotImplementedError
+
+    def reset(self) -> None:
+        self._chars: list[str] = []
+        self._states = [self._initial()]
+
+    @property
+    def state(self) -> InputState:
+        return self._states[-1][0]
+
+    @property
+    def text(self) -> str:
+        """The normalized input so far."""
+        return "".join(self._chars)
+
+    def feed(self, chars: str) -> InputState:
+        """Add typed (or pasted) characters and return the new state."""
+        for ch in chars:
+            ch = self._normalize(ch)
+            if not ch:
+                continue
+            previous_state, payload = self._states[-1]
+            self._chars.append(ch)
+            if previous_state is InputState.INVALID:
+                self._states.append((InputState.INVALID, payload))
+            else:
+                self._states.append(self._step(payload, ch))
+        return self.state
+
+    def backspace(self) -> InputState:
+        """Remove the last kept character and return the restored state."""
+        if self._chars:
+            self._chars.pop()
+            self._states.pop()
+        return self.state
+
+
+class ChecksumIncremental(IncrementalValidator):
+    """For fixed-length, all-digit validators that declare a ``checksum_spec``.
+
+    The payload is ``(length, residue, check_digit, date_digits)``. Each
+    keystroke adds one digit's contribution to the residue. If the validator
+    declares a ``date_field``, ``date_digits`` holds the digits typed at its
+    positions and an impossible date is reported on the digit that makes it so
+    (see ``id_validation.dates.DatePrefix``). ``validator.validate`` runs only
+    at the full length, after the check digit matched, and at the validator's
+    ``short_lengths``.
+    """
+
+    def __init__(self, validator: BaseValidator) -> None:
+        spec = validator.checksum_spec
+        assert spec is not None
+        self._validator = validator
+        self._spec = spec
+        self._short_lengths = frozenset(validator.short_lengths)
+        # Contribution table per position; None at the check digit.
+        tables: list[Any] = [None] * spec.length
+        for position, table in zip(spec.body, spec.contributions):
+            tables[position] = table
+        self._tables = tables
+        self._check_last = spec.check_index == spec.length - 1
+        self._date = DatePrefix(validator.date_field) if validator.date_field is not None else None
+        self._date_positions = frozenset(self._date.positions) if self._date is not None else frozenset()
+        super().__init__(validator.normalizer)
+
+    def _initial(self) -> tuple[InputState, Any]:
+        return InputState.INCOMPLETE, (0, 0, None, ())
+
+    def _step(self, payload: Any, ch: str) -> tuple[InputState, Any]:
+        i, residue, check, date_digits = payload
+        spec = self._spec
+        n = i + 1
+        if n > spec.length or not ("0" <= ch <= "9"):
+            return InputState.INVALID, payload
+        d = ord(ch) - 48
+        table = self._tables[i]
+        if table is None:
+            check = d
+        else:
+            residue = (residue + table[d]) % spec.modulus
+        if i in self._date_positions:
+            date_digits += (d,)
+        payload = (n, residue, check, date_digits)
+
+        if i in self._date_positions and not self._date.feasible(date_digits):  # type: ignore[union-attr]
+            return InputState.INVALID, payload
+        if n == spec.length:
+            if spec.check_values[residue] != check or not self._validator.validate(self.text):
+                return InputState.INVALID, payload
+            return InputState.COMPLETE_VALID, payload
+        if n in self._short_lengths and self._validator.validate(self.text):
+            return InputState.COMPLETE_VALID, payload
+        if n == spec.length - 1 and self._check_last and spec.check_values[residue] is None:
+            return InputState.INVALID, payload  # no check digit completes this body
+        return InputState.INCOMPLETE, payload
+
+
+class ShapeIncremental(IncrementalValidator):
+    """For validators that declare a ``shape``.
+
+    The payload is ``(length, alive)``: ``alive`` is a bitmask of the shape's
+    alternatives the input still fits. Each keystroke is one table lookup and an
+    AND. ``validator.validate`` runs only when a live alternative is complete.
+    """
+
+    def __init__(self, validator: BaseValidator) -> None:
+        shape = validator.shape
+        assert shape is not None
+        width = max(map(len, shape.alternatives), default=0)
+        # Per position, the alternatives (as a bitmask) that allow each character; per length, those complete there.
+        self._masks: list[dict[str, int]] = [{} for _ in range(width)]
+        self._complete = [0] * (width + 1)
+        for bit, alternative in enumerate(shape.alternatives):
+            for position, chars in enumerate(alternative):
+                masks = self._masks[position]
+                for ch in chars:
+                    masks[ch] = masks.get(ch, 0) | 1 << bit
+            self._complete[len(alternative)] |= 1 << bit
+        self._all = (1 << len(shape.alternatives)) - 1
+        self._validator = validator
+        super().__init__(validator.normalizer)
+
+    def _initial(self) -> tuple[InputState, Any]:
+        return InputState.INCOMPLETE, (0, self._all)
+
+    def _step(self, payload: Any, ch: str) -> tuple[InputState, Any]:
+        n, alive = payload
+        if n >= len(self._masks):
+            return InputState.INVALID, payload
+        alive &= self._masks[n].get(ch, 0)
+        n += 1
+        payload = (n, alive)
+        if not alive:
+            return InputState.INVALID, payload
+        if alive & self._complete[n]:
+            if self._validator.validate(self.text):
+                return InputState.COMPLETE_VALID, payload
+            if not alive & ~self._complete[n]:
+                return InputState.INVALID, payload  # no longer form left to complete
+        return InputState.INCOMPLETE, payload
+
+
+class ReparseIncremental(IncrementalValidator):
+    """Fallback for validators with no layout, checksum spec or shape: re-validates the whole input per keystroke."""
+
+    def __init__(self, validator: BaseValidator) -> None:
+        self._validator = validator
+        super().__init__(validator.normalizer)
+
+    def _initial(self) -> tuple[InputState, Any]:
+        return InputState.INCOMPLETE, None
+
+    def _step(self, payload: Any, ch: str) -> tuple[InputState, Any]:
+        max_length = self._validator.max_length
+        if max_length is not None and len(self._chars) > max_length:
+            return InputState.INVALID, None
+        if self._validator.validate(self.text):
+            return InputState.COMPLETE_VALID, None
+        return InputState.INCOMPLETE, None
@@ -0,0 +1,226 @@
+"""JSON Lines output for parse results.
+
+Each result becomes one object of the same shape ``id_parse`` returns in SQLite::
+
+    {"country_code":"PL","id_number":"44051401458","id_type":"PESEL","dob":"1944-05-14","gender":"M","extra":{...}}
+
+Dates are ISO strings, enums are written by name and non-ASCII text is kept as
+is (like ``json.dumps(..., ensure_ascii=False)``). ``None`` becomes ``null``.
+
+Results are not passed through ``json.dumps``. Each distinct set of ``extra``
+keys (normally one or two per country) is compiled once into a ``%``-format
+template with the keys already escaped. Only the values are encoded per row,
+using the C string escaper from the ``json`` module. ``write_batch`` goes
+further and formats whole ``BatchResult`` columns at once: dates via NumPy, and
+category labels escaped once per label.
+
+Writers take any object with a ``write(str)`` method (a text file, ``io.StringIO``)
+and write in chunks of lines.
+"""
+
+from __future__ import annotations
+
+import datetime as _dt
+import json
+from enum import Enum
+from json.encoder import encode_basestring  # type: ignore[attr-defined]
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Optional, Protocol
+
+from .validators.base import ParsedID
+
+if TYPE_CHECKING:
+    from .batch import BatchResult
+
+
+class TextSink(Protocol):
+    def write(self, s: str, /) -> Any: ...
+
+
+_CHUNK = 4096
+_STANDARD = ("country_code", "id_number", "id_type", "dob", "gender")
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, _dt.date):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.name
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _encode_other(value: Any) -> str:
+    if isinstance(value, Enum):
+        return encode_basestring(value.name)
+    return json.dumps(value, default=_json_default, ensure_ascii=False, separators=(",", ":"))
+
+
+def _encode_date(value: _dt.date) -> str:
+    return f'"{value.isoformat()}"'
+
+
+_ENCODERS: dict[type, Callable[[Any], str]] = {
+    str: encode_basestring,
+    int: int.__repr__,
+    bool: lambda v: "true" if v else "false",
+    type(None): lambda v: "null",
+    _dt.date: _encode_date,
+    _dt.datetime: _encode_date,
+}
+
+
+def encode_value(value: Any) -> str:
+    """JSON text for one value, as ``json.dumps(value, ensure_ascii=False)`` with dates as ISO strings."""
+    return _ENCODERS.get(type(value), _encode_other)(value)
+
+
+def _template(keys: tuple[str, ...]) -> str:
+    """Line template with one ``%s`` per value: the five standard fields, then ``keys`` of extra."""
+
+    def member(key: str) -> str:
+        return encode_basestring(key).replace("%", "%%") + ":%s"
+
+    extra = ",".join(member(key) for key in keys)
+    return "{" + ",".join(member(key) for key in _STANDARD) + ',"extra":{' + extra + "}}\n"
+
+
+class _Templates(dict):
+    def __missing__(self, keys: tuple[str, ...]) -> str:
+        template = self[keys] = _template(keys)
+        return template
+
+
+_TEMPLATES = _Templates()
+
+
+def _line(parsed: ParsedID) -> str:
+    extra = parsed.extra or {}
+    encoders = _ENCODERS
+    values = (
+        parsed.country_code,
+        parsed.id_number,
+        parsed.id_type,
+        parsed.dob,
+        parsed.gender,
+        *extra.values(),
+    )
+    return _TEMPLATES[tuple(extra)] % tuple([encoders.get(type(v), _encode_other)(v) for v in values])
+
+
+def dumps(parsed: ParsedID) -> str:
+    """One JSON object for ``parsed`` (no trailing newline)."""
+    return _line(parsed)[:-1]
+
+
+def write_jsonl(results: Iterable[Optional[ParsedID]], out: TextSink, *, include_invalid: bool = False) -> int:
+    """Write one line per result to ``out``; returns the number of lines written.
+
+    ``None`` results (invalid rows) are skipped, or written as ``null`` lines when
+    ``include_invalid`` is True so line numbers match input rows.
+    """
+    lines: list[str] = []
+    count = 0
+    for parsed in results:
+        if parsed is not None:
+            lines.append(_line(parsed))
+        elif include_invalid:
+            lines.append("null\n")
+        else:
+            continue
+        if len(lines) == _CHUNK:
+            out.write("".join(lines))
+            count += len(lines)
+            lines.clear()
+    out.write("".join(lines))
+    return count + len(lines)
+
+
+def _column_fragments(result: BatchResult, name: str) -> list[Optional[str]]:
+    """JSON text for every row of one column; ``None`` where the value is missing."""
+    import numpy as np
+
+    col = result.columns[name]
+    if col.ndim == 2:
+        return [None if (row < 0).any() else json.dumps(row.tolist(), separators=(",", ":")) for row in col]
+    kind = col.dtype.kind
+    if kind == "b":
+        return ["true" if v else "false" for v in col.tolist()]
+    if name in result.categories:
+        labels: list[Optional[str]] = [encode_basestring(label) for label in result.categories[name]]
+        labels.append(None)  # index -1: missing
+        return [labels[v] for v in col.tolist()]
+    if kind == "M":
+        dates: list[Optional[str]] = ['"' + t + '"' for t in np.datetime_as_string(col.astype("datetime64[D]")).tolist()]
+        for i in np.flatnonzero(np.isnat(col)).tolist():
+            dates[i] = None
+        return dates
+    if kind in "iu":
+        numbers: list[Optional[str]] = list(map(str, col.tolist()))
+        for i in np.flatnonzero(col < 0).tolist():
+            numbers[i] = None
+        return numbers
+    if kind == "U":
+        return [encode_basestring(v) if v else None for v in col.tolist()]
+    return [None if v is None else encode_value(v) for v in col.tolist()]
+
+
+def _pick(column: list[Any], rows: list[int]) -> list[Any]:
+    return [column[i] for i in rows] if len(rows) != len(column) else column
+
+
+def write_batch(result: BatchResult, out: TextSink, *, include_invalid: bool = False) -> int:
+    """Write the valid rows of a ``BatchResult`` as JSON Lines; returns the number of lines.
+
+    Equivalent to ``write_jsonl(result.to_parsed(i) for i in range(len(result)), out)``.
+    """
+    if result.rows is not None:
+        return write_jsonl(result.rows, out, include_invalid=include_invalid)
+    if result.id_numbers is None:
+        raise ValueError("BatchResult was built without id_numbers")
+
+    n = len(result)
+    valid = result.valid.tolist()
+    rows = [i for i, ok in enumerate(valid) if ok]
+    nulls = ["null"] * len(rows)
+    columns = {
+        name: [("null" if v is None else v) for v in _pick(_column_fragments(result, name), rows)]
+        for name in ("id_type", "dob", "gender")
+        if name in result.columns
+    }
+    standard = [
+        [encode_basestring(result.country_code)] * len(rows),
+        [encode_basestring(v) for v in _pick(result.id_numbers.tolist(), rows)],
+        columns.get("id_type", nulls),
+        columns.get("dob", nulls),
+        columns.get("gender", nulls),
+    ]
+    names = [name for name in result.columns if name not in columns]
+    fragments = [_pick(_column_fragments(result, name), rows) for name in names]
+
+    # Optional fields are left out where missing, so rows are grouped by which ones are present
+    # and each group is formatted with its own template (normally there is only one group).
+    optional = [j for j, name in enumerate(names) if name in result.optional]
+    groups: dict[tuple[bool, ...], list[int]] = {}
+    for r, present in enumerate(zip(*[[v is not None for v in fragments[j]] for j in optional])):
+        groups.setdefault(present, []).append(r)
+    if not optional:
+        groups = {(): list(range(len(rows)))}
+
+    formatted: list[Optional[str]] = [None] * len(rows)
+    for present, members in groups.items():
+        kept = [j for j in range(len(names)) if j not in optional or present[optional.index(j)]]
+        template = _template(tuple(names[j] for j in kept))
+        cells = [_pick(col, members) for col in standard]
+        cells += [[("null" if v is None else v) for v in _pick(fragments[j], members)] for j in kept]
+        lines = [template % values for values in zip(*cells)]
+        if len(members) == len(rows):
+            formatted = lines  # type: ignore[assignment]
+        else:
+            for r, line in zip(members, lines):
+                formatted[r] = line
+
+    if include_invalid and len(rows) != n:
+        it = iter(formatted)
+        formatted = [next(it) if ok else "null\n" for ok in valid]
+    for start in range(0, len(formatted), _CHUNK):
+        out.write("".join(formatted[start : start + _CHUNK]))  # type: ignore[arg-type]
+    return len(formatted)
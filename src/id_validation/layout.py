@@ -0,0 +1,440 @@
+"""Declarative layouts for fixed-width, all-digit personal ID numbers.
+
+Many national IDs have the same structure. The date of birth sits at fixed positions
+and its century is encoded elsewhere, either in a leading digit or as an offset
+added to the month. One digit carries the gender, and one or more weighted-sum
+check digits come last. A ``Layout`` declares that structure as data::
+
+    Layout(
+        country_code="PL",
+        id_type="PESEL",
+        length=11,
+        checks=(ChecksumSpec.weighted([1, 3, 7, 9, 1, 3, 7, 9, 1, 3], 10, lambda r: (10 - r) % 10),),
+        date=DateField(
+            year=(0, 2),
+            month=(2, 4),
+            day=(4, 6),
+            century=CenturyFromMonth({0: 1900, 20: 2000, 40: 2100, 60: 2200, 80: 1800}),
+        ),
+        gender=GenderDigit.parity(9, male="odd"),
+        fields=(Field("serial", 6, 10), Field("checksum", 10, 11)),
+    )
+
+The declaration is compiled into:
+
+- ``Layout.parse``, a scalar parser built for this layout. It uses no regex;
+  the digits are decoded with a single ``bytes.translate``.
+- A vectorized batch kernel (``id_validation.validators.kernels.compile_layout``).
+  One is registered automatically for every ``LayoutValidator``.
+- ``Layout.generate``, which makes valid IDs for a chosen date of birth and
+  gender, e.g. for test fixtures.
+
+Validators built on a layout subclass ``LayoutValidator`` and only declare it.
+Formats that do not fit (letters, several lengths, rules that depend on other
+fields) keep a hand-written ``parse``.
+"""
+
+from __future__ import annotations
+
+import datetime as _dt
+import random
+from dataclasses import dataclass, field
+from typing import Any, Callable, Mapping, Union
+
+from .dates import (  # noqa: F401 - re-exported, layouts are declared with these
+    CenturyFromDigit,
+    CenturyFromMonth,
+    CenturyGuessed,
+    CenturyRule,
+    DateField,
+    DatePrefix,
+)
+from .incremental import IncrementalValidator, InputState
+from .normalize import IDInput, Normalizer
+from .suggest import ChecksumSpec
+from .validate import ValidationError
+from .validators.base import BaseValidator, ParsedID
+
+
+# bytes.translate table mapping ASCII digits to their values 0-9.
+_DIGIT_VALUES = bytes.maketrans(b"0123456789", bytes(range(10)))
+
+
+@dataclass(frozen=True)
+class GenderDigit:
+    """Gender read from the digit at ``position``; ``genders[digit]`` is "M", "F" or None (invalid)."""
+
+    position: int
+    genders: tuple[str | None, ...]
+
+    @classmethod
+    def parity(cls, position: int, male: str = "odd") -> GenderDigit:
+        """Odd digits are male (``male="odd"``) or female (``male="even"``)."""
+        odd, even = ("M", "F") if male == "odd" else ("F", "M")
+        return cls(position, tuple(odd if digit % 2 else even for digit in range(10)))
+
+    @classmethod
+    def from_digits(cls, position: int, genders: Mapping[int, str]) -> GenderDigit:
+        """Only the listed digits are valid (Botswana: 1 is male, 2 is female)."""
+        return cls(position, tuple(genders.get(digit) for digit in range(10)))
+
+
+@dataclass(frozen=True)
+class Field:
+    """A value copied into ``ParsedID.extra``.
+
+    ``kind`` is ``"int"`` (the digits at ``start:stop`` as a number), ``"str"``
+    (the characters as-is) or ``"century"`` (the decoded century; no span).
+    """
+
+    name: str
+    start: int = 0
+    stop: int = 0
+    kind: str = "int"
+
+
+@dataclass(frozen=True)
+class Fallback:
+    """Checksum stages tried in order; the first stage whose residue yields a check digit decides.
+
+    Estonia and Lithuania switch to a second weight set when the first sum leaves
+    remainder 10.
+    """
+
+    stages: tuple[ChecksumSpec, ...]
+
+    def __post_init__(self) -> None:
+        if len({(s.length, s.check_index) for s in self.stages}) != 1:
+            raise ValueError("Fallback stages must cover the same positions")
+
+    @property
+    def length(self) -> int:
+        return self.stages[0].length
+
+    @property
+    def check_index(self) -> int:
+        return self.stages[0].check_index
+
+
+Check = Union[ChecksumSpec, Fallback]
+
+
+@dataclass(frozen=True)
+class Layout:
+    """Declarative description of a fixed-width, all-digit ID format.
+
+    ``checks`` are verified in order. Each covers the first ``check.length``
+    digits, so a second check digit can include the first (as in Norway).
+    They run before the date of birth is decoded, unless ``date_first``.
+
+    ``format_error`` and ``century_error`` override the messages raised for a
+    malformed ID and an undecodable century, so a validator moved onto a
+    layout keeps the errors it always raised.
+    """
+
+    country_code: str
+    id_type: str
+    length: int
+    checks: tuple[Check, ...] = ()
+    date: DateField | None = None
+    gender: GenderDigit | None = None
+    fields: tuple[Field, ...] = ()
+    format_error: str | None = None
+    century_error: str | None = None
+    date_first: bool = False
+
+    parse: Callable[[str], ParsedID] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.date is not None and (isinstance(self.date.century, CenturyGuessed) or self.date.month_offsets != (0,)):
+            raise ValueError("A layout's date must encode its century, with no other month offsets")
+        for check in self.checks:
+            if check.length > self.length:
+                raise ValueError(f"Checksum over {check.length} digits does not fit a {self.length}-digit ID")
+        for f in self.fields:
+            if f.kind not in ("int", "str", "century"):
+                raise ValueError(f"Unknown field kind: {f.kind!r}")
+            if f.kind == "century" and self.date is None:
+                raise ValueError("A century field needs a date")
+        object.__setattr__(self, "parse", self._compile())
+
+    @property
+    def checksum_spec(self) -> ChecksumSpec | None:
+        """The single whole-ID checksum, for ``suggest`` (``None`` if there is not exactly one)."""
+        if len(self.checks) == 1 and isinstance(self.checks[0], ChecksumSpec) and self.checks[0].length == self.length:
+            return self.checks[0]
+        return None
+
+    def _compile(self) -> Callable[[str], ParsedID]:
+        """Build the scalar parser for this layout (normalized ``str`` in, ``ParsedID`` out)."""
+        length, country_code, id_type = self.length, self.country_code, self.id_type
+        format_error = self.format_error or f"Invalid {id_type} format"
+        checks = tuple(
+            (tuple(spec.expected for spec in (c.stages if isinstance(c, Fallback) else (c,))), c.check_index)
+            for c in self.checks
+        )
+        date = self.date
+        fields = tuple((f.name, f.kind, f.start, f.stop) for f in self.fields)
+        genders, gender_position = (self.gender.genders, self.gender.position) if self.gender else (None, 0)
+
+        decode_century: Callable[[bytes, int], tuple[int, int]] | None = None
+        (ys, ye), (ms, me), (ds, de) = (date.year, date.month, date.day) if date else ((0, 0),) * 3
+        if date is not None:
+            rule = date.century
+            if isinstance(rule, CenturyFromDigit):
+                by_digit = tuple(rule.centuries.get(digit) for digit in range(10))
+                position = rule.position
+                digit_error = self.century_error or "Invalid century digit"
+
+                def decode_century(d: bytes, month: int) -> tuple[int, int]:
+                    century = by_digit[d[position]]
+                    if century is None:
+                        raise ValidationError(digit_error)
+                    return century, month
+
+            else:
+                # Every two-digit month value, resolved once: (century, real month) or None.
+                by_month: list[tuple[int, int] | None] = [None] * 100
+                for offset, century in rule.offsets.items():
+                    for month in range(1, 13):
+                        by_month[offset + month] = (century, month)
+                month_error = self.century_error or "Invalid month/century encoding"
+
+                def decode_century(d: bytes, month: int) -> tuple[int, int]:
+                    decoded = by_month[month]
+                    if decoded is None:
+                        raise ValidationError(month_error)
+                    return decoded
+
+        date_first = self.date_first
+
+        def verify_checks(d: bytes) -> None:
+            for stages, index in checks:
+                for expected_digit in stages:
+                    expected = expected_digit(d)
+                    if expected is not None:
+                        break
+                if d[index] != expected:
+                    raise ValidationError("Invalid checksum")
+
+        def parse(v: str) -> ParsedID:
+            if len(v) != length or not (v.isascii() and v.isdigit()):
+                raise ValidationError(format_error)
+            d = v.encode("ascii").translate(_DIGIT_VALUES)
+
+            if not date_first:
+                verify_checks(d)
+            century = dob = None
+            if date is not None:
+                century, month = decode_century(d, int(v[ms:me]))  # type: ignore[misc]
+                try:
+                    dob = _dt.date(century + int(v[ys:ye]), month, int(v[ds:de]))
+                except ValueError as e:
+                    raise ValidationError("Invalid date of birth") from e
+            if date_first:
+                verify_checks(d)
+
+            gender = None
+            if genders is not None:
+                gender = genders[d[gender_position]]
+                if gender is None:
+                    raise ValidationError("Invalid gender digit")
+
+            extra = {}
+            for name, kind, start, stop in fields:
+                extra[name] = int(v[start:stop]) if kind == "int" else v[start:stop] if kind == "str" else century
+            return ParsedID(
+                country_code=country_code, id_number=v, id_type=id_type, dob=dob, gender=gender, extra=extra or None
+            )
+
+        return parse
+
+    def generate(
+        self,
+        rng: random.Random | None = None,
+        *,
+        dob: _dt.date | None = None,
+        gender: str | None = None,
+    ) -> str:
+        """A random valid ID, optionally with the given date of birth and/or gender.
+
+        Raises:
+            ValueError: If the layout cannot encode the requested ``dob`` or ``gender``.
+        """
+        rng = rng if rng is not None else random.Random()
+        if dob is not None and self.date is None:
+            raise ValueError(f"{self.country_code} IDs do not encode a date of birth")
+        if gender is not None and (self.gender is None or gender not in self.gender.genders):
+            raise ValueError(f"{self.country_code} IDs cannot encode gender {gender!r}")
+        if dob is not None and dob.year - dob.year % 100 not in self.date.century.supported():  # type: ignore[union-attr]
+            raise ValueError(f"{self.country_code} IDs cannot encode a date of birth in {dob.year}")
+
+        for _ in range(1000):
+            d = [rng.randrange(10) for _ in range(self.length)]
+            gender_digits = (
+                [g for g in range(10) if self.gender.genders[g] is not None and gender in (None, self.gender.genders[g])]
+                if self.gender is not None
+                else []
+            )
+            if self.date is not None:
+                born = dob if dob is not None else _random_date(rng, self.date.century.supported())
+                century = born.year - born.year % 100
+                month = born.month
+                rule = self.date.century
+                if isinstance(rule, CenturyFromDigit):
+                    options = rule.digits_for(century)
+                    if self.gender is not None and self.gender.position == rule.position:
+                        options = [digit for digit in options if digit in gender_digits]
+                        gender_digits = options
+                    if not options:
+                        raise ValueError(f"{self.country_code} IDs cannot encode this date of birth and gender")
+                    d[rule.position] = rng.choice(options)
+                else:
+                    month += rule.offset_for(century)  # type: ignore[operator]
+                _put(d, self.date.year, born.year % 100)
+                _put(d, self.date.month, month)
+                _put(d, self.date.day, born.day)
+            if self.gender is not None:
+                d[self.gender.position] = rng.choice(gender_digits)
+
+            for check in self.checks:
+                for spec in check.stages if isinstance(check, Fallback) else (check,):
+                    expected = spec.expected(d)
+                    if expected is not None:
+                        break
+                if expected is None:
+                    break
+                d[check.check_index] = expected
+            else:
+                v = "".join(map(str, d))
+                try:
+                    self.parse(v)
+                except ValidationError:
+                    continue
+                return v
+        raise ValueError(f"Could not generate a valid {self.country_code} ID")
+
+
+def _put(digits: list[int], span: tuple[int, int], value: int) -> None:
+    start, stop = span
+    for i in range(stop - 1, start - 1, -1):
+        value, digits[i] = divmod(value, 10)
+
+
+def _random_date(rng: random.Random, centuries: list[int]) -> _dt.date:
+    century = rng.choice(centuries)
+    first = _dt.date(century, 1, 1).toordinal()
+    last = _dt.date(min(century + 99, _dt.MAXYEAR), 12, 31).toordinal()
+    return _dt.date.fromordinal(rng.randint(first, last))
+
+
+class LayoutIncremental(IncrementalValidator):
+    """Incremental validator for a layout.
+
+    The payload is ``(position, sums, check_digits, date_digits)``: one running
+    sum per checksum stage, the check digits typed so far, and the digits typed
+    at the date positions (see ``DatePrefix``). All are a few entries long,
+    whatever the ID length, so each keystroke does a constant amount of work. A
+    check digit is verified as soon as it is typed. After each date, century or
+    gender digit, the validator checks that some completion still gives a valid
+    date of birth and gender.
+    """
+
+    def __init__(self, layout: Layout, normalizer: Normalizer) -> None:
+        self._layout = layout
+        # For each checksum: (stages as (contributions by position, modulus, check values), check index, last position).
+        self._checks = []
+        for check in layout.checks:
+            stages = check.stages if isinstance(check, Fallback) else (check,)
+            self._checks.append(
+                (
+                    tuple((dict(zip(spec.body, spec.contributions)), spec.modulus, spec.check_values) for spec in stages),
+                    check.check_index,
+                    check.length - 1,
+                )
+            )
+        self._stage_count = sum(len(stages) for stages, _, _ in self._checks)
+        self._date = DatePrefix(layout.date) if layout.date is not None else None
+        self._date_positions = frozenset(self._date.positions) if self._date is not None else frozenset()
+        super().__init__(normalizer)
+
+    def _initial(self) -> tuple[InputState, Any]:
+        return InputState.INCOMPLETE, (0, (0,) * self._stage_count, (None,) * len(self._checks), ())
+
+    def _step(self, payload: Any, ch: str) -> tuple[InputState, Any]:
+        pos, sums, check_digits, date_digits = payload
+        layout = self._layout
+        if pos >= layout.length or not (ch.isascii() and ch.isdigit()):
+            return InputState.INVALID, payload
+        digit = ord(ch) - 48
+
+        new_sums = list(sums)
+        typed = list(check_digits)
+        k = 0
+        ok = True
+        for c, (stages, check_index, last) in enumerate(self._checks):
+            if pos == check_index:
+                typed[c] = digit
+            expected = None
+            for contributions, modulus, check_values in stages:
+                table = contributions.get(pos)
+                if table is not None:
+                    new_sums[k] += table[digit]
+                if pos == last and expected is None:
+                    expected = check_values[new_sums[k] % modulus]
+                k += 1
+            if pos == last and typed[c] != expected:
+                ok = False
+        if pos in self._date_positions:
+            date_digits += (digit,)
+        payload = (pos + 1, tuple(new_sums), tuple(typed), date_digits)
+
+        if not ok:
+            return InputState.INVALID, payload
+        if layout.gender is not None and pos == layout.gender.position and layout.gender.genders[digit] is None:
+            return InputState.INVALID, payload
+        if pos in self._date_positions and not self._date.feasible(date_digits):  # type: ignore[union-attr]
+            return InputState.INVALID, payload
+        if pos + 1 < layout.length:
+            return InputState.INCOMPLETE, payload
+        try:
+            layout.parse(self.text)
+        except ValidationError:
+            return InputState.INVALID, payload
+        return InputState.COMPLETE_VALID, payload
+
+
+LAYOUTS: dict[str, Layout] = {}
+
+
+class LayoutValidator(BaseValidator):
+    """Validator defined entirely by a class-level ``layout``.
+
+    Subclasses register their layout in ``LAYOUTS``; the batch kernels module
+    compiles a vectorized kernel for each one.
+    """
+
+    layout: Layout
+
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        super().__init_subclass__(**kwargs)
+        layout = cls.__dict__.get("layout")
+        if layout is not None:
+            LAYOUTS[layout.country_code] = layout
+
+    def parse(self, id_number: IDInput) -> ParsedID:
+        return self.layout.parse(self.normalize(id_number))
+
+    def generate(
+        self,
+        rng: random.Random | None = None,
+        *,
+        dob: _dt.date | None = None,
+        gender: str | None = None,
+    ) -> str:
+        """A random valid ID; see ``Layout.generate``."""
+        return self.layout.generate(rng, dob=dob, gender=gender)
+
+    def incremental(self) -> LayoutIncremental:
+        """As-you-type validator that rejects a wrong digit as soon as it is typed."""
+        return LayoutIncremental(self.layout, self.normalizer)
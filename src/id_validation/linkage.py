@@ -0,0 +1,174 @@
+"""Near-duplicate lookup for record linkage.
+
+``NearDuplicateIndex`` holds a reference set of normalized IDs for one country and
+answers "which references are one substitution or one adjacent transposition away
+from this ID". Queries expand the probe into its edit-distance-1 neighbourhood and
+look each neighbour up in a sorted, compact store, so no per-reference neighbourhood
+has to be materialised.
+
+All-digit references are stored as unsigned integers in an ``array('Q')`` (8 bytes
+per reference); anything else is kept as a sorted list of strings.
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from typing import Iterable
+
+from .validators.base import BaseValidator
+
+
+_MAX_PACKED_DIGITS = 19  # largest digit count that always fits in an unsigned 64-bit integer
+
+
+def _is_digits(v: str) -> bool:
+    return v.isascii() and v.isdigit()
+
+
+def _contains_sorted(values, item) -> bool:
+    i = bisect_left(values, item)
+    return i < len(values) and values[i] == item
+
+
+class _DigitBucket:
+    """References of one length that are all digits, packed as integers."""
+
+    def __init__(self, length: int, ids: Iterable[str]) -> None:
+        self.length = length
+        self.values = array("Q", sorted({int(v) for v in ids}))
+        self.powers = [10 ** (length - 1 - i) for i in range(length)]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __contains__(self, v: str) -> bool:
+        return _contains_sorted(self.values, int(v))
+
+    def neighbours(self, v: str) -> list[str]:
+        n = int(v)
+        digits = [ord(ch) - 48 for ch in v]
+        values = self.values
+        found = set()
+        for i, d in enumerate(digits):
+            p = self.powers[i]
+            base = n - d * p
+            for d2 in range(10):
+                if d2 != d and _contains_sorted(values, base + d2 * p):
+                    found.add(base + d2 * p)
+        for i in range(self.length - 1):
+            a, b = digits[i], digits[i + 1]
+            if a != b:
+                # Swapping a (at 10**k+1) with b (at 10**k) changes the value by (b - a) * 9 * 10**k.
+                m = n + (b - a) * 9 * self.powers[i + 1]
+                if _contains_sorted(values, m):
+                    found.add(m)
+        return [f"{m:0{self.length}d}" for m in sorted(found)]
+
+
+class _StringBucket:
+    """References of one length containing non-digit characters."""
+
+    def __init__(self, length: int, ids: Iterable[str]) -> None:
+        self.length = length
+        self.values = sorted(set(ids))
+        # Only characters seen at a position in the references can produce a match there.
+        alphabets: list[set[str]] = [set() for _ in range(length)]
+        for v in self.values:
+            for i, ch in enumerate(v):
+                alphabets[i].add(ch)
+        self.alphabets = ["".join(sorted(a)) for a in alphabets]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __contains__(self, v: str) -> bool:
+        return _contains_sorted(self.values, v)
+
+    def neighbours(self, v: str) -> list[str]:
+        values = self.values
+        found = set()
+        for i, ch in enumerate(v):
+            head, tail = v[:i], v[i + 1 :]
+            for ch2 in self.alphabets[i]:
+                if ch2 != ch:
+                    candidate = head + ch2 + tail
+                    if _contains_sorted(values, candidate):
+                        found.add(candidate)
+        for i in range(self.length - 1):
+            if v[i] != v[i + 1]:
+                candidate = v[:i] + v[i + 1] + v[i] + v[i + 2 :]
+                if _contains_sorted(values, candidate):
+                    found.add(candidate)
+        return sorted(found)
+
+
+class NearDuplicateIndex:
+    """Edit-distance-1 index over a reference set of IDs for a single country.
+
+    References and queries are normalized with ``validator.normalize``. Exact
+    matches are not reported as neighbours; use ``in`` for those.
+    """
+
+    def __init__(self, validator: BaseValidator, ids: Iterable[str]) -> None:
+        self.validator = validator
+
+        by_length: dict[int, list[str]] = {}
+        for v in validator.normalize_many(list(ids)):
+            if v:
+                by_length.setdefault(len(v), []).append(v)
+
+        self._buckets: dict[int, _DigitBucket | _StringBucket] = {}
+        for length, values in by_length.items():
+            if length <= _MAX_PACKED_DIGITS and all(_is_digits(v) for v in values):
+                self._buckets[length] = _DigitBucket(length, values)
+            else:
+                self._buckets[length] = _StringBucket(length, values)
+
+    def __len__(self) -> int:
+        return sum(len(b) for b in self._buckets.values())
+
+    def __contains__(self, id_number: str) -> bool:
+        v = self.validator.normalize(id_number)
+        bucket = self._buckets.get(len(v))
+        if bucket is None:
+            return False
+        if isinstance(bucket, _DigitBucket) and not _is_digits(v):
+            return False
+        return v in bucket
+
+    def neighbours(self, id_number: str, *, only_valid: bool = False) -> list[str]:
+        """Return references within one substitution or adjacent transposition of ``id_number``.
+
+        With ``only_valid=True``, neighbours that fail ``validator.validate`` are dropped.
+        """
+        v = self.validator.normalize(id_number)
+        bucket = self._buckets.get(len(v))
+        if bucket is None:
+            return []
+
+        if isinstance(bucket, _DigitBucket):
+            if _is_digits(v):
+                found = bucket.neighbours(v)
+            else:
+                # A single non-digit (e.g. an OCR 'O' for '0') can only be fixed at that position.
+                found = self._digit_neighbours_of_mixed(bucket, v)
+        else:
+            found = bucket.neighbours(v)
+
+        if only_valid:
+            found = [f for f in found if self.validator.validate(f)]
+        return found
+
+    @staticmethod
+    def _digit_neighbours_of_mixed(bucket: _DigitBucket, v: str) -> list[str]:
+        bad = [i for i, ch in enumerate(v) if not _is_digits(ch)]
+        if len(bad) != 1:
+            return []
+        i = bad[0]
+        found = []
+        for d in "0123456789":
+            candidate = v[:i] + d + v[i + 1 :]
+            if candidate in bucket:
+                found.append(candidate)
+        return found
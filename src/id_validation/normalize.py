@@ -0,0 +1,188 @@
+"""Declarative, single-pass normalization of ID numbers.
+
+Validators declare how their input is cleaned once, as a class attribute::
+
+    normalizer = Normalizer(" -.", upper=True)
+
+and ``BaseValidator.normalize`` applies it. The declaration is compiled into a
+256-entry ``bytes.translate`` table plus a set of bytes to delete. ASCII input,
+which is almost all input, is normalized by one ``strip`` and one ``translate``
+call, however many separators are removed. Non-ASCII input takes an equivalent
+``str`` path so Unicode whitespace and case are handled the same way.
+
+``Normalizer.apply`` is the compiled function itself. ``Normalizer.many`` is the
+batch form, which translates a whole column in one call.
+
+Input may also be ``bytes``, ``bytearray`` or ``memoryview`` (e.g. fields read
+straight from a file or socket). ASCII bytes are translated as-is and decoded once,
+producing the normalized ``str``; other bytes must be valid UTF-8.
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Sequence, Union
+
+from .validate import ValidationError
+
+
+IDInput = Union[str, bytes, bytearray, memoryview]
+
+
+_ASCII_WHITESPACE = "".join(chr(c) for c in range(128) if chr(c).isspace())
+_ASCII_WHITESPACE_BYTES = _ASCII_WHITESPACE.encode("ascii")
+_ASCII_DIGITS = "0123456789"
+_BATCH_SEPARATOR = "\x00"
+
+
+class _KeepOnly(dict):
+    """``str.translate`` mapping that deletes every character not explicitly mapped."""
+
+    def __missing__(self, key: int) -> None:
+        return None
+
+
+class Normalizer:
+    """Strip, delete separators and optionally uppercase an ID in one pass.
+
+    Args:
+        remove: Characters deleted anywhere in the ID (e.g. ``" -./"``).
+        whitespace: Delete all whitespace, not only spaces.
+        upper: Uppercase letters.
+        digits_only: Keep only ASCII digits (overrides the other options).
+        strip_after: Strip surrounding whitespace after deleting ``remove``
+            rather than before, so whitespace outside an edge separator goes
+            too (``"-\t50025544Q12"`` -> ``"50025544Q12"``).
+
+    Leading and trailing whitespace is always stripped.
+    """
+
+    def __init__(
+        self,
+        remove: str = "",
+        *,
+        whitespace: bool = False,
+        upper: bool = False,
+        digits_only: bool = False,
+        strip_after: bool = False,
+    ):
+        self.remove = remove
+        self.whitespace = whitespace
+        self.upper = upper
+        self.digits_only = digits_only
+        self.strip_after = strip_after
+
+        deleted = set(remove)
+        if whitespace:
+            deleted |= set(_ASCII_WHITESPACE)
+        if digits_only:
+            deleted = {chr(c) for c in range(128)} - set(_ASCII_DIGITS)
+
+        table = bytearray(range(256))
+        if upper and not digits_only:
+            table[ord("a") : ord("z") + 1] = table[ord("A") : ord("Z") + 1]
+        self._table = bytes(table)
+        self._delete = "".join(sorted(deleted)).encode("ascii")
+        self._batch_delete = self._delete.replace(_BATCH_SEPARATOR.encode("ascii"), b"")
+        # Deleting then stripping equals stripping whitespace and deleted characters, then deleting.
+        self._edge: str | None = _ASCII_WHITESPACE + remove if strip_after and remove else None
+        self._edge_bytes = self._edge.encode("ascii") if self._edge else _ASCII_WHITESPACE_BYTES
+
+        if digits_only:
+            self._str_table: dict[int, int | None] = _KeepOnly({ord(c): ord(c) for c in _ASCII_DIGITS})
+        else:
+            self._str_table = {ord(c): None for c in deleted}
+        self.apply = self._compile()
+
+    def __repr__(self) -> str:
+        flags = [
+            f"{name}=True" for name in ("whitespace", "upper", "digits_only", "strip_after") if getattr(self, name)
+        ]
+        return f"Normalizer({', '.join([repr(self.remove), *flags])})"
+
+    def __call__(self, id_number: IDInput) -> str:
+        return self.apply(id_number)
+
+    def _compile(self) -> Callable[[IDInput], str]:
+        """Build the plain function behind ``apply`` (cheaper to call than ``__call__``)."""
+        from_bytes = self._normalize_bytes
+
+        if self._edge is not None:
+            table, delete, slow, edge = self._table, self._delete, self._normalize_unicode, self._edge
+
+            def apply(id_number: IDInput) -> str:
+                if type(id_number) is not str:
+                    return from_bytes(id_number)
+                if id_number.isascii():
+                    return id_number.strip(edge).encode("ascii").translate(table, delete).decode("ascii")
+                return slow(id_number).strip()
+
+            return apply
+
+        if len(self.remove) == 1 and not (self.whitespace or self.upper or self.digits_only):
+            # A single separator and nothing else is cheapest as one str.replace.
+            separator = self.remove
+
+            def apply(id_number: IDInput) -> str:
+                if type(id_number) is not str:
+                    return from_bytes(id_number)
+                return id_number.strip().replace(separator, "")
+
+            return apply
+
+        table, delete, slow = self._table, self._delete, self._normalize_unicode
+
+        def apply(id_number: IDInput) -> str:
+            if type(id_number) is not str:
+                return from_bytes(id_number)
+            v = id_number.strip()
+            if v.isascii():
+                return v.encode("ascii").translate(table, delete).decode("ascii")
+            return slow(v)
+
+        return apply
+
+    def _normalize_unicode(self, v: str) -> str:
+        if self.whitespace:
+            v = "".join(v.split())
+        if self.upper and not self.digits_only:
+            v = v.upper()
+        return v.translate(self._str_table)
+
+    def _normalize_bytes(self, raw: IDInput) -> str:
+        if isinstance(raw, str):  # str subclasses such as numpy.str_
+            return self.apply(str(raw))
+        if isinstance(raw, memoryview):
+            raw = raw.tobytes()
+        elif not isinstance(raw, (bytes, bytearray)):
+            raise TypeError(f"ID numbers must be str or bytes-like, not {type(raw).__name__}")
+        v = raw.strip(self._edge_bytes)
+        if v.isascii():
+            return v.translate(self._table, self._delete).decode("ascii")
+        try:
+            return self.apply(bytes(raw).decode("utf-8"))
+        except UnicodeDecodeError as e:
+            raise ValidationError("ID number is not valid UTF-8") from e
+
+    def many(self, ids: Sequence[IDInput]) -> list[str]:
+        """Normalize a column of IDs; equivalent to ``[self(v) for v in ids]``."""
+        try:
+            stripped = [v.strip(self._edge) for v in ids]
+            joined = _BATCH_SEPARATOR.join(stripped)  # type: ignore[arg-type]
+        except (AttributeError, TypeError):
+            return self._many_bytes(ids)
+        if not joined.isascii() or joined.count(_BATCH_SEPARATOR) != max(len(stripped) - 1, 0):
+            return [self.apply(v) for v in ids]
+        out = joined.encode("ascii").translate(self._table, self._batch_delete).decode("ascii")
+        return out.split(_BATCH_SEPARATOR) if stripped else []
+
+    def _many_bytes(self, ids: Sequence[IDInput]) -> list[str]:
+        separator = _BATCH_SEPARATOR.encode("ascii")
+        try:
+            stripped = [bytes(v).strip(self._edge_bytes) for v in ids]  # type: ignore[arg-type]
+        except TypeError:
+            return [self.apply(v) for v in ids]
+        joined = separator.join(stripped)
+        if not joined.isascii() or joined.count(separator) != max(len(stripped) - 1, 0):
+            return [self.apply(v) for v in ids]
+        out = joined.translate(self._table, self._batch_delete).decode("ascii")
+        return out.split(_BATCH_SEPARATOR) if stripped else []
@@ -0,0 +1,134 @@
+"""pandas ``Series.idv`` accessor for batch validation and extraction.
+
+Importing this module registers the accessor::
+
+    import id_validation.pandas_accessor  # noqa: F401
+
+    df["valid"] = df.national_id.idv.validate("ZA")
+    details = df.national_id.idv.parse("IT")
+    df["valid"] = df.national_id.idv.validate(df.country)  # mixed countries
+
+Rows are grouped by country and each group goes through
+``id_validation.batch.parse_batch`` once, so kernel-backed countries are decoded
+column-wise rather than row by row. Unknown country codes and missing IDs are
+reported as invalid.
+
+Requires pandas (``pip install id-validation[pandas]``).
+"""
+
+from __future__ import annotations
+
+from typing import Any, Iterator
+
+import numpy as np
+import pandas as pd
+
+from .batch import BatchResult, parse_batch
+from .normalize import IDInput
+from .registry import VALIDATORS
+
+
+def _as_strings(values: np.ndarray) -> list[IDInput]:
+    out: list[IDInput] = []
+    for v in values:
+        if isinstance(v, (str, bytes, bytearray, memoryview)):
+            out.append(v)
+        elif v is None or (isinstance(v, float) and v != v):
+            out.append("")
+        else:
+            out.append(str(v))
+    return out
+
+
+def _column(result: BatchResult, name: str) -> Any:
+    col = result.columns[name]
+    if name in result.categories:
+        return pd.Categorical.from_codes(col, categories=list(result.categories[name]))
+    if col.ndim == 2:
+        out = np.empty(len(col), dtype=object)
+        out[:] = [None if (row < 0).any() else tuple(int(x) for x in row) for row in col]
+        return out
+    if col.dtype.kind == "b":
+        return pd.arrays.BooleanArray(col, ~result.valid)
+    if col.dtype.kind in "iu":
+        return pd.arrays.IntegerArray(col.astype(np.int64), col < 0)
+    if col.dtype.kind == "U":
+        return np.where(col == "", None, col.astype(object))
+    return col
+
+
+def _frame(result: BatchResult, index: Any) -> pd.DataFrame:
+    data: dict[str, Any] = {"valid": result.valid}
+    for name in ("id_type", "dob", "gender"):
+        if name in result.columns:
+            data[name] = _column(result, name)
+    for name in result.columns:
+        if name not in data:
+            data[name] = _column(result, name)
+    return pd.DataFrame(data, index=index)
+
+
+@pd.api.extensions.register_series_accessor("idv")
+class IdValidationAccessor:
+    """Validation and extraction for a Series of ID numbers."""
+
+    def __init__(self, series: pd.Series) -> None:
+        self._series = series
+
+    def _groups(self, country: str | pd.Series | Any) -> Iterator[tuple[str | None, np.ndarray]]:
+        """Yield (country code or None if unknown, row positions) groups."""
+        n = len(self._series)
+        if isinstance(country, str):
+            yield (country if country in VALIDATORS else None), np.arange(n)
+            return
+
+        if isinstance(country, pd.Series):
+            countries = country.reindex(self._series.index)
+        else:
+            countries = pd.Series(np.asarray(country, dtype=object), index=self._series.index)
+        codes, uniques = pd.factorize(countries)
+        order = np.argsort(codes, kind="stable")
+        counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+        # factorize marks missing countries as -1; they sort first.
+        start = int((codes < 0).sum())
+        if start:
+            yield None, order[:start]
+        for code, count in zip(uniques, counts):
+            positions = order[start : start + count]
+            start += count
+            yield (code if code in VALIDATORS else None), positions
+
+    def validate(self, country: str | pd.Series | Any) -> pd.Series:
+        """Boolean Series: whether each ID is valid for its country."""
+        values = self._series.to_numpy(dtype=object)
+        valid = np.zeros(len(values), dtype=bool)
+        for code, positions in self._groups(country):
+            if code is None or not len(positions):
+                continue
+            valid[positions] = parse_batch(code, _as_strings(values[positions])).valid
+        return pd.Series(valid, index=self._series.index, name=self._series.name)
+
+    def parse(self, country: str | pd.Series | Any) -> pd.DataFrame:
+        """DataFrame with ``valid``, ``id_type``, ``dob``, ``gender`` and country-specific columns.
+
+        Decoded columns are missing (NA) for invalid rows.
+        """
+        values = self._series.to_numpy(dtype=object)
+        frames = []
+        for code, positions in self._groups(country):
+            if not len(positions):
+                continue
+            if code is None:
+                frames.append(pd.DataFrame({"valid": np.zeros(len(positions), dtype=bool)}, index=positions))
+                continue
+            result = parse_batch(code, _as_strings(values[positions]))
+            frames.append(_frame(result, positions))
+
+        if not frames:
+            return pd.DataFrame({"valid": pd.Series(dtype=bool)}, index=self._series.index)
+        if len(frames) == 1:
+            out = frames[0]
+        else:
+            out = pd.concat(frames).sort_index()
+        out.index = self._series.index
+        return out
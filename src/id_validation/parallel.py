@@ -0,0 +1,288 @@
+"""Multi-process batch validation over shared memory.
+
+``validate_parallel(country_code, ids, workers=4)`` normalizes the column once
+in the calling process. It packs the UTF-8 bytes into a
+``multiprocessing.shared_memory`` block: fixed-width rows plus a length column.
+Worker processes attach to the block once, when they start. Each task is only a
+``(start, stop)`` row range. Workers run the country's batch kernel
+(``id_validation.validators.kernels``) over their rows and write three shared
+output arrays:
+
+- ``valid``: the validity mask.
+- ``reason``: a ``Reason`` code.
+- ``dob``: the date of birth as days since 1970-01-01.
+
+No input or per-row result is pickled. Countries without a kernel use the scalar
+``parse`` in the workers.
+
+``parsed=True`` also returns a ``ParsedID`` (or ``None``) per row. Each worker
+sends these back as one ``id_validation.wire`` buffer per range.
+
+Rows are as wide as the longest form of the format: the kernel's widest, or the
+validator's ``max_length`` (``MAX_WIDTH`` if it declares none). Longer rows are
+marked ``Reason.LENGTH`` in the calling process and not packed, so one garbage
+value cannot blow up the shared block.
+
+Requires NumPy (``pip install id-validation[batch]``).
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from enum import IntEnum
+from multiprocessing import shared_memory
+from typing import Any, Optional, Sequence
+
+import numpy as np
+
+from .batch import _default_pool, _parse_normalized
+from .normalize import IDInput
+from .validators.base import ParsedID
+from .validators.kernels import KERNELS
+from .wire import decode_batch, encode_batch
+
+
+# Missing date of birth in the ``dob`` days column.
+NO_DOB = np.iinfo(np.int32).min
+# Row width for validators that declare neither a kernel nor ``max_length``.
+MAX_WIDTH = 64
+
+
+class Reason(IntEnum):
+    VALID = 0
+    LENGTH = 1  # Normalized length is not one the format allows.
+    INVALID = 2  # Right length, but rejected (characters, checksum, date, ...).
+
+
+@dataclass
+class ParallelResult:
+    country_code: str
+    valid: np.ndarray
+    reason: np.ndarray
+    dob_days: np.ndarray
+    parsed: Optional[list[Optional[ParsedID]]] = None
+
+    def __len__(self) -> int:
+        return len(self.valid)
+
+    @property
+    def dob(self) -> np.ndarray:
+        """``dob_days`` as ``datetime64[D]`` with ``NaT`` where missing."""
+        out = self.dob_days.astype("datetime64[D]")
+        out[self.dob_days == NO_DOB] = np.datetime64("NaT")
+        return out
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """Attach to a block owned by the parent, which alone unlinks it."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # type: ignore[call-arg]
+    except TypeError:  # Python < 3.13: workers share the parent's resource tracker, so attaching is harmless.
+        return shared_memory.SharedMemory(name=name)
+
+
+class _Block:
+    """Input rows and output columns laid out in one shared memory block."""
+
+    def __init__(self, shm: shared_memory.SharedMemory, n: int, width: int) -> None:
+        self.shm = shm
+        buf = shm.buf
+        offset = 0
+
+        def take(dtype: Any, shape: tuple[int, ...]) -> np.ndarray:
+            nonlocal offset
+            array = np.ndarray(shape, dtype=dtype, buffer=buf, offset=offset)
+            offset += array.nbytes
+            return array
+
+        self.dob_days = take(np.int32, (n,))
+        self.lengths = take(np.int32, (n,))
+        self.valid = take(np.bool_, (n,))
+        self.reason = take(np.uint8, (n,))
+        self.matrix = take(np.uint8, (n, width))
+
+    @staticmethod
+    def size(n: int, width: int) -> int:
+        return max(1, n * (4 + 4 + 1 + 1 + width))
+
+
+def reasons(country_code: str, lengths: np.ndarray, valid: np.ndarray) -> np.ndarray:
+    """``Reason`` code per row, from the UTF-8 length of its normalized ID and its validity.
+
+    A row is ``LENGTH`` if no form of the format has that length (any non-empty
+    length, for countries without a kernel), else ``INVALID`` unless valid.
+    """
+    k = KERNELS.get(country_code)
+    fits = np.isin(lengths, k.widths) if k is not None else lengths > 0
+    out = np.where(fits, Reason.INVALID, Reason.LENGTH).astype(np.uint8)
+    out[valid] = Reason.VALID
+    return out
+
+
+def encoded_lengths(normalized: Sequence[str]) -> np.ndarray:
+    """UTF-8 length of each normalized ID, as ``reasons`` expects."""
+    if all(map(str.isascii, normalized)):
+        return np.fromiter(map(len, normalized), dtype=np.int64, count=len(normalized))
+    return np.fromiter((len(v.encode("utf-8")) for v in normalized), dtype=np.int64, count=len(normalized))
+
+
+# Set in each worker by _init_worker.
+_state: dict[str, Any] = {}
+
+
+def _init_worker(name: str, n: int, width: int, country_code: str, parsed: bool) -> None:
+    _state.update(
+        block=_Block(_attach(name), n, width),
+        country_code=country_code,
+        parsed=parsed,
+    )
+
+
+def _run_range(start: int, stop: int) -> Optional[bytes]:
+    block: _Block = _state["block"]
+    return _process(block, _state["country_code"], start, stop, _state["parsed"])
+
+
+def _process(block: _Block, country_code: str, start: int, stop: int, parsed: bool) -> Optional[bytes]:
+    """Validate rows ``start:stop`` of ``block`` in place; returns a wire buffer if ``parsed``."""
+    lengths = block.lengths[start:stop]
+    matrix = block.matrix[start:stop]
+    valid = block.valid[start:stop]
+    reason = block.reason[start:stop]
+    dob_days = block.dob_days[start:stop]
+    valid[:] = False
+    dob_days[:] = NO_DOB
+
+    k = KERNELS.get(country_code)
+    if k is not None and not parsed:
+        ascii_rows = (matrix < 128).all(axis=1)
+        for width in k.widths:
+            rows = np.flatnonzero((lengths == width) & ascii_rows)
+            if not len(rows):
+                continue
+            result = k.func(np.ascontiguousarray(matrix[rows, :width]))
+            valid[rows] = result.valid
+            if "dob" in result.columns:
+                days = result.columns["dob"].astype(np.int64)
+                dob_days[rows] = np.where(result.valid & (days != np.iinfo(np.int64).min), days, NO_DOB)
+        reason[:] = reasons(country_code, lengths, valid)
+        return None
+
+    validator = _default_pool.get(country_code)
+    rows_bytes = matrix.tobytes()
+    width = matrix.shape[1]
+    normalized = [
+        rows_bytes[i * width : i * width + length].decode("utf-8") for i, length in enumerate(lengths.tolist())
+    ]
+    result = _parse_normalized(country_code, validator, normalized)  # type: ignore[arg-type]
+    valid[:] = result.valid
+    if "dob" in result.columns:
+        days = result.columns["dob"].astype(np.int64)
+        dob_days[:] = np.where(valid & (days != np.iinfo(np.int64).min), days, NO_DOB)
+    reason[:] = reasons(country_code, lengths, valid)
+    if parsed:
+        return encode_batch([result.to_parsed(i) for i in range(len(normalized))])
+    return None
+
+
+def _pack(normalized: list[str], block: _Block, width: int) -> None:
+    n = len(normalized)
+    joined = "".join(normalized)
+    if not joined.isascii():
+        encoded = [v.encode("utf-8") for v in normalized]
+        block.lengths[:] = np.fromiter(map(len, encoded), dtype=np.int32, count=n)
+        if width:
+            packed = b"".join(e[:width].ljust(width, b"\0") for e in encoded)
+            block.matrix[:] = np.frombuffer(packed, dtype=np.uint8).reshape(-1, width)
+        return
+    lengths = np.fromiter(map(len, normalized), dtype=np.int32, count=n)
+    block.lengths[:] = lengths
+    data = np.frombuffer(joined.encode("ascii"), dtype=np.uint8)
+    if len(data) == n * width:
+        block.matrix[:] = data.reshape(n, width)  # every row already has the full width
+        return
+    # Scatter each row's bytes into its fixed-width slot; the rest stays zero.
+    starts = np.concatenate(([0], np.cumsum(lengths[:-1], dtype=np.int64)))
+    columns = np.arange(width)
+    keep = columns < lengths[:, None]
+    block.matrix[:] = 0
+    block.matrix[keep] = data[(starts[:, None] + columns)[keep]]
+
+
+def _row_width(country_code: str, validator: Any, normalized: Sequence[str]) -> tuple[int, np.ndarray]:
+    """Packed row width for ``normalized``, and the rows too long for the format."""
+    k = KERNELS.get(country_code)
+    limit = max(k.widths) if k is not None else getattr(validator, "max_length", None) or MAX_WIDTH
+    sizes = encoded_lengths(normalized)
+    fits = sizes <= limit
+    width = limit if k is not None else int(sizes[fits].max(initial=0))
+    return width, np.flatnonzero(~fits)
+
+
+def parse_parallel(
+    country_code: str,
+    ids: Sequence[IDInput],
+    *,
+    workers: int | None = None,
+    chunk_size: int = 65536,
+    parsed: bool = False,
+) -> ParallelResult:
+    """Validate ``ids`` across ``workers`` processes (default: the CPU count).
+
+    With one worker, or input no larger than ``chunk_size``, everything runs in
+    the calling process over the same packed layout.
+
+    Raises:
+        ValueError: If no validator is registered for ``country_code``.
+    """
+    validator = _default_pool.get(country_code)
+    normalized = validator.normalize_many(ids)  # type: ignore[attr-defined]
+    n = len(normalized)
+    width, overlong = _row_width(country_code, validator, normalized)
+    if len(overlong):
+        normalized = list(normalized)
+        for i in overlong.tolist():
+            normalized[i] = ""
+    workers = workers or os.cpu_count() or 1
+    ranges = [(start, min(start + chunk_size, n)) for start in range(0, n, chunk_size)]
+
+    shm = shared_memory.SharedMemory(create=True, size=_Block.size(n, width))
+    block = None
+    try:
+        block = _Block(shm, n, width)
+        _pack(normalized, block, width)
+        if workers == 1 or len(ranges) <= 1:
+            buffers = [_process(block, country_code, start, stop, parsed) for start, stop in ranges]
+        else:
+            with ProcessPoolExecutor(
+                max_workers=min(workers, len(ranges)),
+                initializer=_init_worker,
+                initargs=(shm.name, n, width, country_code, parsed),
+            ) as executor:
+                buffers = list(executor.map(_run_range, *zip(*ranges)))
+        result = ParallelResult(
+            country_code=country_code,
+            valid=block.valid.copy(),
+            reason=block.reason.copy(),
+            dob_days=block.dob_days.copy(),
+        )
+        if parsed:
+            result.parsed = [p for buffer in buffers for p in decode_batch(buffer)]  # type: ignore[arg-type]
+        result.valid[overlong] = False
+        result.reason[overlong] = Reason.LENGTH
+        result.dob_days[overlong] = NO_DOB
+        if result.parsed is not None:
+            for i in overlong.tolist():
+                result.parsed[i] = None
+    finally:
+        block = None  # release the views before closing
+        shm.close()
+        shm.unlink()
+    return result
+
+
+def validate_parallel(country_code: str, ids: Sequence[IDInput], *, workers: int | None = None) -> np.ndarray:
+    """Boolean validity mask for ``ids``, computed across worker processes."""
+    return parse_parallel(country_code, ids, workers=workers).valid
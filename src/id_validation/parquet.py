@@ -0,0 +1,249 @@
+"""Streaming Parquet output for bulk validation, partitioned by country.
+
+``write_parquet(root, ids, countries)`` reads ``ids`` in chunks. Each chunk is
+validated with one batch pass per country, converted with
+``id_validation.arrow.to_record_batch`` and appended to that country's dataset
+directory::
+
+    root/country_code=PL/part-00000.parquet
+    root/country_code=ZA/part-00000.parquet
+
+This is the Hive layout, so ``pyarrow.dataset.dataset(root, partitioning="hive")``,
+Spark and DuckDB read ``country_code`` back as a column. Each file has:
+
+- ``row``: the position of the ID in the input.
+- ``id_number``: the normalized ID.
+- ``valid``.
+- The country's typed result columns: ``dob`` as ``date32``, ``gender``,
+  ``id_type`` and region or category names as dictionaries, and so on.
+
+Rows are buffered per country and written as one row group once
+``row_group_size`` are pending. Memory therefore stays bounded by about
+``row_group_size`` rows per country plus one input chunk, however long the input
+is. Countries with a batch kernel never build ``ParsedID`` objects. The others
+go through ``parse`` a chunk at a time, as in ``parse_batch``.
+
+A validator without a kernel only reports its extra fields for valid rows. If a
+later chunk brings a column the open file does not have, the file is closed and
+the country continues in the next ``part-NNNNN.parquet``.
+
+Requires pyarrow and NumPy (``pip install id-validation[arrow]``).
+"""
+
+from __future__ import annotations
+
+import os
+from itertools import islice
+from typing import Any, Iterable, Optional, Sequence, Union
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from .arrow import to_record_batch
+from .batch import group_rows, parse_batch
+from .blocklist import Blocklist
+from .normalize import IDInput
+from .pool import ValidatorPool
+
+
+def _conform(table: pa.Table, schema: pa.Schema) -> Optional[pa.Table]:
+    """``table`` cast to ``schema`` (missing or all-null columns filled), or None if it does not fit."""
+    for name in table.column_names:
+        if name not in schema.names and not pa.types.is_null(table.schema.field(name).type):
+            return None
+    columns = []
+    for f in schema:
+        if f.name not in table.column_names:
+            columns.append(pa.nulls(len(table), f.type))
+            continue
+        col = table.column(f.name)
+        if col.type == f.type:
+            columns.append(col)
+        elif pa.types.is_null(col.type):
+            columns.append(pa.nulls(len(table), f.type))
+        else:
+            return None
+    return pa.Table.from_arrays(columns, schema=schema)
+
+
+def _unify(tables: Sequence[pa.Table]) -> pa.Schema:
+    try:
+        return pa.unify_schemas([t.schema for t in tables], promote_options="default")
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return tables[0].schema
+
+
+class _Partition:
+    """Pending tables and the open file of one country."""
+
+    def __init__(self, directory: str, row_group_size: int, compression: str) -> None:
+        self.directory = directory
+        self.row_group_size = row_group_size
+        self.compression = compression
+        self.writer: Optional[pq.ParquetWriter] = None
+        self.part = -1
+        self.pending: list[pa.Table] = []
+        self.pending_rows = 0
+        self.rows_written = 0
+
+    def add(self, table: pa.Table) -> None:
+        self.pending.append(table)
+        self.pending_rows += len(table)
+        if self.pending_rows >= self.row_group_size:
+            self.flush()
+
+    def _open(self, schema: pa.Schema) -> None:
+        self.close()
+        self.part += 1
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, f"part-{self.part:05d}.parquet")
+        self.writer = pq.ParquetWriter(path, schema, compression=self.compression)
+
+    def _write(self, run: list[pa.Table]) -> None:
+        if run:
+            table = pa.concat_tables(run)
+            self.writer.write_table(table, row_group_size=len(table))  # type: ignore[union-attr]
+            self.rows_written += len(table)
+
+    def flush(self) -> None:
+        tables, self.pending, self.pending_rows = self.pending, [], 0
+        if not tables:
+            return
+        if self.writer is None:
+            self._open(_unify(tables))
+        run: list[pa.Table] = []
+        for table in tables:
+            conformed = _conform(table, self.writer.schema)  # type: ignore[union-attr]
+            if conformed is None:
+                self._write(run)
+                run = []
+                self._open(_unify([table]))
+                conformed = _conform(table, self.writer.schema)  # type: ignore[union-attr]
+            run.append(conformed)
+        self._write(run)
+
+    def close(self) -> None:
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+
+
+class PartitionedParquetWriter:
+    """Append validation results to a country-partitioned Parquet dataset under ``root``.
+
+    Use as a context manager, or call ``close()`` to flush the last row groups.
+    """
+
+    def __init__(
+        self,
+        root: Union[str, os.PathLike],
+        *,
+        row_group_size: int = 131072,
+        include_invalid: bool = True,
+        compression: str = "zstd",
+        pool: ValidatorPool | None = None,
+        blocklist: Blocklist | None = None,
+    ) -> None:
+        self.root = os.fspath(root)
+        self.row_group_size = row_group_size
+        self.include_invalid = include_invalid
+        self.compression = compression
+        self.pool = pool
+        self.blocklist = blocklist
+        self.rows_seen = 0
+        self._partitions: dict[str, _Partition] = {}
+
+    def __enter__(self) -> PartitionedParquetWriter:
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def write(self, country_code: str, ids: Sequence[IDInput]) -> None:
+        """Validate ``ids`` for one country and append them.
+
+        Raises:
+            ValueError: If no validator is registered for ``country_code``.
+        """
+        rows = np.arange(self.rows_seen, self.rows_seen + len(ids), dtype=np.int64)
+        self.rows_seen += len(ids)
+        self._append(country_code, ids, rows)
+
+    def write_mixed(self, ids: Sequence[IDInput], countries: Sequence[Any]) -> None:
+        """Append ``ids[i]`` validated for ``countries[i]``.
+
+        Rows whose country has no validator are counted in ``row`` but not written.
+
+        Raises:
+            ValueError: If ``ids`` and ``countries`` differ in length.
+        """
+        n = len(ids)
+        if len(countries) != n:
+            raise ValueError(f"ids and countries differ in length ({n} != {len(countries)})")
+        values = np.empty(n, dtype=object)
+        values[:] = list(ids)
+        for code, positions in group_rows(countries):
+            if code is not None:
+                self._append(code, values[positions].tolist(), positions + self.rows_seen)
+        self.rows_seen += n
+
+    def _append(self, country_code: str, ids: Sequence[IDInput], rows: np.ndarray) -> None:
+        result = parse_batch(country_code, ids, pool=self.pool, blocklist=self.blocklist)
+        batch = to_record_batch(result)
+        table = pa.Table.from_batches([batch]).add_column(0, "row", pa.array(rows, type=pa.int64()))
+        table = table.add_column(1, "id_number", pa.array(list(result.id_numbers), type=pa.string()))  # type: ignore[arg-type]
+        if not self.include_invalid:
+            table = table.filter(pa.array(result.valid, type=pa.bool_()))
+        partition = self._partitions.get(country_code)
+        if partition is None:
+            directory = os.path.join(self.root, f"country_code={country_code}")
+            partition = self._partitions[country_code] = _Partition(directory, self.row_group_size, self.compression)
+        partition.add(table)
+
+    @property
+    def rows_written(self) -> dict[str, int]:
+        """Rows written so far per country (pending rows are not counted until flushed)."""
+        return {code: p.rows_written for code, p in self._partitions.items()}
+
+    def close(self) -> dict[str, int]:
+        """Flush pending rows, close every file and return ``rows_written``."""
+        for partition in self._partitions.values():
+            partition.flush()
+            partition.close()
+        return self.rows_written
+
+
+def write_parquet(
+    root: Union[str, os.PathLike],
+    ids: Iterable[IDInput],
+    countries: Union[str, Iterable[Any]],
+    *,
+    chunk_size: int = 65536,
+    **options: Any,
+) -> dict[str, int]:
+    """Validate a stream of IDs into a Parquet dataset partitioned by country.
+
+    ``countries`` is one country code for every row, or an iterable aligned
+    with ``ids``. Both are consumed ``chunk_size`` rows at a time. ``options``
+    go to ``PartitionedParquetWriter``. Returns the rows written per country.
+
+    Raises:
+        ValueError: If a single ``countries`` code has no validator, or ``ids``
+            and ``countries`` differ in length.
+    """
+    with PartitionedParquetWriter(root, **options) as writer:
+        id_iter = iter(ids)
+        country_iter = None if isinstance(countries, str) else iter(countries)
+        while True:
+            chunk = list(islice(id_iter, chunk_size))
+            if country_iter is None:
+                if not chunk:
+                    break
+                writer.write(countries, chunk)  # type: ignore[arg-type]
+                continue
+            codes = list(islice(country_iter, chunk_size))
+            if not chunk and not codes:
+                break
+            writer.write_mixed(chunk, codes)
+    return writer.rows_written
@@ -0,0 +1,39 @@
+"""Reusable validator instances.
+
+Validators are stateless apart from their constructor options, so bulk callers can
+share one instance per country instead of calling ``ValidatorFactory.get_validator``
+for every row.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from .registry import get as _get_validator_type
+from .validate import Validator
+
+
+class ValidatorPool:
+    """Lazily creates and caches one validator per (country code, options)."""
+
+    def __init__(self) -> None:
+        self._validators: dict[tuple[str, tuple[tuple[str, Any], ...]], Validator] = {}
+
+    def get(self, country_code: str, **kwargs: Any) -> Validator:
+        """Return the pooled validator, creating it on first use.
+
+        Raises:
+            ValueError: If no validator is registered for ``country_code``.
+        """
+        key = (country_code, tuple(sorted(kwargs.items())))
+        validator = self._validators.get(key)
+        if validator is None:
+            validator = _get_validator_type(country_code)(**kwargs)
+            self._validators[key] = validator
+        return validator
+
+    def __contains__(self, country_code: str) -> bool:
+        return any(code == country_code for code, _ in self._validators)
+
+    def clear(self) -> None:
+        self._validators.clear()
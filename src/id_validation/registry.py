@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
+
 from .validate import Validator
 
 
@@ -20,3 +22,48 @@ def get(country_code: str) -> type[Validator]:
     if country_code not in VALIDATORS:
         raise ValueError("No validator for country code: " + country_code)
     return VALIDATORS[country_code]
+
+
+@dataclass(frozen=True)
+class Signature:
+    """Cheap shape of a normalized ID, used to route it to its document type.
+
+    An ID matches if its length is one of ``lengths`` and its first character is
+    in ``first``. Everything else is left to the document type's ``parse``.
+    """
+
+    lengths: tuple[int, ...]
+    first: str
+
+    def keys(self) -> list[tuple[int, str]]:
+        return [(n, ch) for n in self.lengths for ch in self.first]
+
+
+@dataclass(frozen=True)
+class DocumentType:
+    country_code: str
+    id_type: str
+    signature: Signature
+    validator: type[Validator]
+
+
+# Document types per country, in registration order (e.g. ES: DNI, NIE, CIF).
+DOCUMENT_TYPES: dict[str, dict[str, DocumentType]] = {}
+
+
+def register_document(country_code: str, id_type: str, signature: Signature):
+    """Class decorator to register one document type of a country with several.
+
+    The country itself is registered with ``register`` as a ``CompositeValidator``,
+    which routes each ID to the document type whose signature it matches.
+    """
+
+    def _decorator(cls: type[Validator]) -> type[Validator]:
+        DOCUMENT_TYPES.setdefault(country_code, {})[id_type] = DocumentType(country_code, id_type, signature, cls)
+        return cls
+
+    return _decorator
+
+
+def document_types(country_code: str) -> list[DocumentType]:
+    return list(DOCUMENT_TYPES.get(country_code, {}).values())
@@ -0,0 +1,240 @@
+"""Typo-correction suggestions for ID numbers that fail validation.
+
+Candidates are single-character substitutions and adjacent transpositions of the
+normalized ID. They are ranked by a small keyboard/OCR confusion model so that
+the most plausible keying error comes first.
+
+Validators whose checksum is a weighted sum over digit positions can declare a
+``ChecksumSpec``; the candidate digits are then solved from the checksum residue
+instead of trying every digit at every position.
+"""
+
+from __future__ import annotations
+
+import string
+from dataclasses import dataclass, field
+from operator import getitem, itemgetter
+from typing import Callable, Iterable, Sequence
+
+
+_DIGITS = string.digits
+_FALLBACK_ALPHABET = string.digits + string.ascii_uppercase
+
+# Numeric keypad layout (7 8 9 / 4 5 6 / 1 2 3 / 0) and the top row of a keyboard.
+_KEYPAD_ROWS = ("789", "456", "123", "0")
+_TOP_ROW = "1234567890"
+
+# Characters commonly confused by OCR engines and by people reading handwriting.
+_OCR_GROUPS = ("0ODQ", "1IL7", "2Z", "5S", "6G", "8B", "9G", "4A", "UV")
+
+_SUBSTITUTION_COST = 1.0
+_KEYBOARD_COST = 0.5
+_OCR_COST = 0.4
+_TRANSPOSITION_COST = 0.3
+
+
+def _keypad_neighbours() -> set[tuple[str, str]]:
+    pos: dict[str, tuple[int, int]] = {}
+    for r, row in enumerate(_KEYPAD_ROWS):
+        for c, ch in enumerate(row):
+            pos[ch] = (r, c)
+    pairs = set()
+    for a, (ra, ca) in pos.items():
+        for b, (rb, cb) in pos.items():
+            if a != b and abs(ra - rb) <= 1 and abs(ca - cb) <= 1:
+                pairs.add((a, b))
+    for a, b in zip(_TOP_ROW, _TOP_ROW[1:]):
+        pairs.add((a, b))
+        pairs.add((b, a))
+    return pairs
+
+
+def _ocr_pairs() -> set[tuple[str, str]]:
+    pairs = set()
+    for group in _OCR_GROUPS:
+        for a in group:
+            for b in group:
+                if a != b:
+                    pairs.add((a, b))
+    return pairs
+
+
+_KEYBOARD_PAIRS = _keypad_neighbours()
+_OCR_PAIRS = _ocr_pairs()
+
+
+def substitution_cost(observed: str, candidate: str) -> float:
+    """Cost of reading ``candidate`` where ``observed`` was keyed (lower is more likely)."""
+    if (observed, candidate) in _OCR_PAIRS:
+        return _OCR_COST
+    if (observed, candidate) in _KEYBOARD_PAIRS:
+        return _KEYBOARD_COST
+    return _SUBSTITUTION_COST
+
+
+@dataclass(frozen=True)
+class ChecksumSpec:
+    """Weighted-sum checksum over an all-digit ID of fixed length.
+
+    Each body position contributes ``contributions[j][digit]`` to a running sum;
+    ``check_values[sum % modulus]`` is the expected check digit (``None`` when
+    that residue cannot produce a valid ID).
+    """
+
+    length: int
+    modulus: int
+    contributions: tuple[tuple[int, ...], ...]
+    check_values: tuple[int | None, ...]
+    check_index: int = -1
+
+    # residue table: _inverse[j][residue] -> digits whose contribution is that residue
+    _inverse: tuple[tuple[tuple[int, ...], ...], ...] = field(init=False, repr=False, compare=False)
+    _targets: tuple[tuple[int, ...], ...] = field(init=False, repr=False, compare=False)
+    _body: tuple[int, ...] = field(init=False, repr=False, compare=False)
+    _pick: Callable[[Sequence[int]], tuple[int, ...]] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        check_index = self.check_index % self.length
+        object.__setattr__(self, "check_index", check_index)
+        body = tuple(i for i in range(self.length) if i != check_index)
+        if len(body) != len(self.contributions):
+            raise ValueError("contributions must cover every non-check position")
+        if len(self.check_values) != self.modulus:
+            raise ValueError("check_values must have one entry per residue")
+
+        inverse = []
+        for table in self.contributions:
+            by_residue: list[list[int]] = [[] for _ in range(self.modulus)]
+            for d, c in enumerate(table):
+                by_residue[c % self.modulus].append(d)
+            inverse.append(tuple(tuple(x) for x in by_residue))
+
+        targets: list[list[int]] = [[] for _ in range(10)]
+        for r, c in enumerate(self.check_values):
+            if c is not None:
+                targets[c].append(r)
+
+        object.__setattr__(self, "_inverse", tuple(inverse))
+        object.__setattr__(self, "_targets", tuple(tuple(t) for t in targets))
+        object.__setattr__(self, "_body", body)
+        object.__setattr__(self, "_pick", itemgetter(*body) if len(body) > 1 else lambda d: (d[body[0]],))
+
+    @classmethod
+    def weighted(
+        cls,
+        weights: Sequence[int],
+        modulus: int,
+        check: Callable[[int], int | None],
+    ) -> ChecksumSpec:
+        """Spec for ``check(sum(w_i * d_i) % modulus)`` with the check digit last."""
+        contributions = tuple(tuple((w * d) % modulus for d in range(10)) for w in weights)
+        return cls(
+            length=len(weights) + 1,
+            modulus=modulus,
+            contributions=contributions,
+            check_values=tuple(check(r) for r in range(modulus)),
+        )
+
+    @classmethod
+    def luhn(cls, length: int) -> ChecksumSpec:
+        """Luhn mod-10 spec with the check digit last."""
+        plain = tuple(range(10))
+        doubled = tuple(sum(divmod(d * 2, 10)) for d in range(10))
+        # Doubling starts with the digit immediately left of the check digit.
+        contributions = tuple(doubled if (length - 2 - i) % 2 == 0 else plain for i in range(length - 1))
+        return cls(
+            length=length,
+            modulus=10,
+            contributions=contributions,
+            check_values=tuple((10 - r) % 10 for r in range(10)),
+        )
+
+    @property
+    def body(self) -> tuple[int, ...]:
+        """Positions that contribute to the sum (every position but the check digit)."""
+        return self._body
+
+    def applies_to(self, v: str) -> bool:
+        return len(v) == self.length and v.isdigit()
+
+    def residue(self, digits: Sequence[int]) -> int:
+        return sum(map(getitem, self.contributions, self._pick(digits))) % self.modulus
+
+    def expected(self, digits: Sequence[int]) -> int | None:
+        """Check digit implied by the body of ``digits`` (``None`` if no digit is valid)."""
+        return self.check_values[self.residue(digits)]
+
+    def solve(self, v: str) -> Iterable[tuple[str, float]]:
+        """Yield ``(candidate, cost)`` pairs satisfying the checksum for an all-digit ``v``."""
+        digits = [ord(ch) - 48 for ch in v]
+        m = self.modulus
+        r = self.residue(digits)
+        check_index = self.check_index
+        c = digits[check_index]
+
+        # Substitutions of the check digit itself.
+        expected = self.check_values[r]
+        if expected is not None and expected != c:
+            yield _replace(v, check_index, expected), substitution_cost(v[check_index], _DIGITS[expected])
+
+        # Substitutions of a body digit: solve contribution == target - rest (mod m).
+        targets = self._targets[c]
+        for j, p in enumerate(self._body):
+            d = digits[p]
+            rest = r - self.contributions[j][d]
+            inverse = self._inverse[j]
+            for t in targets:
+                for d2 in inverse[(t - rest) % m]:
+                    if d2 != d:
+                        yield _replace(v, p, d2), substitution_cost(v[p], _DIGITS[d2])
+
+        # Adjacent transpositions: only two contributions change.
+        position_of = {p: j for j, p in enumerate(self._body)}
+        for p in range(self.length - 1):
+            a, b = digits[p], digits[p + 1]
+            if a == b:
+                continue
+            new_r = r
+            new_c = c
+            for q, old, new in ((p, a, b), (p + 1, b, a)):
+                if q == check_index:
+                    new_c = new
+                else:
+                    table = self.contributions[position_of[q]]
+                    new_r += table[new] - table[old]
+            if self.check_values[new_r % m] == new_c:
+                yield v[:p] + v[p + 1] + v[p] + v[p + 2 :], _TRANSPOSITION_COST
+
+
+def _replace(v: str, index: int, digit: int) -> str:
+    return v[:index] + _DIGITS[digit] + v[index + 1 :]
+
+
+def _brute_force(v: str, alphabet: str) -> Iterable[tuple[str, float]]:
+    for i, ch in enumerate(v):
+        for ch2 in alphabet:
+            if ch2 != ch:
+                yield v[:i] + ch2 + v[i + 1 :], substitution_cost(ch, ch2)
+    for i in range(len(v) - 1):
+        if v[i] != v[i + 1]:
+            yield v[:i] + v[i + 1] + v[i] + v[i + 2 :], _TRANSPOSITION_COST
+
+
+def rank_candidates(
+    v: str,
+    spec: ChecksumSpec | None,
+    is_valid: Callable[[str], bool],
+) -> list[str]:
+    """Return valid single-edit corrections of normalized ``v``, most plausible first."""
+    if spec is not None and spec.applies_to(v):
+        candidates = spec.solve(v)
+    else:
+        candidates = _brute_force(v, _FALLBACK_ALPHABET)
+
+    best: dict[str, float] = {}
+    for candidate, cost in candidates:
+        if cost < best.get(candidate, float("inf")):
+            best[candidate] = cost
+
+    ranked = sorted(best.items(), key=lambda item: (item[1], item[0]))
+    return [candidate for candidate, _ in ranked if is_valid(candidate)]
@@ -4,6 +4,8 @@ import datetime as _dt
 import re
 from typing import Any
 
+from .incremental import Shape
+from .normalize import IDInput, Normalizer
 from .registry import register
 from .validate import ValidationError
 from .validators.base import BaseValidator, ParsedID
@@ -26,11 +28,10 @@ class BelgiumNRNValidator(BaseValidator):
     """
 
     country_code = "BE"
+    normalizer = Normalizer(" -.")
+    shape = Shape(_NRN_RE.pattern)
 
-    def normalize(self, id_number: str) -> str:
-        return id_number.strip().replace(" ", "").replace("-", "").replace(".", "")
-
-    def parse(self, id_number: str) -> ParsedID:
+    def parse(self, id_number: IDInput) -> ParsedID:
         v = self.normalize(id_number)
         m = _NRN_RE.match(v)
         if not m:
@@ -1,20 +1,25 @@
 from __future__ import annotations
 
 import logging
-import re
 
+from .layout import Field, GenderDigit, Layout, LayoutValidator
+from .normalize import Normalizer
 from .registry import register
-from .validate import ValidationError
-from .validators.base import BaseValidator, ParsedID
 
-_BOTSWANA_RE = re.compile(r"^\d{9}$")
-_VALID_GENDER_DIGITS = {"1", "2"}
+BOTSWANA_LAYOUT = Layout(
+    country_code="BW",
+    id_type="NATIONAL_ID",
+    length=9,
+    gender=GenderDigit.from_digits(4, {1: "M", 2: "F"}),
+    fields=(Field("gender_digit", 4, 5, kind="str"),),
+    format_error="Invalid Botswana ID format",
+)
 
 logger = logging.getLogger(__name__)
 
 
 @register("BW")
-class BotswanaValidator(BaseValidator):
+class BotswanaValidator(LayoutValidator):
     """Botswana National ID validator.
 
     Warning: This validator has not been validated against official documentation,
@@ -22,32 +27,11 @@ class BotswanaValidator(BaseValidator):
     """
 
     country_code = "BW"
+    normalizer = Normalizer()
+    layout = BOTSWANA_LAYOUT
 
     def __init__(self) -> None:
         logger.warning(
             "The BotswanaValidator has not been validated against official "
             "documentation but only using anecdotal information available online."
         )
-
-    def normalize(self, id_number: str) -> str:
-        return id_number.strip()
-
-    def parse(self, id_number: str) -> ParsedID:
-        v = self.normalize(id_number)
-
-        if not _BOTSWANA_RE.fullmatch(v):
-            raise ValidationError("Invalid Botswana ID format")
-
-        gender_digit = v[4]
-        if gender_digit not in _VALID_GENDER_DIGITS:
-            raise ValidationError("Invalid gender digit")
-
-        gender = "M" if gender_digit == "1" else "F"
-
-        return ParsedID(
-            country_code="BW",
-            id_number=v,
-            id_type="NATIONAL_ID",
-            gender=gender,
-            extra={"gender_digit": gender_digit},
-        )
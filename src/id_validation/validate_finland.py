@@ -4,6 +4,8 @@ import datetime as _dt
 import re
 from typing import Any
 
+from .incremental import Shape
+from .normalize import IDInput, Normalizer
 from .registry import register
 from .validate import ValidationError
 from .validators.base import BaseValidator, ParsedID
@@ -20,11 +22,11 @@ class FinlandHETUValidator(BaseValidator):
     """Finland personal identity code (HETU / henkilötunnus)."""
 
     country_code = "FI"
+    normalizer = Normalizer(" ", upper=True)
+    max_length = 11
+    shape = Shape(_HETU_RE.pattern)
 
-    def normalize(self, id_number: str) -> str:
-        return id_number.strip().upper().replace(" ", "")
-
-    def parse(self, id_number: str) -> ParsedID:
+    def parse(self, id_number: IDInput) -> ParsedID:
         v = self.normalize(id_number)
         m = _HETU_RE.match(v)
         if not m:
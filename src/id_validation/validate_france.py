@@ -4,13 +4,15 @@ import datetime as _dt
 import re
 from typing import Any
 
+from .incremental import Shape
+from .normalize import IDInput, Normalizer
 from .registry import register
 from .validate import ValidationError
 from .validators.base import BaseValidator, ParsedID
 
 
 # Allow 2A/2B department for Corsica in the 13-char body.
-_NIR_RE = re.compile(r"^([12])\s*(\d{2})\s*(\d{2})\s*([0-9AB]{2})\s*(\d{3})\s*(\d{3})\s*(\d{2})$")
+_NIR_RE = re.compile(r"^([12])(\d{2})(\d{2})([0-9AB]{2})(\d{3})(\d{3})(\d{2})$")
 
 
 def _nir_numeric_body(sex: str, yy: str, mm: str, dept: str, commune: str, order: str) -> int:
@@ -39,17 +41,13 @@ class FranceNIRValidator(BaseValidator):
     """
 
     country_code = "FR"
+    normalizer = Normalizer(whitespace=True, upper=True)
+    max_length = 15
+    shape = Shape(_NIR_RE.pattern)
 
-    def normalize(self, id_number: str) -> str:
-        return id_number.strip().upper().replace(" ", "")
-
-    def parse(self, id_number: str) -> ParsedID:
-        raw = id_number.strip().upper()
-        m = _NIR_RE.match(raw)
-        if not m:
-            # Try compact form as well
-            compact = self.normalize(id_number)
-            m = re.match(r"^([12])(\d{2})(\d{2})([0-9AB]{2})(\d{3})(\d{3})(\d{2})$", compact)
+    def parse(self, id_number: IDInput) -> ParsedID:
+        v = self.normalize(id_number)
+        m = _NIR_RE.match(v)
         if not m:
             raise ValidationError("Invalid NIR format")
 
@@ -88,4 +86,4 @@ class FranceNIRValidator(BaseValidator):
             "year": year,
             "month": month,
         }
-        return ParsedID(country_code="FR", id_number=self.normalize(id_number), id_type="NIR", dob=dob, gender=gender, extra=extra)
+        return ParsedID(country_code="FR", id_number=v, id_type="NIR", dob=dob, gender=gender, extra=extra)
@@ -4,13 +4,14 @@ import datetime as _dt
 import re
 from typing import Any
 
+from .belfiore import default_table
+from .incremental import Shape
+from .normalize import IDInput, Normalizer
 from .registry import register
 from .validate import ValidationError
 from .validators.base import BaseValidator, ParsedID
 
 
-_CF_RE = re.compile(r"^[A-Z]{6}\d{2}[A-Z]\d{2}[A-Z]\d{3}[A-Z]$")
-
 _MONTH_MAP = {
     "A": 1,
     "B": 2,
@@ -62,14 +63,45 @@ _EVEN_VALUES = {**{str(i): i for i in range(10)}, **{chr(ord('A') + i): i for i
 
 _CHECK_CHARS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
 
+# Omocodia: when two people would share a code, digits (from the right) are
+# replaced by these letters, standing for 0-9.
+_OMOCODIA = "LMNPQRSTUV"
+
+# Positions of the year, day and municipality number; digits or omocodia letters.
+_NUMERIC_POSITIONS = (6, 7, 9, 10, 12, 13, 14)
+_LETTER_POSITIONS = (0, 1, 2, 3, 4, 5, 8, 11, 15)
+
+_N = "[0-9LMNP-V]"
+_CF_RE = re.compile(rf"^[A-Z]{{6}}{_N}{{2}}[A-Z]{_N}{{2}}[A-Z]{_N}{{3}}[A-Z]$")
+
+_FROM_OMOCODIA = str.maketrans(_OMOCODIA, "0123456789")
+
+
+_ABSENT = 0xFF
+
+
+def _ord_table(mapping: dict[str, int]) -> bytes:
+    """256-entry lookup indexed by byte value; ``_ABSENT`` for characters not in ``mapping``.
+
+    Being ``bytes``, a table doubles as a ``bytes.translate`` map, so the checksum
+    weights of a whole code can be looked up and summed without a Python loop.
+    """
+    table = bytearray([_ABSENT]) * 256
+    for ch, value in mapping.items():
+        table[ord(ch)] = value
+    return bytes(table)
+
+
+_ODD_TABLE = _ord_table(_ODD_VALUES)
+_EVEN_TABLE = _ord_table(_EVEN_VALUES)
+_DIGIT_TABLE = _ord_table({**{str(i): i for i in range(10)}, **{ch: i for i, ch in enumerate(_OMOCODIA)}})
+_LETTER_TABLE = _ord_table({ch: i for i, ch in enumerate(_CHECK_CHARS)})
+_MONTH_TABLE = _ord_table(_MONTH_MAP)
+
 
 def _cf_check_char(cf15: str) -> str:
-    total = 0
-    for idx, ch in enumerate(cf15, start=1):
-        if idx % 2 == 1:  # odd positions (1-indexed)
-            total += _ODD_VALUES[ch]
-        else:
-            total += _EVEN_VALUES[ch]
+    raw = cf15.encode("ascii")
+    total = sum(raw[0::2].translate(_ODD_TABLE)) + sum(raw[1::2].translate(_EVEN_TABLE))
     return _CHECK_CHARS[total % 26]
 
 
@@ -78,31 +110,37 @@ class ItalyCodiceFiscaleValidator(BaseValidator):
     """Italy Codice Fiscale (tax code) validator.
 
     Implements checksum and extracts: dob (year/month/day) and gender.
-    Municipality code is returned but not decoded (requires external table).
+    Omocodic codes (digits replaced by LMNPQRSTUV) are accepted. The
+    municipality code is decoded to the comune (or foreign country) and its
+    province with the packaged Belfiore table; both are None for codes that
+    do not exist. Use strict_municipality=True to reject such codes.
     """
 
     country_code = "IT"
+    normalizer = Normalizer(" ", upper=True)
+    shape = Shape(_CF_RE.pattern)
 
-    def normalize(self, id_number: str) -> str:
-        return id_number.strip().upper().replace(" ", "")
+    def __init__(self, strict_municipality: bool = False):
+        self.strict_municipality = strict_municipality
 
-    def parse(self, id_number: str) -> ParsedID:
+    def parse(self, id_number: IDInput) -> ParsedID:
         cf = self.normalize(id_number)
         if not _CF_RE.match(cf):
             raise ValidationError("Invalid codice fiscale format")
 
-        expected = _cf_check_char(cf[:15])
-        if cf[15] != expected:
+        if cf[15] != _cf_check_char(cf[:15]):
             raise ValidationError("Invalid checksum")
 
-        yy = int(cf[6:8])
-        month_ch = cf[8]
-        day_code = int(cf[9:11])
-        comune = cf[11:15]
+        # Year, day and municipality digits, with omocodia letters decoded.
+        coded = cf[6:8] + cf[9:11] + cf[12:15]
+        numeric = coded.translate(_FROM_OMOCODIA)
+        yy = int(numeric[0:2])
+        day_code = int(numeric[2:4])
+        comune = cf[11] + numeric[4:7]
 
-        if month_ch not in _MONTH_MAP:
+        month = _MONTH_TABLE[ord(cf[8])]
+        if month == _ABSENT:
             raise ValidationError("Invalid month code")
-        month = _MONTH_MAP[month_ch]
 
         gender = "F" if day_code > 40 else "M"
         day = day_code - 40 if day_code > 40 else day_code
@@ -119,8 +157,16 @@ class ItalyCodiceFiscaleValidator(BaseValidator):
         except ValueError as e:
             raise ValidationError("Invalid date") from e
 
+        table = default_table()
+        i = table.index(comune)
+        if i < 0 and self.strict_municipality:
+            raise ValidationError("Unknown municipality code")
+
         extra: dict[str, Any] = {
             "municipality_code": comune,
+            "municipality": table.name(i) if i >= 0 else None,
+            "province": table.province(i) if i >= 0 else None,
             "checksum": cf[15],
+            "omocodic": numeric != coded,
         }
         return ParsedID(country_code="IT", id_number=cf, id_type="CODICE_FISCALE", dob=dob, gender=gender, extra=extra)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from .incremental import Shape
+from .normalize import IDInput, Normalizer
 from .registry import register
 from .validate import ValidationError
 from .validators.base import BaseValidator, ParsedID
@@ -14,11 +16,10 @@ class NigeriaValidator(BaseValidator):
     """
 
     country_code = "NG"
+    normalizer = Normalizer()
+    shape = Shape(r"\d{11}")
 
-    def normalize(self, id_number: str) -> str:
-        return id_number.strip()
-
-    def parse(self, id_number: str) -> ParsedID:
+    def parse(self, id_number: IDInput) -> ParsedID:
         v = self.normalize(id_number)
 
         if len(v) != 11 or not v.isdigit():
@@ -4,6 +4,8 @@ import datetime as _dt
 import re
 from typing import Any
 
+from .incremental import Shape
+from .normalize import IDInput, Normalizer
 from .registry import register
 from .validate import ValidationError
 from .validators.base import BaseValidator, ParsedID
@@ -28,11 +30,10 @@ class NorwayFodselsnummerValidator(BaseValidator):
     """Norway fødselsnummer (national identity number) validator."""
 
     country_code = "NO"
+    normalizer = Normalizer(" ")
+    shape = Shape(_FNR_RE.pattern)
 
-    def normalize(self, id_number: str) -> str:
-        return id_number.strip().replace(" ", "")
-
-    def parse(self, id_number: str) -> ParsedID:
+    def parse(self, id_number: IDInput) -> ParsedID:
         v = self.normalize(id_number)
         m = _FNR_RE.match(v)
         if not m:
@@ -2,9 +2,13 @@ from __future__ import annotations
 
 import datetime as _dt
 from enum import Enum
-from typing import Any
+from functools import cached_property
+from typing import Any, Iterable
 
+from .dates import CenturyGuessed, DateField
+from .normalize import IDInput, Normalizer
 from .registry import register
+from .suggest import ChecksumSpec
 from .validate import ValidationError
 from .validators.base import BaseValidator, ParsedID
 
@@ -37,6 +41,10 @@ class CitizenshipType(Enum):
 _VALID_CITIZENSHIP_VALUES = {c.value for c in CitizenshipType}
 _VALID_RACE_VALUES = {r.value for r in Race}
 
+_CHECKSUM_SPEC = ChecksumSpec.luhn(13)
+_NORMALIZER = Normalizer(" ")
+_DATE_FIELD = DateField(year=(0, 2), month=(2, 4), day=(4, 6), century=CenturyGuessed((1900, 2000)))
+
 
 def _luhn_checksum(id_number: str) -> int:
     """Generate Luhn checksum digit for a 12-digit ID prefix."""
@@ -82,7 +90,7 @@ def _base_parse(id_number: str) -> tuple[str, _dt.date, str, int]:
 
     Returns: (normalized_id, dob, gender, checksum)
     """
-    v = id_number.strip().replace(" ", "")
+    v = _NORMALIZER(id_number)
 
     if len(v) != 13 or not v.isdigit():
         raise SouthAfricaValidationError("Invalid ID format: must be 13 digits")
@@ -97,6 +105,46 @@ def _base_parse(id_number: str) -> tuple[str, _dt.date, str, int]:
     return v, dob, gender, checksum
 
 
+def _post_apartheid_parsed(v: str, dob: _dt.date, gender: str, checksum: int) -> ParsedID:
+    citizenship = CitizenshipType(int(v[10]))
+    return ParsedID(
+        country_code="ZA",
+        id_number=v,
+        id_type="NATIONAL_ID",
+        dob=dob,
+        gender=gender,
+        extra={
+            "citizenship": citizenship.name,
+            "citizenship_code": citizenship.value,
+            "checksum": checksum,
+        },
+    )
+
+
+def _apartheid_parsed(v: str, dob: _dt.date, gender: str, checksum: int) -> ParsedID:
+    citizenship_digit = int(v[10])
+    race = Race(int(v[11]))
+
+    extra: dict[str, Any] = {
+        "race": race.name,
+        "race_code": race.value,
+        "checksum": checksum,
+    }
+
+    if citizenship_digit in _VALID_CITIZENSHIP_VALUES:
+        extra["citizenship"] = CitizenshipType(citizenship_digit).name
+        extra["citizenship_code"] = citizenship_digit
+
+    return ParsedID(
+        country_code="ZA_OLD",
+        id_number=v,
+        id_type="NATIONAL_ID",
+        dob=dob,
+        gender=gender,
+        extra=extra,
+    )
+
+
 @register("ZA")
 class PostApartheidSouthAfricaValidator(BaseValidator):
     """Post-apartheid South African ID validator.
@@ -106,31 +154,17 @@ class PostApartheidSouthAfricaValidator(BaseValidator):
     """
 
     country_code = "ZA"
+    normalizer = _NORMALIZER
+    checksum_spec = _CHECKSUM_SPEC
+    date_field = _DATE_FIELD
 
-    def normalize(self, id_number: str) -> str:
-        return id_number.strip().replace(" ", "")
-
-    def parse(self, id_number: str) -> ParsedID:
+    def parse(self, id_number: IDInput) -> ParsedID:
         v, dob, gender, checksum = _base_parse(id_number)
 
-        citizenship_digit = int(v[10])
-        if citizenship_digit not in _VALID_CITIZENSHIP_VALUES:
+        if int(v[10]) not in _VALID_CITIZENSHIP_VALUES:
             raise SouthAfricaValidationError("Invalid citizenship digit")
 
-        citizenship = CitizenshipType(citizenship_digit)
-
-        return ParsedID(
-            country_code="ZA",
-            id_number=v,
-            id_type="NATIONAL_ID",
-            dob=dob,
-            gender=gender,
-            extra={
-                "citizenship": citizenship.name,
-                "citizenship_code": citizenship_digit,
-                "checksum": checksum,
-            },
-        )
+        return _post_apartheid_parsed(v, dob, gender, checksum)
 
 
 @register("ZA_OLD")
@@ -142,40 +176,101 @@ class ApartheidSouthAfricaValidator(BaseValidator):
     """
 
     country_code = "ZA_OLD"
+    normalizer = _NORMALIZER
+    checksum_spec = _CHECKSUM_SPEC
+    date_field = _DATE_FIELD
 
-    def normalize(self, id_number: str) -> str:
-        return id_number.strip().replace(" ", "")
-
-    def parse(self, id_number: str) -> ParsedID:
+    def parse(self, id_number: IDInput) -> ParsedID:
         v, dob, gender, checksum = _base_parse(id_number)
 
-        citizenship_digit = int(v[10])
-        race_digit = int(v[11])
-
-        if race_digit not in _VALID_RACE_VALUES:
+        if int(v[11]) not in _VALID_RACE_VALUES:
             raise SouthAfricaValidationError("Invalid race digit")
 
-        race = Race(race_digit)
-        citizenship = CitizenshipType(citizenship_digit) if citizenship_digit in _VALID_CITIZENSHIP_VALUES else None
+        return _apartheid_parsed(v, dob, gender, checksum)
 
-        extra: dict[str, Any] = {
-            "race": race.name,
-            "race_code": race_digit,
-            "checksum": checksum,
-        }
-
-        if citizenship is not None:
-            extra["citizenship"] = citizenship.name
-            extra["citizenship_code"] = citizenship_digit
-
-        return ParsedID(
-            country_code="ZA_OLD",
-            id_number=v,
-            id_type="NATIONAL_ID",
-            dob=dob,
-            gender=gender,
-            extra=extra,
-        )
+
+class SouthAfricaClassification:
+    """Which South African ID interpretations an ID number satisfies.
+
+    Returned by ``classify_south_africa``. ``za`` and ``za_old`` are the
+    ``ParsedID`` for each interpretation (``None`` if it is not valid) and are only
+    built on first access.
+    """
+
+    def __init__(
+        self,
+        id_number: str,
+        base: tuple[_dt.date, str, int] | None = None,
+        error: str | None = None,
+    ) -> None:
+        self.id_number = id_number
+        self.error = error
+        self._base = base
+        if base is None:
+            self.za_valid = self.za_old_valid = False
+        else:
+            self.za_valid = int(id_number[10]) in _VALID_CITIZENSHIP_VALUES
+            self.za_old_valid = int(id_number[11]) in _VALID_RACE_VALUES
+
+    def __repr__(self) -> str:
+        return f"SouthAfricaClassification({self.id_number!r}, country_codes={self.country_codes!r})"
+
+    @property
+    def country_codes(self) -> tuple[str, ...]:
+        """Registry codes of the valid interpretations, e.g. ``("ZA", "ZA_OLD")``."""
+        codes = ("ZA",) if self.za_valid else ()
+        return codes + ("ZA_OLD",) if self.za_old_valid else codes
+
+    @cached_property
+    def za(self) -> ParsedID | None:
+        if not self.za_valid:
+            return None
+        return _post_apartheid_parsed(self.id_number, *self._base)  # type: ignore[misc]
+
+    @cached_property
+    def za_old(self) -> ParsedID | None:
+        if not self.za_old_valid:
+            return None
+        return _apartheid_parsed(self.id_number, *self._base)  # type: ignore[misc]
+
+
+def classify_south_africa(id_number: IDInput) -> SouthAfricaClassification:
+    """Check an ID against both the ZA and ZA_OLD rules with a single base parse.
+
+    The Luhn check and date of birth are evaluated once; the citizenship and
+    race digits then decide which interpretations are valid. Never raises for
+    invalid input: ``error`` holds the reason the common checks failed. Bytes
+    that are not valid UTF-8 keep their replacement-decoded form as ``id_number``.
+    """
+    try:
+        v = _NORMALIZER(id_number)
+    except ValidationError as e:
+        return SouthAfricaClassification(bytes(id_number).decode("utf-8", "replace"), error=str(e))
+    try:
+        v, dob, gender, checksum = _base_parse(v)
+    except ValidationError as e:
+        return SouthAfricaClassification(v, error=str(e))
+    return SouthAfricaClassification(v, (dob, gender, checksum))
+
+
+def classify_south_africa_batch(ids: Iterable[IDInput]) -> list[SouthAfricaClassification]:
+    """``classify_south_africa`` over many IDs, classifying each distinct ID once.
+
+    For column-wise results see ``id_validation.batch.parse_south_africa_batch``.
+    """
+    cache: dict[str, SouthAfricaClassification] = {}
+    out = []
+    for id_number in ids:
+        try:
+            v = _NORMALIZER(id_number)  # bytearray/memoryview are unhashable; key on the str form
+        except ValidationError:
+            out.append(classify_south_africa(id_number))  # undecodable bytes: an error result, not cached
+            continue
+        result = cache.get(v)
+        if result is None:
+            result = cache[v] = classify_south_africa(v)
+        out.append(result)
+    return out
 
 
 # Re-export for backwards compatibility
@@ -3,52 +3,127 @@ from __future__ import annotations
 import re
 from typing import Any
 
-from .registry import register
+from .composite import CompositeValidator
+from .incremental import Shape
+from .normalize import IDInput, Normalizer
+from .registry import Signature, register, register_document
 from .validate import ValidationError
 from .validators.base import BaseValidator, ParsedID
 
 
 _DNI_RE = re.compile(r"^(\d{8})([A-Z])$")
 _NIE_RE = re.compile(r"^([XYZ])(\d{7})([A-Z])$")
+_CIF_RE = re.compile(r"^([ABCDEFGHJNPQRSUVW])(\d{7})([0-9A-J])$")
 
 _LETTERS = "TRWAGMYFPDXBNJZSQVHLCKE"
 
+# CIF control characters: the check value as a digit, or as a letter from this table.
+_CIF_CONTROL_LETTERS = "JABCDEFGHI"
+# Organization types whose control character is always a letter / always a digit.
+_CIF_LETTER_CONTROL = set("NPQRSW")
+_CIF_DIGIT_CONTROL = set("ABEH")
 
-@register("ES")
-class SpainDNINIEValidator(BaseValidator):
-    """Spain DNI (Documento Nacional de Identidad) / NIE validator.
+_NORMALIZER = Normalizer(" ", upper=True)
 
-    DNI: 8 digits + letter where letter = digits % 23.
-    NIE: X/Y/Z + 7 digits + letter; X=0,Y=1,Z=2 prefixed for modulo.
-    """
 
-    country_code = "ES"
+def _cif_check_value(digits7: str) -> int:
+    total = 0
+    for i, ch in enumerate(digits7):
+        d = int(ch)
+        if i % 2 == 0:
+            # Odd positions (1st, 3rd, ...) are doubled and their digits summed.
+            total += sum(divmod(2 * d, 10))
+        else:
+            total += d
+    return (10 - total % 10) % 10
 
-    def normalize(self, id_number: str) -> str:
-        return id_number.strip().upper().replace(" ", "")
 
-    def parse(self, id_number: str) -> ParsedID:
-        v = self.normalize(id_number)
+@register_document("ES", "DNI", Signature(lengths=(9,), first="0123456789"))
+class SpainDNIValidator(BaseValidator):
+    """Spain DNI: 8 digits + letter where letter = digits % 23."""
 
+    country_code = "ES"
+    normalizer = _NORMALIZER
+    max_length = 9
+
+    def parse(self, id_number: IDInput) -> ParsedID:
+        v = self.normalize(id_number)
         m = _DNI_RE.match(v)
-        if m:
-            num_s, letter = m.groups()
-            num = int(num_s)
-            expected = _LETTERS[num % 23]
-            if letter != expected:
-                raise ValidationError("Invalid DNI letter")
-            extra: dict[str, Any] = {"number": num, "letter": letter}
-            return ParsedID(country_code="ES", id_number=v, id_type="DNI", extra=extra)
+        if not m:
+            raise ValidationError("Invalid DNI format")
+        num_s, letter = m.groups()
+        num = int(num_s)
+        if letter != _LETTERS[num % 23]:
+            raise ValidationError("Invalid DNI letter")
+        extra: dict[str, Any] = {"number": num, "letter": letter}
+        return ParsedID(country_code="ES", id_number=v, id_type="DNI", extra=extra)
 
+
+@register_document("ES", "NIE", Signature(lengths=(9,), first="XYZ"))
+class SpainNIEValidator(BaseValidator):
+    """Spain NIE: X/Y/Z + 7 digits + letter; X=0,Y=1,Z=2 prefixed for modulo."""
+
+    country_code = "ES"
+    normalizer = _NORMALIZER
+    max_length = 9
+
+    def parse(self, id_number: IDInput) -> ParsedID:
+        v = self.normalize(id_number)
         m = _NIE_RE.match(v)
-        if m:
-            prefix, digits7, letter = m.groups()
-            prefix_map = {"X": "0", "Y": "1", "Z": "2"}
-            num = int(prefix_map[prefix] + digits7)
-            expected = _LETTERS[num % 23]
-            if letter != expected:
-                raise ValidationError("Invalid NIE letter")
-            extra = {"prefix": prefix, "number": num, "letter": letter}
-            return ParsedID(country_code="ES", id_number=v, id_type="NIE", extra=extra)
-
-        raise ValidationError("Invalid DNI/NIE format")
+        if not m:
+            raise ValidationError("Invalid NIE format")
+        prefix, digits7, letter = m.groups()
+        num = int(str("XYZ".index(prefix)) + digits7)
+        if letter != _LETTERS[num % 23]:
+            raise ValidationError("Invalid NIE letter")
+        extra = {"prefix": prefix, "number": num, "letter": letter}
+        return ParsedID(country_code="ES", id_number=v, id_type="NIE", extra=extra)
+
+
+@register_document("ES", "CIF", Signature(lengths=(9,), first="ABCDEFGHJNPQRSUVW"))
+class SpainCIFValidator(BaseValidator):
+    """Spain CIF (tax ID of legal entities): organization letter + 7 digits + control character.
+
+    The first two digits are the province of registration. The control is a
+    Luhn-style value, written as a digit or as a letter (``J`` = 0 ... ``I`` = 9)
+    depending on the organization type.
+    """
+
+    country_code = "ES"
+    normalizer = _NORMALIZER
+    max_length = 9
+
+    def parse(self, id_number: IDInput) -> ParsedID:
+        v = self.normalize(id_number)
+        m = _CIF_RE.match(v)
+        if not m:
+            raise ValidationError("Invalid CIF format")
+        organization, digits7, control = m.groups()
+        value = _cif_check_value(digits7)
+        if control.isdigit():
+            ok = int(control) == value and organization not in _CIF_LETTER_CONTROL
+        else:
+            ok = control == _CIF_CONTROL_LETTERS[value] and organization not in _CIF_DIGIT_CONTROL
+        if not ok:
+            raise ValidationError("Invalid CIF control character")
+        extra = {
+            "organization_type": organization,
+            "province_code": digits7[:2],
+            "number": digits7,
+            "control": control,
+        }
+        return ParsedID(country_code="ES", id_number=v, id_type="CIF", extra=extra)
+
+
+@register("ES")
+class SpainDNINIEValidator(CompositeValidator):
+    """Spain DNI / NIE / CIF validator.
+
+    Routes on the first character: a digit is a DNI, X/Y/Z a NIE and an
+    organization letter a CIF.
+    """
+
+    country_code = "ES"
+    normalizer = _NORMALIZER
+    max_length = 9
+    shape = Shape("|".join(r.pattern for r in (_DNI_RE, _NIE_RE, _CIF_RE)))
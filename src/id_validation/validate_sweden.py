@@ -4,6 +4,8 @@ import datetime as _dt
 import re
 from typing import Any
 
+from .incremental import Shape
+from .normalize import IDInput, Normalizer
 from .registry import register
 from .validate import ValidationError
 from .validators.base import BaseValidator, ParsedID
@@ -34,11 +36,11 @@ class SwedenPersonnummerValidator(BaseValidator):
     """
 
     country_code = "SE"
+    normalizer = Normalizer(" ", upper=True)
+    max_length = 12
+    shape = Shape(_SSN_RE.pattern)
 
-    def normalize(self, id_number: str) -> str:
-        return id_number.strip().upper().replace(" ", "")
-
-    def parse(self, id_number: str) -> ParsedID:
+    def parse(self, id_number: IDInput) -> ParsedID:
         v = self.normalize(id_number)
 
         # Capture separator if present
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import re
 
+from .incremental import Shape
+from .normalize import IDInput, Normalizer
 from .registry import register
 from .validate import ValidationError
 from .validators.base import BaseValidator, ParsedID
@@ -100,9 +102,9 @@ def _extract_parts(id_number: str) -> tuple[str, str, str, str]:
 
 def _validate_checksum(id_number: str) -> bool:
     """Validate the checksum digit using mod 23."""
-    registration_code, sequence_number, check_letter, _ = _extract_parts(id_number)
-    check_number = int(registration_code + sequence_number)
-    mod = check_number % 23
+    # The registration code and sequence number are contiguous: no need to rejoin them.
+    check_letter = id_number[-3]
+    mod = int(id_number[:-3]) % 23
     expected = _CHECK_LETTER_LOOKUP.get(mod)
     return check_letter == expected
 
@@ -115,11 +117,10 @@ class ZimbabweValidator(BaseValidator):
     """
 
     country_code = "ZW"
+    normalizer = Normalizer(" -", strip_after=True)
+    shape = Shape(_ZW_RE.pattern)
 
-    def normalize(self, id_number: str) -> str:
-        return id_number.replace("-", "").replace(" ", "").strip()
-
-    def parse(self, id_number: str) -> ParsedID:
+    def parse(self, id_number: IDInput) -> ParsedID:
         v = self.normalize(id_number)
 
         if not _ZW_RE.match(v):
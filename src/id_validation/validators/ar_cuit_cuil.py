@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import re
 
+from ..normalize import IDInput, Normalizer
 from ..registry import register
+from ..suggest import ChecksumSpec
 from ..validate import ValidationError
 from .base import BaseValidator, ParsedID
 
@@ -15,6 +17,8 @@ _COMPANY_PREFIXES = {"30", "33", "34"}
 
 _WEIGHTS = [5, 4, 3, 2, 7, 6, 5, 4, 3, 2]
 
+_CHECKSUM_SPEC = ChecksumSpec.weighted(_WEIGHTS, 11, lambda r: 0 if r == 0 else (9 if r == 1 else 11 - r))
+
 
 def _check_digit(first10: str) -> int:
     s = sum(int(d) * w for d, w in zip(first10, _WEIGHTS))
@@ -34,14 +38,10 @@ class ArgentinaCUITCUILValidator(BaseValidator):
     """
 
     country_code = "AR"
+    normalizer = Normalizer(digits_only=True)  # accepts XX-XXXXXXXX-X
+    checksum_spec = _CHECKSUM_SPEC
 
-    def normalize(self, id_number: str) -> str:
-        # Accept hyphenated forms: XX-XXXXXXXX-X
-        v = id_number.strip()
-        v = re.sub(r"[^0-9]", "", v)
-        return v
-
-    def parse(self, id_number: str) -> ParsedID:
+    def parse(self, id_number: IDInput) -> ParsedID:
         v = self.normalize(id_number)
         if not _AR_RE.match(v):
             raise ValidationError("Invalid CUIT/CUIL format")
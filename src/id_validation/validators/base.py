@@ -2,8 +2,12 @@ from __future__ import annotations
 
 import datetime as _dt
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Sequence
 
+from ..dates import DateField
+from ..incremental import ChecksumIncremental, IncrementalValidator, ReparseIncremental, Shape, ShapeIncremental
+from ..normalize import IDInput, Normalizer
+from ..suggest import ChecksumSpec, rank_candidates
 from ..validate import ValidationError, Validator
 
 
@@ -31,20 +35,59 @@ class BaseValidator(Validator):
 
     country_code: str = ""
 
-    def normalize(self, id_number: str) -> str:
-        return id_number.strip()
+    # Declared by validators with a weighted-sum checksum so suggest() can solve candidates.
+    checksum_spec: ChecksumSpec | None = None
+    # Shorter forms, without the check digit, that are also complete IDs (e.g. 9-digit rodné číslo).
+    short_lengths: tuple[int, ...] = ()
+    # Longest normalized ID the format accepts, where no batch kernel declares its widths.
+    max_length: int | None = None
+    # Characters allowed per position, for as-you-type checks of formats without a checksum spec.
+    shape: Shape | None = None
+    # Where a checksum-spec format keeps its date of birth, so as-you-type checks can reject impossible dates early.
+    date_field: DateField | None = None
 
-    def validate(self, id_number: str) -> bool:
+    # Declarative input cleaning (separators, case); see id_validation.normalize.
+    normalizer: Normalizer = Normalizer()
+
+    def normalize(self, id_number: IDInput) -> str:
+        return self.normalizer.apply(id_number)
+
+    def normalize_many(self, ids: Sequence[IDInput]) -> list[str]:
+        """Batch form of ``normalize``."""
+        if type(self).normalize is not BaseValidator.normalize:
+            return [self.normalize(v) for v in ids]
+        return self.normalizer.many(ids)
+
+    def validate(self, id_number: IDInput) -> bool:
         try:
             self.parse(id_number)
             return True
         except ValidationError:
             return False
 
-    def parse(self, id_number: str) -> ParsedID:
+    def parse(self, id_number: IDInput) -> ParsedID:
         raise NotImplementedError
 
-    def extract_data(self, id_number: str) -> dict[str, Any]:
+    def suggest(self, id_number: IDInput) -> list[str]:
+        """Suggest corrections for an ID with a single keying error or adjacent transposition.
+
+        Returns normalized candidates that pass validation, most plausible first.
+        Valid input returns an empty list.
+        """
+        v = self.normalize(id_number)
+        if not v or self.validate(v):
+            return []
+        return rank_candidates(v, self.checksum_spec, self.validate)
+
+    def incremental(self) -> IncrementalValidator:
+        """A fresh as-you-type validator for this country; see ``id_validation.incremental``."""
+        if self.checksum_spec is not None:
+            return ChecksumIncremental(self)
+        if self.shape is not None:
+            return ShapeIncremental(self)
+        return ReparseIncremental(self)
+
+    def extract_data(self, id_number: IDInput) -> dict[str, Any]:
         """Backwards-compatible API: returns a dict (existing tests use this pattern)."""
         parsed = self.parse(id_number)
         data: dict[str, Any] = {}
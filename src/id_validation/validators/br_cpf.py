@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import re
 
+from ..incremental import Shape
+from ..normalize import IDInput, Normalizer
 from ..registry import register
 from ..validate import ValidationError
 from .base import BaseValidator, ParsedID
@@ -21,14 +23,10 @@ class BrazilCPFValidator(BaseValidator):
     """Brazil CPF (Cadastro de Pessoas Físicas)."""
 
     country_code = "BR"
+    normalizer = Normalizer(digits_only=True)  # accepts 000.000.000-00
+    shape = Shape(_CPF_RE.pattern)
 
-    def normalize(self, id_number: str) -> str:
-        # Accept common formatting: 000.000.000-00
-        v = id_number.strip()
-        v = re.sub(r"[^0-9]", "", v)
-        return v
-
-    def parse(self, id_number: str) -> ParsedID:
+    def parse(self, id_number: IDInput) -> ParsedID:
         v = self.normalize(id_number)
         if not _CPF_RE.match(v):
             raise ValidationError("Invalid CPF format")
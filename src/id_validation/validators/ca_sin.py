@@ -2,13 +2,17 @@ from __future__ import annotations
 
 import re
 
+from ..normalize import IDInput, Normalizer
 from ..registry import register
+from ..suggest import ChecksumSpec
 from ..validate import ValidationError
 from .base import BaseValidator, ParsedID
 
 
 _SIN_RE = re.compile(r"^(\d{9})$")
 
+_CHECKSUM_SPEC = ChecksumSpec.luhn(9)
+
 
 def _luhn_ok(number: str) -> bool:
     digits = [int(c) for c in number]
@@ -28,14 +32,10 @@ class CanadaSINValidator(BaseValidator):
     """Canada SIN (Social Insurance Number)."""
 
     country_code = "CA"
+    normalizer = Normalizer(digits_only=True)  # accepts spaces/hyphens
+    checksum_spec = _CHECKSUM_SPEC
 
-    def normalize(self, id_number: str) -> str:
-        # Accept spaces/hyphens
-        v = id_number.strip()
-        v = re.sub(r"[^0-9]", "", v)
-        return v
-
-    def parse(self, id_number: str) -> ParsedID:
+    def parse(self, id_number: IDInput) -> ParsedID:
         v = self.normalize(id_number)
         if not _SIN_RE.match(v):
             raise ValidationError("Invalid SIN format")
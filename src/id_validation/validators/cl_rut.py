@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import re
 
+from ..incremental import Shape
+from ..normalize import IDInput, Normalizer
 from ..registry import register
 from ..validate import ValidationError
 from .base import BaseValidator, ParsedID
@@ -33,13 +35,11 @@ class ChileRUTValidator(BaseValidator):
     """Chile RUT / RUN (Rol Único Tributario / Rol Único Nacional)."""
 
     country_code = "CL"
+    normalizer = Normalizer(".-", upper=True)
+    max_length = 9
+    shape = Shape(_RUT_RE.pattern)
 
-    def normalize(self, id_number: str) -> str:
-        v = id_number.strip().upper()
-        v = v.replace(".", "").replace("-", "")
-        return v
-
-    def parse(self, id_number: str) -> ParsedID:
+    def parse(self, id_number: IDInput) -> ParsedID:
         v = self.normalize(id_number)
         m = _RUT_RE.match(v)
         if not m:
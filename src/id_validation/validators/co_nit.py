@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import re
 
+from ..incremental import Shape
+from ..normalize import IDInput, Normalizer
 from ..registry import register
 from ..validate import ValidationError
 from .base import BaseValidator, ParsedID
@@ -38,11 +40,11 @@ class ColombiaNITValidator(BaseValidator):
     """Colombia NIT (Número de Identificación Tributaria)."""
 
     country_code = "CO"
+    normalizer = Normalizer(" ")
+    max_length = 17
+    shape = Shape(_NIT_RE.pattern)
 
-    def normalize(self, id_number: str) -> str:
-        return id_number.strip().replace(" ", "")
-
-    def parse(self, id_number: str) -> ParsedID:
+    def parse(self, id_number: IDInput) -> ParsedID:
         v = self.normalize(id_number)
         base: str
         dv_str: str | None
@@ -4,13 +4,23 @@ import datetime as _dt
 import re
 from typing import Any
 
+from ..dates import CenturyGuessed, DateField
+from ..normalize import IDInput, Normalizer
 from ..registry import register
+from ..suggest import ChecksumSpec
 from ..validate import ValidationError
 from .base import BaseValidator, ParsedID
 
 
 _RC_RE = re.compile(r"^(\d{9,10})$")
 
+# int(base9) % 11 expressed as digit weights 10**k % 11; only 10-digit numbers carry a check digit.
+_CHECKSUM_SPEC = ChecksumSpec.weighted([pow(10, 8 - i, 11) for i in range(9)], 11, lambda r: 0 if r == 10 else r)
+# Month + 50 for women, + 20 for the second series; the century is inferred in parse.
+_DATE_FIELD = DateField(
+    year=(0, 2), month=(2, 4), day=(4, 6), century=CenturyGuessed((1900, 2000)), month_offsets=(0, 20, 50, 70)
+)
+
 
 def _decode_rc_date(mm_raw: int, dd: int, *, year: int) -> tuple[_dt.date, str, dict[str, Any]]:
     """Decode rodné číslo date and gender.
@@ -74,11 +84,13 @@ class CzechRodneCisloValidator(BaseValidator):
     """
 
     country_code = "CZ"
+    normalizer = Normalizer(" /")
+    max_length = 10
+    checksum_spec = _CHECKSUM_SPEC
+    date_field = _DATE_FIELD
+    short_lengths = (9,)
 
-    def normalize(self, id_number: str) -> str:
-        return id_number.strip().replace(" ", "").replace("/", "")
-
-    def parse(self, id_number: str) -> ParsedID:
+    def parse(self, id_number: IDInput) -> ParsedID:
         v = self.normalize(id_number)
         if not _RC_RE.match(v):
             raise ValidationError("Invalid rodné číslo format")
@@ -4,7 +4,10 @@ import datetime as _dt
 import re
 from typing import Any
 
+from ..incremental import Shape
+from ..normalize import IDInput, Normalizer
 from ..registry import register
+from ..suggest import ChecksumSpec
 from ..validate import ValidationError
 from .base import BaseValidator, ParsedID
 
@@ -14,6 +17,8 @@ _CPR_RE = re.compile(r"^(\d{6})-?(\d{4})$")
 # Mod-11 checksum weights for all 10 digits
 _CPR_WEIGHTS = [4, 3, 2, 7, 6, 5, 4, 3, 2, 1]
 
+_CHECKSUM_SPEC = ChecksumSpec.weighted(_CPR_WEIGHTS[:9], 11, lambda r: None if r == 1 else (11 - r) % 11)
+
 
 def _cpr_century(yy: int, serial_first: int) -> int:
     """Infer century from CPR rules (best-effort).
@@ -54,14 +59,16 @@ class DenmarkCPRValidator(BaseValidator):
     """
 
     country_code = "DK"
+    normalizer = Normalizer(" ")
+    max_length = 11
+    shape = Shape(_CPR_RE.pattern)
 
     def __init__(self, strict_checksum: bool = False):
         self.strict_checksum = strict_checksum
+        # The checksum only constrains suggestions when it is enforced.
+        self.checksum_spec = _CHECKSUM_SPEC if strict_checksum else None
 
-    def normalize(self, id_number: str) -> str:
-        return id_number.strip().replace(" ", "")
-
-    def parse(self, id_number: str) -> ParsedID:
+    def parse(self, id_number: IDInput) -> ParsedID:
         v = self.normalize(id_number)
         m = _CPR_RE.match(v)
         if not m:
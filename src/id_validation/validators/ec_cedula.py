@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import re
 
+from ..normalize import IDInput, Normalizer
 from ..registry import register
+from ..suggest import ChecksumSpec
 from ..validate import ValidationError
 from .base import BaseValidator, ParsedID
 
@@ -49,16 +51,23 @@ def _cedula_check_digit(first9: str) -> int:
     return (10 - (s % 10)) % 10
 
 
+_CHECKSUM_SPEC = ChecksumSpec(
+    length=10,
+    modulus=10,
+    contributions=tuple(tuple(d * c - 9 if d * c >= 10 else d * c for d in range(10)) for c in [2, 1, 2, 1, 2, 1, 2, 1, 2]),
+    check_values=tuple((10 - r) % 10 for r in range(10)),
+)
+
+
 @register("EC")
 class EcuadorCedulaValidator(BaseValidator):
     """Ecuador cédula de identidad (natural persons, 10 digits)."""
 
     country_code = "EC"
+    normalizer = Normalizer(whitespace=True)
+    checksum_spec = _CHECKSUM_SPEC
 
-    def normalize(self, id_number: str) -> str:
-        return re.sub(r"\s+", "", id_number.strip())
-
-    def parse(self, id_number: str) -> ParsedID:
+    def parse(self, id_number: IDInput) -> ParsedID:
         v = self.normalize(id_number)
         if not _CED_RE.match(v):
             raise ValidationError("Invalid cédula format")
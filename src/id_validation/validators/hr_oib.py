@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import re
 
+from ..incremental import Shape
+from ..normalize import IDInput, Normalizer
 from ..registry import register
 from ..validate import ValidationError
 from .base import BaseValidator, ParsedID
@@ -29,11 +31,10 @@ class CroatiaOIBValidator(BaseValidator):
     """Croatia OIB (Osobni identifikacijski broj)."""
 
     country_code = "HR"
+    normalizer = Normalizer(whitespace=True)
+    shape = Shape(_OIB_RE.pattern)
 
-    def normalize(self, id_number: str) -> str:
-        return re.sub(r"\s+", "", id_number.strip())
-
-    def parse(self, id_number: str) -> ParsedID:
+    def parse(self, id_number: IDInput) -> ParsedID:
         v = self.normalize(id_number)
         if not _OIB_RE.match(v):
             raise ValidationError("Invalid OIB format")
@@ -0,0 +1,706 @@
+"""Vectorized batch kernels for fixed-width ID formats.
+
+Each kernel takes an ``(n, width)`` ``uint8`` matrix holding the ASCII bytes of
+already-normalized IDs and returns a ``KernelResult`` of NumPy columns. Kernels
+reproduce the rules of the country's scalar ``parse`` exactly; the tests compare
+the two row by row.
+
+Column conventions:
+
+- ``dob`` is ``datetime64[D]`` with ``NaT`` where absent.
+- Categorical columns hold ``int8`` codes into ``categories[name]`` (wider integers for
+  large vocabularies); ``-1`` is missing.
+- Integer columns use ``-1`` for missing (decoded values are never negative).
+- String columns are fixed-width unicode arrays; ``""`` is missing.
+- Boolean columns are only meaningful where the row is valid.
+
+This module requires NumPy.
+"""
+
+from __future__ import annotations
+
+import datetime as _dt
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Callable
+
+import numpy as np
+
+from ..belfiore import default_table
+from ..layout import LAYOUTS, Check, CenturyFromDigit, Fallback, Layout
+from ..validate_italy import (
+    _ABSENT,
+    _DIGIT_TABLE,
+    _EVEN_TABLE,
+    _LETTER_POSITIONS,
+    _LETTER_TABLE,
+    _MONTH_TABLE,
+    _NUMERIC_POSITIONS,
+    _ODD_TABLE,
+)
+from ..validate_southafrica import CitizenshipType, Race
+from ..validate_zimbabwe import _CHECK_LETTER_LOOKUP, _REGION_LOOKUP
+from .ec_cedula import _PROVINCES
+from .mx_curp import _STATE_CODES, _VALUE_TABLE
+from .ro_cnp import _COUNTY_NAMES
+
+
+GENDERS = ("M", "F")
+
+
+@dataclass
+class KernelResult:
+    valid: np.ndarray
+    columns: dict[str, np.ndarray] = field(default_factory=dict)
+    categories: dict[str, tuple[str, ...]] = field(default_factory=dict)
+    # Extra fields omitted from ParsedID.extra (rather than set to None) when missing.
+    optional: frozenset[str] = frozenset()
+
+
+@dataclass(frozen=True)
+class Kernel:
+    country_code: str
+    widths: tuple[int, ...]
+    id_type: str | None
+    func: Callable[[np.ndarray], KernelResult]
+    # Coarse region columns (province, county, district...), safe to keep without the ID.
+    regions: tuple[str, ...] = ()
+
+    @property
+    def width(self) -> int:
+        """Width of a single-width kernel."""
+        if len(self.widths) != 1:
+            raise ValueError(f"{self.country_code} kernel accepts several widths: {self.widths}")
+        return self.widths[0]
+
+
+KERNELS: dict[str, Kernel] = {}
+
+
+def kernel(
+    country_code: str,
+    width: int | tuple[int, ...],
+    id_type: str | None = None,
+    *,
+    regions: tuple[str, ...] = (),
+):
+    """Register a batch kernel for ``country_code`` over normalized IDs of ``width`` characters.
+
+    Formats with several lengths pass a tuple of widths; the kernel is then called
+    once per width with the rows of that length (``m.shape[1]`` tells them apart).
+    ``regions`` names the columns that locate the holder only coarsely.
+    """
+    widths = (width,) if isinstance(width, int) else tuple(width)
+
+    def _decorator(func: Callable[[np.ndarray], KernelResult]) -> Callable[[np.ndarray], KernelResult]:
+        KERNELS[country_code] = Kernel(country_code, widths, id_type, func, regions)
+        return func
+
+    return _decorator
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+_DAYS_IN_MONTH = np.array([0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31], dtype=np.int64)
+_NAT = np.datetime64("NaT", "D")
+
+
+def _digits(m: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Return (digit matrix as int64, rows that are all ASCII digits)."""
+    d = m.astype(np.int64) - 48
+    return d, ((d >= 0) & (d <= 9)).all(axis=1)
+
+
+def _number(d: np.ndarray, start: int, stop: int) -> np.ndarray:
+    """Integer value of digit columns ``start:stop``."""
+    out = np.zeros(len(d), dtype=np.int64)
+    for i in range(start, stop):
+        out = out * 10 + d[:, i]
+    return out
+
+
+def _weighted(d: np.ndarray, weights, start: int = 0) -> np.ndarray:
+    w = np.asarray(weights, dtype=np.int64)
+    return d[:, start : start + len(w)] @ w
+
+
+def _dates(year: np.ndarray, month: np.ndarray, day: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Vectorized ``datetime.date(year, month, day)``: (ok mask, datetime64[D] with NaT where not ok)."""
+    leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+    month_ok = (month >= 1) & (month <= 12)
+    mc = np.where(month_ok, month, 1)
+    dim = _DAYS_IN_MONTH[mc] + ((mc == 2) & leap)
+    ok = month_ok & (day >= 1) & (day <= dim) & (year >= _dt.MINYEAR) & (year <= _dt.MAXYEAR)
+
+    y = np.where(ok, year, 1970)
+    months = (y - 1970) * 12 + (mc - 1)
+    dates = months.astype("datetime64[M]").astype("datetime64[D]") + np.where(ok, day - 1, 0).astype("timedelta64[D]")
+    dates[~ok] = _NAT
+    return ok, dates
+
+
+def _gender(is_male: np.ndarray) -> np.ndarray:
+    return np.where(is_male, 0, 1).astype(np.int8)
+
+
+def _strings(m: np.ndarray, start: int, stop: int) -> np.ndarray:
+    """Fixed-width unicode column from byte columns ``start:stop``."""
+    raw = np.ascontiguousarray(m[:, start:stop]).view(f"S{stop - start}").ravel()
+    return raw.astype(f"U{stop - start}")
+
+
+def _lookup_codes(keys: np.ndarray, table: dict[int, str], size: int) -> tuple[np.ndarray, tuple[str, ...]]:
+    """Map integer ``keys`` to categorical codes over the labels of ``table``."""
+    labels = tuple(dict.fromkeys(table.values()))
+    index = {label: i for i, label in enumerate(labels)}
+    lut = np.full(size, -1, dtype=np.int8)
+    for key, label in table.items():
+        lut[key] = index[label]
+    clipped = np.clip(keys, 0, size - 1)
+    return np.where((keys >= 0) & (keys < size), lut[clipped], -1).astype(np.int8), labels
+
+
+def _two_digit_year(yy: np.ndarray) -> np.ndarray:
+    # South Africa: years below the current 2-digit year are 2000s.
+    current = _dt.date.today().year % 100
+    return np.where(yy < current, 2000 + yy, 1900 + yy)
+
+
+def _luhn_total(d: np.ndarray, doubled_cols, plain_cols) -> np.ndarray:
+    dbl = d[:, doubled_cols] * 2
+    dbl = np.where(dbl > 9, dbl - 9, dbl)
+    return dbl.sum(axis=1) + d[:, plain_cols].sum(axis=1)
+
+
+# ---------------------------------------------------------------------------
+# Africa
+# ---------------------------------------------------------------------------
+
+
+def _za_base(m: np.ndarray) -> tuple[np.ndarray, np.ndarray, dict[str, np.ndarray]]:
+    d, ok = _digits(m)
+    total = _luhn_total(d, [1, 3, 5, 7, 9, 11], [0, 2, 4, 6, 8, 10])
+    ok &= (10 - total % 10) % 10 == d[:, 12]
+    date_ok, dob = _dates(_two_digit_year(_number(d, 0, 2)), _number(d, 2, 4), _number(d, 4, 6))
+    ok &= date_ok
+    columns = {"dob": dob, "gender": _gender(d[:, 6] >= 5), "checksum": d[:, 12].copy()}
+    return d, ok, columns
+
+
+_CITIZENSHIP_LABELS = tuple(c.name for c in CitizenshipType)
+_RACE_CODES = np.full(10, -1, dtype=np.int8)
+for _i, _race in enumerate(Race):
+    _RACE_CODES[_race.value] = _i
+_RACE_LABELS = tuple(r.name for r in Race)
+
+
+def _za_result(d: np.ndarray, ok: np.ndarray, columns: dict[str, np.ndarray]) -> KernelResult:
+    citizenship = d[:, 10]
+    ok = ok & (citizenship <= 1)
+    columns = dict(columns)
+    columns["citizenship"] = np.where(citizenship <= 1, citizenship, -1).astype(np.int8)
+    columns["citizenship_code"] = citizenship.copy()
+    return KernelResult(ok, columns, {"gender": GENDERS, "citizenship": _CITIZENSHIP_LABELS})
+
+
+def _za_old_result(d: np.ndarray, ok: np.ndarray, columns: dict[str, np.ndarray]) -> KernelResult:
+    race = _RACE_CODES[np.clip(d[:, 11], 0, 9)]
+    ok = ok & (race >= 0)
+    citizenship = d[:, 10]
+    is_citizenship = (citizenship >= 0) & (citizenship <= 1)
+    columns = dict(columns)
+    columns["race"] = race
+    columns["race_code"] = d[:, 11].copy()
+    columns["citizenship"] = np.where(is_citizenship, citizenship, -1).astype(np.int8)
+    columns["citizenship_code"] = np.where(is_citizenship, citizenship, -1)
+    return KernelResult(
+        ok,
+        columns,
+        {"gender": GENDERS, "race": _RACE_LABELS, "citizenship": _CITIZENSHIP_LABELS},
+        optional=frozenset({"citizenship", "citizenship_code"}),
+    )
+
+
+@kernel("ZA", 13, "NATIONAL_ID")
+def _za(m: np.ndarray) -> KernelResult:
+    return _za_result(*_za_base(m))
+
+
+@kernel("ZA_OLD", 13, "NATIONAL_ID")
+def _za_old(m: np.ndarray) -> KernelResult:
+    return _za_old_result(*_za_base(m))
+
+
+def za_interpretations(m: np.ndarray) -> tuple[KernelResult, KernelResult]:
+    """ZA and ZA_OLD results for the same matrix, sharing one Luhn/date pass."""
+    base = _za_base(m)
+    return _za_result(*base), _za_old_result(*base)
+
+
+@kernel("NG", 11, "NIN")
+def _ng(m: np.ndarray) -> KernelResult:
+    _, ok = _digits(m)
+    return KernelResult(ok)
+
+
+_ZW_REGIONS = {int(code): name for code, name in _REGION_LOOKUP.items()}
+_ZW_CHECK_VALUES = np.full(256, -1, dtype=np.int64)
+for _value, _letter in _CHECK_LETTER_LOOKUP.items():
+    _ZW_CHECK_VALUES[ord(_letter)] = _value
+
+
+@kernel(
+    "ZW",
+    (11, 12),
+    "NATIONAL_ID",
+    regions=("registration_region", "registration_code", "district", "district_code"),
+)
+def _zw(m: np.ndarray) -> KernelResult:
+    # Two-digit registration code, 6 or 7 sequence digits, check letter, two-digit district.
+    w = m.shape[1]
+    d = m.astype(np.int64) - 48
+    numeric = np.delete(d, w - 3, axis=1)
+    ok = ((numeric >= 0) & (numeric <= 9)).all(axis=1)
+
+    registration, labels = _lookup_codes(_number(d, 0, 2), _ZW_REGIONS, 100)
+    district, _ = _lookup_codes(_number(d, w - 2, w), _ZW_REGIONS, 100)
+    ok &= (registration >= 0) & (district >= 0)
+
+    # Horner's rule keeps the mod-23 remainder small however long the number is.
+    remainder = np.zeros(len(m), dtype=np.int64)
+    for i in range(w - 3):
+        remainder = (remainder * 10 + d[:, i]) % 23
+    ok &= _ZW_CHECK_VALUES[m[:, w - 3]] == remainder
+
+    columns = {
+        "registration_region": registration,
+        "registration_code": _strings(m, 0, 2),
+        "district": district,
+        "district_code": _strings(m, w - 2, w),
+        "sequence_number": _strings(m, 2, w - 3),
+        "check_letter": _strings(m, w - 3, w - 2),
+    }
+    return KernelResult(ok, columns, {"registration_region": labels, "district": labels})
+
+
+# ---------------------------------------------------------------------------
+# Europe
+# ---------------------------------------------------------------------------
+
+
+@kernel("BE", 11, "NRN")
+def _be(m: np.ndarray) -> KernelResult:
+    d, ok = _digits(m)
+    base9 = _number(d, 0, 9)
+    checksum = _number(d, 9, 11)
+    r1900 = base9 % 97
+    r2000 = (2_000_000_000 + base9) % 97
+    is_1900 = checksum == np.where(r1900 != 0, 97 - r1900, 97)
+    is_2000 = checksum == np.where(r2000 != 0, 97 - r2000, 97)
+    ok &= is_1900 | is_2000
+    year = np.where(is_1900, 1900, 2000) + _number(d, 0, 2)
+    date_ok, dob = _dates(year, _number(d, 2, 4), _number(d, 4, 6))
+    ok &= date_ok
+    seq = _number(d, 6, 9)
+    columns = {"dob": dob, "gender": _gender(seq % 2 == 1), "sequence": seq, "checksum": checksum}
+    return KernelResult(ok, columns, {"gender": GENDERS})
+
+
+def _month_century(mm: np.ndarray, offsets: dict[int, int]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Decode a month field that carries a century offset: (ok, century, real month)."""
+    century = np.zeros_like(mm)
+    real = np.zeros_like(mm)
+    ok = np.zeros(len(mm), dtype=bool)
+    for offset, base in offsets.items():
+        hit = (mm >= offset + 1) & (mm <= offset + 12)
+        century = np.where(hit, base, century)
+        real = np.where(hit, mm - offset, real)
+        ok |= hit
+    return ok, century, real
+
+
+def _mod11_control(total: np.ndarray) -> np.ndarray:
+    # Norwegian control digit: 11 - r, where 11 -> 0 and 10 is impossible (-1).
+    k = 11 - total % 11
+    return np.where(k == 11, 0, np.where(k == 10, -1, k))
+
+
+@kernel("NO", 11, "FODSELSNUMMER")
+def _no(m: np.ndarray) -> KernelResult:
+    d, ok = _digits(m)
+    yy = _number(d, 4, 6)
+    individ = _number(d, 6, 9)
+    year = np.select(
+        [
+            individ <= 499,
+            (individ >= 500) & (individ <= 749) & (yy >= 54),
+            (individ >= 900) & (yy >= 40),
+            (individ >= 500) & (yy <= 39),
+        ],
+        [1900 + yy, 1800 + yy, 1900 + yy, 2000 + yy],
+        default=-1,
+    )
+    ok &= year >= 0
+    date_ok, dob = _dates(year, _number(d, 2, 4), _number(d, 0, 2))
+    ok &= date_ok
+    ok &= _mod11_control(_weighted(d, [3, 7, 6, 1, 8, 9, 4, 5, 2])) == d[:, 9]
+    ok &= _mod11_control(_weighted(d, [5, 4, 3, 2, 7, 6, 5, 4, 3, 2])) == d[:, 10]
+    columns = {
+        "dob": dob,
+        "gender": _gender(individ % 2 == 1),
+        "individual_number": individ,
+        "control_digits": d[:, 9:11].copy(),
+    }
+    return KernelResult(ok, columns, {"gender": GENDERS})
+
+
+@kernel("NL", 9, "BSN")
+def _nl(m: np.ndarray) -> KernelResult:
+    d, ok = _digits(m)
+    ok &= d.any(axis=1)
+    ok &= _weighted(d, [9, 8, 7, 6, 5, 4, 3, 2, -1]) % 11 == 0
+    return KernelResult(ok)
+
+
+@kernel("PT", 9, "NIF")
+def _pt(m: np.ndarray) -> KernelResult:
+    d, ok = _digits(m)
+    r = 11 - _weighted(d, range(9, 1, -1)) % 11
+    expected = np.where(r >= 10, 0, r)
+    ok &= expected == d[:, 8]
+    return KernelResult(ok, {"checksum": expected})
+
+
+_CNP_WEIGHTS = [2, 7, 9, 1, 4, 6, 3, 5, 8, 2, 7, 9]
+_CNP_CENTURY = np.array([-1, 1900, 1900, 1800, 1800, 2000, 2000, 2000, 2000, 2000], dtype=np.int64)
+
+
+@kernel("RO", 13, "CNP", regions=("county_code", "county_name"))
+def _ro(m: np.ndarray) -> KernelResult:
+    d, ok = _digits(m)
+    s = d[:, 0]
+    ok &= s != 0
+    r = _weighted(d, _CNP_WEIGHTS) % 11
+    ok &= np.where(r == 10, 1, r) == d[:, 12]
+    century = _CNP_CENTURY[np.clip(s, 0, 9)]
+    date_ok, dob = _dates(century + _number(d, 1, 3), _number(d, 3, 5), _number(d, 5, 7))
+    ok &= date_ok
+    county_code = _number(d, 7, 9)
+    county_name, labels = _lookup_codes(county_code, _COUNTY_NAMES, 100)
+    columns = {
+        "dob": dob,
+        "gender": _gender(s % 2 == 1),
+        "county_code": county_code,
+        "county_name": county_name,
+        "serial": _number(d, 9, 12),
+        "checksum": d[:, 12].copy(),
+    }
+    return KernelResult(ok, columns, {"gender": GENDERS, "county_name": labels})
+
+
+@kernel("SI", 13, "EMSO", regions=("region_code",))
+def _si(m: np.ndarray) -> KernelResult:
+    d, ok = _digits(m)
+    yyy = _number(d, 4, 7)
+    cutoff = _dt.date.today().year % 1000
+    year = np.where(yyy <= cutoff, 2000 + yyy, 1000 + yyy)
+    date_ok, dob = _dates(year, _number(d, 2, 4), _number(d, 0, 2))
+    ok &= date_ok
+    r = 11 - _weighted(d, [7, 6, 5, 4, 3, 2, 7, 6, 5, 4, 3, 2]) % 11
+    expected = np.where(r == 11, 0, r)
+    ok &= (expected != 10) & (expected == d[:, 12])
+    serial = _number(d, 9, 12)
+    columns = {
+        "dob": dob,
+        "gender": _gender(serial < 500),
+        "region_code": _number(d, 7, 9),
+        "serial": serial,
+        "checksum": expected,
+    }
+    return KernelResult(ok, columns, {"gender": GENDERS})
+
+
+@kernel("HR", 11, "OIB")
+def _hr(m: np.ndarray) -> KernelResult:
+    d, ok = _digits(m)
+    p = np.full(len(d), 10, dtype=np.int64)
+    for i in range(10):
+        p = (p + d[:, i]) % 10
+        p = np.where(p == 0, 10, p)
+        p = (p * 2) % 11
+    k = 11 - p
+    expected = np.where(k >= 10, 0, k)
+    ok &= expected == d[:, 10]
+    return KernelResult(ok, {"checksum": expected})
+
+
+@kernel("TR", 11, "TCKN")
+def _tr(m: np.ndarray) -> KernelResult:
+    d, ok = _digits(m)
+    ok &= d[:, 0] != 0
+    odd = d[:, [0, 2, 4, 6, 8]].sum(axis=1)
+    even = d[:, [1, 3, 5, 7]].sum(axis=1)
+    ok &= (odd * 7 - even) % 10 == d[:, 9]
+    ok &= d[:, :10].sum(axis=1) % 10 == d[:, 10]
+    return KernelResult(ok, {"checksum10": d[:, 9].copy(), "checksum11": d[:, 10].copy()})
+
+
+def _byte_table(table: bytes) -> np.ndarray:
+    out = np.frombuffer(table, dtype=np.uint8).astype(np.int64)
+    out[out == _ABSENT] = -1
+    return out
+
+
+_IT_ODD = _byte_table(_ODD_TABLE)
+_IT_EVEN = _byte_table(_EVEN_TABLE)
+_IT_DIGIT = _byte_table(_DIGIT_TABLE)
+_IT_LETTER = _byte_table(_LETTER_TABLE)
+_IT_MONTH = _byte_table(_MONTH_TABLE)
+
+
+@lru_cache(maxsize=None)
+def _it_municipalities() -> tuple[np.ndarray, np.ndarray, tuple[str, ...], np.ndarray, tuple[str, ...]]:
+    """(sorted keys, name codes, name labels, province codes, province labels) of the Belfiore table."""
+    table = default_table()
+    keys = np.frombuffer(table.keys, dtype=np.uint16).astype(np.int64)
+    names = [table.name(i) for i in range(len(table))]
+    provinces = [table.province(i) for i in range(len(table))]
+    name_labels = tuple(dict.fromkeys(names))
+    province_labels = tuple(dict.fromkeys(provinces))
+    name_index = {label: i for i, label in enumerate(name_labels)}
+    province_index = {label: i for i, label in enumerate(province_labels)}
+    name_codes = np.array([name_index[n] for n in names], dtype=np.int16)
+    province_codes = np.array([province_index[p] for p in provinces], dtype=np.int8)
+    return keys, name_codes, name_labels, province_codes, province_labels
+
+
+def _it_lookup(letter: np.ndarray, number: np.ndarray) -> tuple[np.ndarray, np.ndarray, dict[str, tuple[str, ...]]]:
+    keys, name_codes, name_labels, province_codes, province_labels = _it_municipalities()
+    key = (letter.astype(np.int64) - 65) * 1000 + number
+    pos = np.clip(np.searchsorted(keys, key), 0, len(keys) - 1)
+    found = keys[pos] == key
+    municipality = np.where(found, name_codes[pos], -1).astype(np.int16)
+    province = np.where(found, province_codes[pos], -1).astype(np.int8)
+    return municipality, province, {"municipality": name_labels, "province": province_labels}
+
+
+@kernel("IT", 16, "CODICE_FISCALE", regions=("municipality_code", "municipality", "province"))
+def _it(m: np.ndarray) -> KernelResult:
+    numeric = _IT_DIGIT[m[:, _NUMERIC_POSITIONS]]  # omocodia letters decode to their digit
+    ok = (numeric >= 0).all(axis=1) & (_IT_LETTER[m[:, _LETTER_POSITIONS]] >= 0).all(axis=1)
+    total = _IT_ODD[m[:, 0:15:2]].sum(axis=1) + _IT_EVEN[m[:, 1:15:2]].sum(axis=1)
+    ok &= 65 + total % 26 == m[:, 15]
+
+    month = _IT_MONTH[m[:, 8]]
+    ok &= month > 0
+    yy = numeric[:, 0] * 10 + numeric[:, 1]
+    day_code = numeric[:, 2] * 10 + numeric[:, 3]
+    female = day_code > 40
+    today = _dt.date.today()
+    year = today.year - today.year % 100 + yy - np.where(yy > today.year % 100, 100, 0)
+    date_ok, dob = _dates(year, month, np.where(female, day_code - 40, day_code))
+    ok &= date_ok
+
+    comune = m[:, 11:15].copy()
+    comune[:, 1:] = np.clip(numeric[:, 4:], 0, 9) + 48
+    municipality, province, categories = _it_lookup(m[:, 11], numeric[:, 4] * 100 + numeric[:, 5] * 10 + numeric[:, 6])
+    columns = {
+        "dob": dob,
+        "gender": _gender(~female),
+        "municipality_code": _strings(comune, 0, 4),
+        "municipality": municipality,
+        "province": province,
+        "checksum": _strings(m, 15, 16),
+        "omocodic": (m[:, _NUMERIC_POSITIONS] > 57).any(axis=1),
+    }
+    return KernelResult(ok, columns, {"gender": GENDERS, **categories})
+
+
+# ---------------------------------------------------------------------------
+# Americas
+# ---------------------------------------------------------------------------
+
+
+_AR_WEIGHTS = [5, 4, 3, 2, 7, 6, 5, 4, 3, 2]
+_AR_TYPES = ("CUIT", "CUIL", "CUIT/CUIL")
+_AR_CATEGORIES = ("company", "individual", "unknown")
+
+
+@kernel("AR", 11)
+def _ar(m: np.ndarray) -> KernelResult:
+    d, ok = _digits(m)
+    r = 11 - _weighted(d, _AR_WEIGHTS) % 11
+    expected = np.where(r == 11, 0, np.where(r == 10, 9, r))
+    ok &= expected == d[:, 10]
+    prefix = _number(d, 0, 2)
+    kind = np.where(np.isin(prefix, [30, 33, 34]), 0, np.where(np.isin(prefix, [20, 23, 24, 27]), 1, 2)).astype(np.int8)
+    columns = {
+        "id_type": kind,
+        "prefix": _strings(m, 0, 2),
+        "dni": _strings(m, 2, 10),
+        "category": kind.copy(),
+        "checksum": expected,
+    }
+    return KernelResult(ok, columns, {"id_type": _AR_TYPES, "category": _AR_CATEGORIES})
+
+
+@kernel("BR", 11, "CPF")
+def _br(m: np.ndarray) -> KernelResult:
+    d, ok = _digits(m)
+    ok &= (d != d[:, :1]).any(axis=1)
+    r1 = 11 - _weighted(d, range(10, 1, -1)) % 11
+    r2 = 11 - _weighted(d, range(11, 1, -1)) % 11
+    d1 = np.where(r1 >= 10, 0, r1)
+    d2 = np.where(r2 >= 10, 0, r2)
+    ok &= (d1 == d[:, 9]) & (d2 == d[:, 10])
+    return KernelResult(ok, {"check_digits": np.stack([d1, d2], axis=1)})
+
+
+@kernel("CA", 9, "SIN")
+def _ca(m: np.ndarray) -> KernelResult:
+    d, ok = _digits(m)
+    ok &= _luhn_total(d, [1, 3, 5, 7], [0, 2, 4, 6, 8]) % 10 == 0
+    return KernelResult(ok)
+
+
+def _byte_class(chars: str) -> np.ndarray:
+    """Boolean lookup over byte values: True for the ASCII characters in ``chars``."""
+    table = np.zeros(256, dtype=bool)
+    table[list(chars.encode("ascii"))] = True
+    return table
+
+
+_UPPER = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_DIGIT_CHARS = "0123456789"
+
+# Allowed characters per CURP position (see mx_curp._CURP_RE).
+_MX_CLASSES = np.stack(
+    [_byte_class(c) for c in [_UPPER, "AEIOUX", _UPPER, _UPPER]]
+    + [_byte_class(_DIGIT_CHARS)] * 6
+    + [_byte_class("HM")]
+    + [_byte_class(_UPPER)] * 5
+    + [_byte_class(_DIGIT_CHARS + _UPPER), _byte_class(_DIGIT_CHARS)]
+)
+_MX_VALUES = np.frombuffer(_VALUE_TABLE, dtype=np.uint8).astype(np.int64)
+_MX_STATES = {(ord(code[0]) - 65) * 26 + ord(code[1]) - 65: name for code, name in _STATE_CODES.items()}
+
+
+@kernel("MX", 18, "CURP", regions=("state_code", "state_name"))
+def _mx(m: np.ndarray) -> KernelResult:
+    ok = _MX_CLASSES[np.arange(18), m].all(axis=1)
+    d = m.astype(np.int64) - 48
+
+    state = (m[:, 11].astype(np.int64) - 65) * 26 + m[:, 12].astype(np.int64) - 65
+    state_name, labels = _lookup_codes(state, _MX_STATES, 26 * 26)
+    ok &= state_name >= 0
+
+    century = np.where(m[:, 16] <= 57, 1900, 2000)
+    date_ok, dob = _dates(century + _number(d, 4, 6), _number(d, 6, 8), _number(d, 8, 10))
+    ok &= date_ok
+
+    expected = (10 - (_MX_VALUES[m[:, :17]] @ np.arange(17, 0, -1)) % 10) % 10
+    ok &= expected == d[:, 17]
+    columns = {
+        "dob": dob,
+        "gender": _gender(m[:, 10] == ord("H")),
+        "state_code": _strings(m, 11, 13),
+        "state_name": state_name,
+        "homonym": _strings(m, 16, 17),
+        "checksum": expected,
+    }
+    return KernelResult(ok, columns, {"gender": GENDERS, "state_name": labels})
+
+
+_EC_PROVINCES = {int(code): name for code, name in _PROVINCES.items()}
+
+
+@kernel("EC", 10, "CEDULA", regions=("province_code", "province_name"))
+def _ec(m: np.ndarray) -> KernelResult:
+    d, ok = _digits(m)
+    province = _number(d, 0, 2)
+    province_name, labels = _lookup_codes(province, _EC_PROVINCES, 100)
+    ok &= province_name >= 0
+    third = d[:, 2]
+    ok &= third < 6
+    products = d[:, :9] * np.array([2, 1, 2, 1, 2, 1, 2, 1, 2], dtype=np.int64)
+    total = np.where(products >= 10, products - 9, products).sum(axis=1)
+    expected = (10 - total % 10) % 10
+    ok &= expected == d[:, 9]
+    columns = {
+        "province_code": _strings(m, 0, 2),
+        "province_name": province_name,
+        "third_digit": third.copy(),
+        "serial": _strings(m, 3, 9),
+        "checksum": expected,
+    }
+    return KernelResult(ok, columns, {"province_name": labels})
+
+
+# ---------------------------------------------------------------------------
+# Declarative layouts
+# ---------------------------------------------------------------------------
+
+
+def _expected_check(d: np.ndarray, check: Check) -> np.ndarray:
+    """Expected check digit per row (-1 where no digit is valid); ``d`` holds digits 0-9."""
+    stages = check.stages if isinstance(check, Fallback) else (check,)
+    expected = np.full(len(d), -1, dtype=np.int64)
+    for spec in reversed(stages):
+        contributions = np.array(spec.contributions, dtype=np.int64)
+        residue = contributions[np.arange(len(spec.body)), d[:, list(spec.body)]].sum(axis=1) % spec.modulus
+        values = np.array([-1 if c is None else c for c in spec.check_values], dtype=np.int64)[residue]
+        expected = np.where(values >= 0, values, expected)
+    return expected
+
+
+def compile_layout(layout: Layout) -> Callable[[np.ndarray], KernelResult]:
+    """Vectorized equivalent of ``layout.parse``."""
+    genders = None
+    if layout.gender is not None:
+        genders = np.array([GENDERS.index(g) if g in GENDERS else -1 for g in layout.gender.genders], dtype=np.int8)
+    by_digit = None
+    if layout.date is not None and isinstance(layout.date.century, CenturyFromDigit):
+        by_digit = np.array([layout.date.century.centuries.get(i, -1) for i in range(10)], dtype=np.int64)
+
+    def _layout_kernel(m: np.ndarray) -> KernelResult:
+        d, ok = _digits(m)
+        clipped = np.clip(d, 0, 9)
+        for check in layout.checks:
+            ok &= _expected_check(clipped, check) == d[:, check.check_index]
+
+        columns: dict[str, np.ndarray] = {}
+        categories: dict[str, tuple[str, ...]] = {}
+        century = None
+        date = layout.date
+        if date is not None:
+            month = _number(d, *date.month)
+            if by_digit is not None:
+                century = by_digit[clipped[:, date.century.position]]  # type: ignore[union-attr]
+                century_ok = century >= 0
+            else:
+                century_ok, century, month = _month_century(month, dict(date.century.offsets))  # type: ignore[union-attr]
+            date_ok, columns["dob"] = _dates(century + _number(d, *date.year), month, _number(d, *date.day))
+            ok &= century_ok & date_ok
+        if genders is not None:
+            columns["gender"] = genders[clipped[:, layout.gender.position]]  # type: ignore[union-attr]
+            categories["gender"] = GENDERS
+            ok &= columns["gender"] >= 0
+        for f in layout.fields:
+            if f.kind == "century":
+                columns[f.name] = century  # type: ignore[assignment]
+            elif f.kind == "str":
+                columns[f.name] = _strings(m, f.start, f.stop)
+            else:
+                columns[f.name] = _number(d, f.start, f.stop)
+        return KernelResult(ok, columns, categories)
+
+    return _layout_kernel
+
+
+# The package __init__ imports every validator before this module runs, so every
+# LayoutValidator has registered its layout by now.
+for _layout in LAYOUTS.values():
+    if _layout.country_code not in KERNELS:
+        kernel(_layout.country_code, _layout.length, _layout.id_type)(compile_layout(_layout))
@@ -4,6 +4,8 @@ import datetime as _dt
 import re
 from typing import Any
 
+from ..incremental import Shape
+from ..normalize import IDInput, Normalizer
 from ..registry import register
 from ..validate import ValidationError
 from .base import BaseValidator, ParsedID
@@ -59,11 +61,11 @@ class LatviaPersonasKodsValidator(BaseValidator):
     """
 
     country_code = "LV"
+    normalizer = Normalizer(" ")
+    max_length = 12
+    shape = Shape(_LV_RE.pattern)
 
-    def normalize(self, id_number: str) -> str:
-        return id_number.strip().replace(" ", "")
-
-    def parse(self, id_number: str) -> ParsedID:
+    def parse(self, id_number: IDInput) -> ParsedID:
         v = self.normalize(id_number)
 
         # Legacy (date-encoded)
@@ -2,8 +2,11 @@ from __future__ import annotations
 
 import datetime as _dt
 import re
+from operator import mul
 from typing import Any
 
+from ..incremental import Shape
+from ..normalize import IDInput, Normalizer
 from ..registry import register
 from ..validate import ValidationError
 from .base import BaseValidator, ParsedID
@@ -17,7 +20,8 @@ from .base import BaseValidator, ParsedID
 #  14-16 internal consonants
 #  17   homonym disambiguator (0-9 for 1900-1999; A-Z for 2000-2099)
 #  18   check digit
-_CURP_RE = re.compile(r"^([A-Z][AEIOUX][A-Z]{2})(\d{2})(\d{2})(\d{2})([HM])([A-Z]{2})([A-Z]{3})([0-9A-Z])(\d)$")
+# No capture groups: fields are sliced only after the format has matched.
+_CURP_RE = re.compile(r"[A-Z][AEIOUX][A-Z]{2}[0-9]{6}[HM][A-Z]{5}[0-9A-Z][0-9]")
 
 
 _STATE_CODES: dict[str, str] = {
@@ -61,14 +65,20 @@ _STATE_CODES: dict[str, str] = {
 # Source commonly published by RENAPO/SEGOB documentation.
 _CHAR_VALUES = {ch: i for i, ch in enumerate("0123456789ABCDEFGHIJKLMN\u00d1OPQRSTUVWXYZ")}
 
+# _CHAR_VALUES as a bytes.translate table over Latin-1 (0xFF: not a CURP character).
+_VALUE_TABLE = bytes(_CHAR_VALUES.get(chr(b), 0xFF) for b in range(256))
+_WEIGHTS = tuple(range(17, 0, -1))
+
 
 def _curp_check_digit(first_17: str) -> int:
     # Sum(value(char_i) * (18 - i)) for i=1..17, then (10 - (sum % 10)) % 10
-    s = 0
-    for i, ch in enumerate(first_17, start=1):
-        if ch not in _CHAR_VALUES:
-            raise ValidationError("Invalid character for checksum")
-        s += _CHAR_VALUES[ch] * (18 - i)
+    try:
+        values = first_17.encode("latin-1").translate(_VALUE_TABLE)
+    except UnicodeEncodeError:
+        values = b"\xff"
+    if 0xFF in values:
+        raise ValidationError("Invalid character for checksum")
+    s = sum(map(mul, values, _WEIGHTS))
     return (10 - (s % 10)) % 10
 
 
@@ -86,42 +96,35 @@ class MexicoCURPValidator(BaseValidator):
     """Mexico CURP (Clave \u00danica de Registro de Poblaci\u00f3n)."""
 
     country_code = "MX"
+    normalizer = Normalizer(whitespace=True, upper=True)
+    shape = Shape(_CURP_RE.pattern)
 
-    def normalize(self, id_number: str) -> str:
-        return re.sub(r"\s+", "", id_number.strip()).upper()
-
-    def parse(self, id_number: str) -> ParsedID:
+    def parse(self, id_number: IDInput) -> ParsedID:
         v = self.normalize(id_number)
-        m = _CURP_RE.match(v)
-        if not m:
+        if len(v) != 18 or not _CURP_RE.fullmatch(v):
             raise ValidationError("Invalid CURP format")
 
-        yy = int(m.group(2))
-        mm = int(m.group(3))
-        dd = int(m.group(4))
-        gender_raw = m.group(5)
-        state = m.group(6)
-        homonym = m.group(8)
-        check_digit = int(m.group(9))
-
-        if state not in _STATE_CODES:
+        state = v[11:13]
+        state_name = _STATE_CODES.get(state)
+        if state_name is None:
             raise ValidationError("Invalid state code")
 
-        year = _decode_year(yy, homonym)
+        homonym = v[16]
+        year = _decode_year(int(v[4:6]), homonym)
         try:
-            dob = _dt.date(year, mm, dd)
+            dob = _dt.date(year, int(v[6:8]), int(v[8:10]))
         except ValueError as e:
             raise ValidationError("Invalid date of birth") from e
 
         expected = _curp_check_digit(v[:17])
-        if check_digit != expected:
+        if int(v[17]) != expected:
             raise ValidationError("Invalid checksum")
 
-        gender = "M" if gender_raw == "H" else "F"
+        gender = "M" if v[10] == "H" else "F"
 
         extra: dict[str, Any] = {
             "state_code": state,
-            "state_name": _STATE_CODES[state],
+            "state_name": state_name,
             "homonym": homonym,
             "checksum": expected,
         }
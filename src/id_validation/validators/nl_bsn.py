@@ -2,13 +2,18 @@ from __future__ import annotations
 
 import re
 
+from ..normalize import IDInput, Normalizer
 from ..registry import register
+from ..suggest import ChecksumSpec
 from ..validate import ValidationError
 from .base import BaseValidator, ParsedID
 
 
 _BSN_RE = re.compile(r"^(\d{9})$")
 
+# Elfproef rearranged: the last digit equals the weighted sum of the first eight mod 11.
+_CHECKSUM_SPEC = ChecksumSpec.weighted([9, 8, 7, 6, 5, 4, 3, 2], 11, lambda r: r if r < 10 else None)
+
 
 def _elfproef(digits: list[int]) -> bool:
     # "11-proef" / "elfproef": weights 9..2 and -1 for last digit
@@ -21,11 +26,10 @@ class NetherlandsBSNValidator(BaseValidator):
     """Netherlands BSN (Burgerservicenummer)."""
 
     country_code = "NL"
+    normalizer = Normalizer(whitespace=True)
+    checksum_spec = _CHECKSUM_SPEC
 
-    def normalize(self, id_number: str) -> str:
-        return re.sub(r"\s+", "", id_number.strip())
-
-    def parse(self, id_number: str) -> ParsedID:
+    def parse(self, id_number: IDInput) -> ParsedID:
         v = self.normalize(id_number)
         m = _BSN_RE.match(v)
         if not m:
@@ -2,13 +2,17 @@ from __future__ import annotations
 
 import re
 
+from ..normalize import IDInput, Normalizer
 from ..registry import register
+from ..suggest import ChecksumSpec
 from ..validate import ValidationError
 from .base import BaseValidator, ParsedID
 
 
 _NIF_RE = re.compile(r"^(\d{9})$")
 
+_CHECKSUM_SPEC = ChecksumSpec.weighted(range(9, 1, -1), 11, lambda r: 0 if r < 2 else 11 - r)
+
 
 def _nif_check_digit(first_8: list[int]) -> int:
     # Mod 11 with weights 9..2
@@ -23,11 +27,10 @@ class PortugalNIFValidator(BaseValidator):
     """Portugal NIF (Número de Identificação Fiscal)."""
 
     country_code = "PT"
+    normalizer = Normalizer(whitespace=True)
+    checksum_spec = _CHECKSUM_SPEC
 
-    def normalize(self, id_number: str) -> str:
-        return re.sub(r"\s+", "", id_number.strip())
-
-    def parse(self, id_number: str) -> ParsedID:
+    def parse(self, id_number: IDInput) -> ParsedID:
         v = self.normalize(id_number)
         if not _NIF_RE.match(v):
             raise ValidationError("Invalid NIF format")
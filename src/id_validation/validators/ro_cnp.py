@@ -4,7 +4,10 @@ import datetime as _dt
 import re
 from typing import Any
 
+from ..dates import CenturyFromDigit, DateField
+from ..normalize import IDInput, Normalizer
 from ..registry import register
+from ..suggest import ChecksumSpec
 from ..validate import ValidationError
 from .base import BaseValidator, ParsedID
 
@@ -14,6 +17,15 @@ _CNP_RE = re.compile(r"^(\d{13})$")
 # Constant weights used by CNP checksum
 _CNP_WEIGHTS = [2, 7, 9, 1, 4, 6, 3, 5, 8, 2, 7, 9]
 
+_CHECKSUM_SPEC = ChecksumSpec.weighted(_CNP_WEIGHTS, 11, lambda r: 1 if r == 10 else r)
+# S (position 0) is the sex and century; 7-9 (residents, foreigners) are read as the 2000s, as in parse.
+_DATE_FIELD = DateField(
+    year=(1, 3),
+    month=(3, 5),
+    day=(5, 7),
+    century=CenturyFromDigit(0, {1: 1900, 2: 1900, 3: 1800, 4: 1800, 5: 2000, 6: 2000, 7: 2000, 8: 2000, 9: 2000}),
+)
+
 # County (Judet) codes. This mapping is widely published; treat as best-effort.
 _COUNTY_NAMES: dict[int, str] = {
     1: "Alba",
@@ -96,11 +108,11 @@ class RomaniaCNPValidator(BaseValidator):
     """Romania CNP (Cod Numeric Personal)."""
 
     country_code = "RO"
+    normalizer = Normalizer(" ")
+    checksum_spec = _CHECKSUM_SPEC
+    date_field = _DATE_FIELD
 
-    def normalize(self, id_number: str) -> str:
-        return id_number.strip().replace(" ", "")
-
-    def parse(self, id_number: str) -> ParsedID:
+    def parse(self, id_number: IDInput) -> ParsedID:
         v = self.normalize(id_number)
         if not _CNP_RE.match(v):
             raise ValidationError("Invalid CNP format")
@@ -3,7 +3,10 @@ from __future__ import annotations
 import datetime as _dt
 import re
 
+from ..dates import CenturyGuessed, DateField
+from ..normalize import IDInput, Normalizer
 from ..registry import register
+from ..suggest import ChecksumSpec
 from ..validate import ValidationError
 from .base import BaseValidator, ParsedID
 
@@ -12,6 +15,11 @@ _EMSO_RE = re.compile(r"^(\d{13})$")
 
 _WEIGHTS = [7, 6, 5, 4, 3, 2, 7, 6, 5, 4, 3, 2]
 
+# Residue 1 would need check digit 10, which is never issued.
+_CHECKSUM_SPEC = ChecksumSpec.weighted(_WEIGHTS, 11, lambda r: None if r == 1 else (11 - r) % 11)
+# DDMMYYY: the three-digit year is read as 1yyy or 2yyy (see _decode_year).
+_DATE_FIELD = DateField(year=(4, 7), month=(2, 4), day=(0, 2), century=CenturyGuessed((1000, 2000)))
+
 
 def _emso_checksum(first_12: list[int]) -> int:
     s = sum(d * w for d, w in zip(first_12, _WEIGHTS))
@@ -41,11 +49,11 @@ class SloveniaEMSOValidator(BaseValidator):
     """
 
     country_code = "SI"
+    normalizer = Normalizer(whitespace=True)
+    checksum_spec = _CHECKSUM_SPEC
+    date_field = _DATE_FIELD
 
-    def normalize(self, id_number: str) -> str:
-        return re.sub(r"\s+", "", id_number.strip())
-
-    def parse(self, id_number: str) -> ParsedID:
+    def parse(self, id_number: IDInput) -> ParsedID:
         v = self.normalize(id_number)
         if not _EMSO_RE.match(v):
             raise ValidationError("Invalid EMŠO format")
@@ -3,6 +3,8 @@ from __future__ import annotations
 import re
 from typing import Any
 
+from ..incremental import Shape
+from ..normalize import IDInput, Normalizer
 from ..registry import register
 from ..validate import ValidationError
 from .base import BaseValidator, ParsedID
@@ -27,11 +29,10 @@ class TurkeyTCKNValidator(BaseValidator):
     """Turkey Republic Identification Number (T.C. Kimlik No)."""
 
     country_code = "TR"
+    normalizer = Normalizer(" ")
+    shape = Shape(r"[1-9]\d{10}")
 
-    def normalize(self, id_number: str) -> str:
-        return id_number.strip().replace(" ", "")
-
-    def parse(self, id_number: str) -> ParsedID:
+    def parse(self, id_number: IDInput) -> ParsedID:
         v = self.normalize(id_number)
         if not _TCKN_RE.match(v):
             raise ValidationError("Invalid TCKN format")
@@ -0,0 +1,355 @@
+"""Compact, versioned binary encoding of parse results.
+
+Pickling ``ParsedID`` objects (with their ``extra`` dicts and ``datetime.date``
+values) to move results between processes can cost more than the validation
+itself. ``encode_batch`` packs a list of ``ParsedID | None`` into one contiguous
+buffer, and ``decode_batch`` rebuilds it.
+
+The buffer is columnar. Every record has the same fixed header fields, stored as
+one array per field: country, flags, id type, gender, dob as days since
+1970-01-01, and the index of its extra schema. Each array is packed in a single
+call instead of once per record.
+
+A schema is one country's set of ``extra`` keys. The extra values of all records
+that share a schema are stored column by column. Each column has one value type:
+int64, bool, float64, date (epoch days), naive datetime (epoch microseconds),
+UTF-8 strings (end offsets plus one blob), or tuples of int64 (lengths plus the
+flattened values). A column holding ``None`` in some rows carries a null bitmap,
+and its payload has only the present values. Any other value, or a column that
+mixes types, raises ``TypeError`` when encoding. Nothing is pickled, so decoding
+an untrusted buffer cannot run code.
+
+Layout (little-endian)::
+
+    header    b"IDPW", u8 version, u8 reserved, u32 record count, u16 string count, u16 schema count
+    strings   string count x (u16 length, UTF-8)        countries, id types, genders, extra keys
+    records   u16[n] country, u8[n] flags, u16[n] id type, u16[n] gender, i32[n] dob, u16[n] schema,
+              u16[n] id number length, u32 + UTF-8 id numbers
+    schemas   per schema: u8 field count, u32 row count,
+              per field: u16 key string, 1-byte encoding, u8 nullable,
+              [null bitmap, 1 bit per row, if nullable], encoded present values
+
+String and schema indexes are 0xFFFF for missing values.
+"""
+
+from __future__ import annotations
+
+import datetime as _dt
+import struct
+import sys
+from array import array
+from itertools import accumulate, repeat
+from typing import Any, Optional, Sequence
+
+from .validators.base import ParsedID
+
+
+MAGIC = b"IDPW"
+VERSION = 2
+
+_HEADER = struct.Struct("<4sBBIHH")
+_SCHEMA = struct.Struct("<BI")
+_FIELD = struct.Struct("<HcB")
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+
+_NONE_INDEX = 0xFFFF
+_PRESENT = 0x01
+_HAS_DOB = 0x02
+_HAS_EXTRA = 0x04
+
+_EPOCH = _dt.date(1970, 1, 1).toordinal()
+_EPOCH_DATETIME = _dt.datetime(1970, 1, 1)
+_I64 = (-(1 << 63), (1 << 63) - 1)
+
+# Fixed-width column encodings: code -> array typecode.
+_ARRAYS = {b"q": "q", b"?": "B", b"f": "d", b"d": "i", b"t": "q"}
+
+
+def _pack(typecode: str, values: Sequence[int] | Sequence[float]) -> bytes:
+    a = array(typecode, values)
+    if sys.byteorder == "big":
+        a.byteswap()
+    return a.tobytes()
+
+
+def _unpack(typecode: str, buffer: bytes, offset: int, n: int) -> tuple[list[Any], int]:
+    a = array(typecode)
+    end = offset + n * a.itemsize
+    a.frombytes(buffer[offset:end])
+    if sys.byteorder == "big":
+        a.byteswap()
+    return a.tolist(), end
+
+
+def _pack_strings(values: Sequence[str]) -> bytes:
+    data = [v.encode("utf-8") for v in values]
+    blob = b"".join(data)
+    return _pack("I", list(accumulate(map(len, data)))) + blob
+
+
+def _unpack_strings(buffer: bytes, offset: int, n: int) -> tuple[list[str], int]:
+    ends, offset = _unpack("I", buffer, offset, n)
+    size = ends[-1] if ends else 0
+    blob = buffer[offset : offset + size]
+    starts = [0, *ends[:-1]]
+    if blob.isascii():
+        text = blob.decode("ascii")
+        return [text[a:b] for a, b in zip(starts, ends)], offset + size
+    return [blob[a:b].decode("utf-8") for a, b in zip(starts, ends)], offset + size
+
+
+def _pack_bitmap(present: Sequence[bool]) -> bytes:
+    out = bytearray((len(present) + 7) // 8)
+    for i, p in enumerate(present):
+        if p:
+            out[i >> 3] |= 1 << (i & 7)
+    return bytes(out)
+
+
+def _unpack_bitmap(buffer: bytes, offset: int, n: int) -> tuple[list[bool], int]:
+    size = (n + 7) // 8
+    bits = buffer[offset : offset + size]
+    return [bool(bits[i >> 3] >> (i & 7) & 1) for i in range(n)], offset + size
+
+
+def _fits_int64(values: Sequence[int]) -> bool:
+    return not values or (_I64[0] <= min(values) and max(values) <= _I64[1])
+
+
+def _encode_values(key: str, values: list[Any]) -> tuple[bytes, bytes]:
+    """Encoding code and payload for non-None values of a single type."""
+    types = set(map(type, values))
+    if len(types) != 1:
+        names = ", ".join(sorted(t.__name__ for t in types))
+        raise TypeError(f"extra[{key!r}] mixes value types ({names}); cannot encode")
+    (kind,) = types
+    if kind is int and _fits_int64(values):
+        return b"q", _pack("q", values)
+    if kind is bool:
+        return b"?", bytes(values)
+    if kind is float:
+        return b"f", _pack("d", values)
+    if kind is _dt.date:
+        return b"d", _pack("i", [v.toordinal() - _EPOCH for v in values])
+    if kind is _dt.datetime and all(v.tzinfo is None for v in values):
+        return b"t", _pack("q", [(v - _EPOCH_DATETIME) // _dt.timedelta(microseconds=1) for v in values])
+    if kind is str:
+        return b"s", _pack_strings(values)
+    if kind is tuple:
+        flat = [x for v in values for x in v]
+        if all(type(x) is int for x in flat) and _fits_int64(flat):
+            return b"l", _pack("H", [len(v) for v in values]) + _pack("q", flat)
+        raise TypeError(f"extra[{key!r}] holds tuples of values other than int64; cannot encode")
+    raise TypeError(f"extra[{key!r}] has a value of type {kind.__name__} that cannot be encoded")
+
+
+def _encode_column(key: str, values: list[Any]) -> tuple[bytes, bytes, bool]:
+    """Encoding for one extra column; returns ``(code, payload, nullable)``."""
+    present = [v is not None for v in values]
+    if not any(present):
+        return b"n", b"", False
+    if all(present):
+        code, payload = _encode_values(key, values)
+        return code, payload, False
+    code, payload = _encode_values(key, [v for v in values if v is not None])
+    return code, _pack_bitmap(present) + payload, True
+
+
+def _decode_values(code: bytes, buffer: bytes, offset: int, n: int) -> tuple[list[Any], int]:
+    if code == b"s":
+        return _unpack_strings(buffer, offset, n)
+    if code == b"l":
+        lengths, offset = _unpack("H", buffer, offset, n)
+        flat, offset = _unpack("q", buffer, offset, sum(lengths))
+        ends = list(accumulate(lengths))
+        return [tuple(flat[end - length : end]) for end, length in zip(ends, lengths)], offset
+    typecode = _ARRAYS.get(code)
+    if typecode is None:
+        raise ValueError(f"Unknown column encoding {code!r}")
+    values, offset = _unpack(typecode, buffer, offset, n)
+    if code == b"?":
+        values = [bool(v) for v in values]
+    elif code == b"d":
+        fromordinal = _dt.date.fromordinal
+        values = [fromordinal(v + _EPOCH) for v in values]
+    elif code == b"t":
+        values = [_EPOCH_DATETIME + _dt.timedelta(microseconds=v) for v in values]
+    return values, offset
+
+
+def _decode_column(code: bytes, nullable: int, buffer: bytes, offset: int, n: int) -> tuple[list[Any], int]:
+    if code == b"n":
+        return [None] * n, offset
+    if not nullable:
+        return _decode_values(code, buffer, offset, n)
+    present, offset = _unpack_bitmap(buffer, offset, n)
+    values, offset = _decode_values(code, buffer, offset, sum(present))
+    it = iter(values)
+    return [next(it) if p else None for p in present], offset
+
+
+def encode_batch(results: Sequence[Optional[ParsedID]]) -> bytes:
+    """Pack parse results (``None`` for invalid rows) into one buffer.
+
+    Raises:
+        TypeError: If an ``extra`` column holds a value type the format does not
+            support, or mixes types.
+    """
+    strings: dict[Optional[str], int] = {None: _NONE_INDEX}
+    intern = strings.setdefault
+    present = [p for p in results if p is not None]
+
+    def index(values: Sequence[Optional[str]]) -> list[int]:
+        return [intern(v, len(strings) - 1) for v in values]
+
+    countries = index([p.country_code for p in present])
+    id_types = index([p.id_type for p in present])
+    genders = index([p.gender for p in present])
+    dobs = [p.dob.toordinal() - _EPOCH if p.dob is not None else 0 for p in present]
+
+    schemas: dict[tuple[str, ...], int] = {}
+    schema_rows: list[list[tuple[Any, ...]]] = []
+    schema_index = []
+    for p in present:
+        extra = p.extra
+        if extra is None:
+            schema_index.append(_NONE_INDEX)
+            continue
+        keys = tuple(extra)
+        i = schemas.get(keys)
+        if i is None:
+            i = schemas[keys] = len(schemas)
+            schema_rows.append([])
+        schema_rows[i].append(tuple(extra.values()))
+        schema_index.append(i)
+    for keys in schemas:
+        index(keys)
+    if len(strings) > _NONE_INDEX or len(schemas) >= _NONE_INDEX:
+        raise ValueError("Too many distinct strings or extra schemas for one buffer")
+
+    # Records that are None keep zeroed header fields and no flags.
+    flags = [
+        _PRESENT | (_HAS_DOB if p.dob is not None else 0) | (_HAS_EXTRA if p.extra is not None else 0)
+        for p in present
+    ]
+    if len(present) != len(results):
+        mask = [p is not None for p in results]
+
+        def scatter(values: list[Any], fill: Any) -> list[Any]:
+            it = iter(values)
+            return [next(it) if m else fill for m in mask]
+
+        countries, id_types, genders = (scatter(c, _NONE_INDEX) for c in (countries, id_types, genders))
+        dobs, flags = scatter(dobs, 0), scatter(flags, 0)
+        schema_index = scatter(schema_index, _NONE_INDEX)
+    id_numbers = [p.id_number.encode("utf-8") if p is not None else b"" for p in results]
+    ids_blob = b"".join(id_numbers)
+
+    parts = [_HEADER.pack(MAGIC, VERSION, 0, len(results), len(strings) - 1, len(schemas))]
+    for s in list(strings)[1:]:
+        data = s.encode("utf-8")  # type: ignore[union-attr]
+        parts.append(_U16.pack(len(data)) + data)
+    parts += [
+        _pack("H", countries),
+        bytes(flags),
+        _pack("H", id_types),
+        _pack("H", genders),
+        _pack("i", dobs),
+        _pack("H", schema_index),
+        _pack("H", [len(v) for v in id_numbers]),
+        _U32.pack(len(ids_blob)),
+        ids_blob,
+    ]
+    for keys, rows in zip(schemas, schema_rows):
+        parts.append(_SCHEMA.pack(len(keys), len(rows)))
+        for key, column in zip(keys, zip(*rows)):
+            code, payload, nullable = _encode_column(key, list(column))
+            parts.append(_FIELD.pack(strings[key], code, nullable))
+            parts.append(payload)
+    return b"".join(parts)
+
+
+def decode_batch(buffer: bytes) -> list[Optional[ParsedID]]:
+    """Inverse of ``encode_batch``.
+
+    Raises:
+        ValueError: If ``buffer`` is not a parse-result buffer of this version.
+    """
+    buffer = bytes(buffer)
+    magic, version, _, n, n_strings, n_schemas = _HEADER.unpack_from(buffer, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("Not a parse-result buffer (or unsupported version)")
+    offset = _HEADER.size
+
+    strings: list[Optional[str]] = []
+    for _ in range(n_strings):
+        (length,) = _U16.unpack_from(buffer, offset)
+        strings.append(buffer[offset + 2 : offset + 2 + length].decode("utf-8"))
+        offset += 2 + length
+    strings += [None] * (_NONE_INDEX + 1 - len(strings))  # so 0xFFFF decodes to None
+
+    countries, offset = _unpack("H", buffer, offset, n)
+    flags = buffer[offset : offset + n]
+    offset += n
+    id_types, offset = _unpack("H", buffer, offset, n)
+    genders, offset = _unpack("H", buffer, offset, n)
+    dobs, offset = _unpack("i", buffer, offset, n)
+    schema_index, offset = _unpack("H", buffer, offset, n)
+    lengths, offset = _unpack("H", buffer, offset, n)
+    (size,) = _U32.unpack_from(buffer, offset)
+    offset += 4
+    raw = buffer[offset : offset + size]
+    ends = list(accumulate(lengths))
+    if raw.isascii():
+        text = raw.decode("ascii")
+        id_numbers = [text[end - length : end] for end, length in zip(ends, lengths)]
+    else:
+        id_numbers = [raw[end - length : end].decode("utf-8") for end, length in zip(ends, lengths)]
+    offset += size
+
+    extras: list[Optional[dict[str, Any]]] = [None] * n
+    schema_rows: list[list[int]] = [[] for _ in range(n_schemas)]
+    for j, s in enumerate(schema_index):
+        if s != _NONE_INDEX:
+            schema_rows[s].append(j)
+    for rows in schema_rows:
+        n_fields, n_rows = _SCHEMA.unpack_from(buffer, offset)
+        offset += _SCHEMA.size
+        keys, columns = [], []
+        for _ in range(n_fields):
+            key, code, nullable = _FIELD.unpack_from(buffer, offset)
+            column, offset = _decode_column(code, nullable, buffer, offset + _FIELD.size, n_rows)
+            keys.append(strings[key])
+            columns.append(column)
+        dicts = map(dict, map(zip, repeat(keys), zip(*columns) if columns else [()] * n_rows))
+        if len(rows) == n:
+            extras = list(dicts)
+        else:
+            for j, extra in zip(rows, dicts):
+                extras[j] = extra
+
+    fromordinal = _dt.date.fromordinal
+    dob_values = [fromordinal(d + _EPOCH) if f & _HAS_DOB else None for d, f in zip(dobs, flags)]
+    parsed = map(
+        ParsedID,
+        [strings[c] for c in countries],
+        id_numbers,
+        [strings[t] for t in id_types],
+        dob_values,
+        [strings[g] for g in genders],
+        extras,
+    )
+    if all(flags):
+        return list(parsed)
+    return [p if f & _PRESENT else None for p, f in zip(parsed, flags)]
+
+
+def encode_parsed(parsed: Optional[ParsedID]) -> bytes:
+    """Encode a single result (a one-record batch)."""
+    return encode_batch([parsed])
+
+
+def decode_parsed(buffer: bytes) -> Optional[ParsedID]:
+    (parsed,) = decode_batch(buffer)
+    return parsed
@@ -0,0 +1,106 @@
+import pickle
+import random
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from id_validation import ValidatorFactory
+from id_validation.aggregate import Demographics, aggregate, aggregate_mixed
+from id_validation.parallel import parse_parallel
+
+from tests.utils import fuzz
+
+
+def _expected(country, ids, field):
+    validator = ValidatorFactory.get_validator(country)
+    counts = Counter()
+    for v in ids:
+        if not validator.validate(v):
+            continue
+        p = validator.parse(v)
+        if field == "year":
+            counts[p.dob.year if p.dob else None] += 1
+        elif field == "gender":
+            counts[p.gender] += 1
+        else:
+            value = (p.extra or {}).get(field)
+            counts[getattr(value, "name", value)] += 1
+    return dict(counts)
+
+
+@pytest.mark.parametrize(
+    "country,field",
+    [("ZA", "citizenship"), ("ZW", "registration_region"), ("RO", "county_name"), ("MX", "state_name"), ("EC", "province_name")],
+)
+def test_matches_scalar_parse(country, field):
+    ids = fuzz(country, 400)
+    d = aggregate(country, iter(ids), chunk_size=64)
+    axis = "citizenship" if field == "citizenship" else "region"
+    assert d.by(axis) == _expected(country, ids, field)
+    assert d.by("year") == _expected(country, ids, "year")
+    assert d.rows == len(ids)
+    assert d.valid == sum(ValidatorFactory.get_validator(country).validate(v) for v in ids)
+
+
+def test_reasons_and_formats_without_fields():
+    d = aggregate("NL", ["111222333", "111222334", "1234", ""])
+    assert d.by_reason() == {"VALID": 1, "LENGTH": 2, "INVALID": 1}
+    assert d.by("year") == {None: 1} and d.by("region") == {None: 1}
+
+
+@pytest.mark.parametrize(
+    "country,ids,expected",
+    [
+        # A non-ASCII row with the right number of characters but not of bytes is a LENGTH row.
+        ("ZA", ["7106245929185", "7106245929186", "71062459291", "", "ü" * 13], {"VALID": 1, "LENGTH": 3, "INVALID": 1}),
+        ("DK", ["010203-4123", "bogus", "", "ü"], {"VALID": 1, "LENGTH": 1, "INVALID": 2}),
+    ],
+)
+def test_reasons_match_parse_parallel(country, ids, expected):
+    d = aggregate(country, ids)
+    assert d.by_reason() == expected
+    assert d.reasons.tolist() == np.bincount(parse_parallel(country, ids, workers=1).reason, minlength=3).tolist()
+
+
+def test_scalar_fallback_country():
+    ids = ["010203-4123", "010203-4124", "bogus"]
+    d = aggregate("DK", ids)
+    assert d.by("year") == _expected("DK", ids, "year")
+    assert d.by("gender") == _expected("DK", ids, "gender")
+
+
+def test_merge_equals_single_pass():
+    ids = fuzz("ZW", 600)
+    whole = aggregate("ZW", ids)
+    parts = [aggregate("ZW", ids[i::3]) for i in range(3)]
+    # Counted in another order, the region labels get different slots.
+    parts[1] = aggregate("ZW", list(reversed(ids[1::3])))
+    merged = parts[0] + parts[1] + parts[2]
+    for axis in ("year", "gender", "region"):
+        assert merged.by(axis) == whole.by(axis)
+    assert merged.by_reason() == whole.by_reason()
+    with pytest.raises(ValueError):
+        merged.merge(Demographics("ZA"))
+
+
+def test_serialization_round_trip():
+    d = aggregate("ZA", fuzz("ZA", 200))
+    for copy in (Demographics.from_dict(d.to_dict()), pickle.loads(pickle.dumps(d))):
+        assert np.array_equal(copy.counts, d.counts) and copy.labels == d.labels
+        assert copy.by_reason() == d.by_reason()
+
+
+def test_mixed_stream():
+    za, ro = fuzz("ZA", 100), fuzz("RO", 100)
+    ids = za + ro + ["x"]
+    countries = ["ZA"] * len(za) + ["RO"] * len(ro) + ["QQ"]
+    rng = random.Random(0)
+    order = list(range(len(ids)))
+    rng.shuffle(order)
+    out = aggregate_mixed((ids[i] for i in order), (countries[i] for i in order), chunk_size=50)
+    assert sorted(out) == ["RO", "ZA"]
+    assert out["ZA"].by_reason() == aggregate("ZA", za).by_reason()
+    assert out["RO"].by("region") == aggregate("RO", ro).by("region")
+    with pytest.raises(ValueError):
+        aggregate_mixed(["1", "2"], ["ZA"])
@@ -0,0 +1,77 @@
+import datetime as dt
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+
+from id_validation.arrow import parse_arrow, validate_arrow  # noqa: E402
+from id_validation.batch import parse_batch  # noqa: E402
+
+
+ZA_IDS = ["7106245929185", "7106245929181", None, " 7106245929185", "710624592918", "0303068942075"]
+
+
+def test_validate_string_array():
+    mask = validate_arrow("ZA", pa.array(ZA_IDS))
+    assert mask.type == pa.bool_()
+    assert mask.to_pylist() == [True, False, False, True, False, True]
+
+
+def test_large_string_and_slices():
+    arr = pa.array(ZA_IDS, type=pa.large_string())
+    assert validate_arrow("ZA", arr).to_pylist() == [True, False, False, True, False, True]
+    assert validate_arrow("ZA", arr.slice(3, 3)).to_pylist() == [True, False, True]
+
+
+def test_densely_packed_column():
+    arr = pa.array(["7106245929185", "7106245929181", "0303068942075"])
+    assert validate_arrow("ZA", arr).to_pylist() == [True, False, True]
+
+
+def test_parse_returns_typed_columns():
+    table = parse_arrow("ZA", pa.array(ZA_IDS))
+    assert table.schema.field("dob").type == pa.date32()
+    assert pa.types.is_dictionary(table.schema.field("gender").type)
+    assert table.column("dob").to_pylist()[0] == dt.date(1971, 6, 24)
+    assert table.column("gender").to_pylist() == ["M", None, None, "M", None, "M"]
+    assert table.column("citizenship").to_pylist()[0] == "PERMANENT_RESIDENT"
+
+
+def test_formatted_rows_are_normalized():
+    arr = pa.array(["529.982.247-25", "52998224725", "529.982.247-24"])
+    assert validate_arrow("BR", arr).to_pylist() == [True, True, False]
+    assert parse_arrow("BR", arr).column("check_digits").to_pylist()[0] == [2, 5]
+
+
+def test_exact_width_rows_are_normalized():
+    assert validate_arrow("IT", pa.array(["rssmra85m01h501q", "RSSMRA85M01H501Q", "RSSMRA85M01H501X"])).to_pylist() == [
+        True,
+        True,
+        False,
+    ]
+    mx = ["gode900101hdfrrn08", "GODE900101HDFRRN08"]
+    assert validate_arrow("MX", pa.array(mx)).to_pylist() == [True, True]
+    assert parse_arrow("MX", pa.array(mx)).column("state_code").to_pylist() == ["DF", "DF"]
+    # Exact-width rows with a separator or non-ASCII byte go through the scalar normalizer.
+    assert validate_arrow("PL", pa.array(["4405140145 ", "44051401458"])).to_pylist() == [False, True]
+
+
+def test_chunked_array_matches_batch():
+    ids = ["44051401458", "44051401459", "02070803628"]
+    chunked = pa.chunked_array([ids[:1], ids[1:]])
+    table = parse_arrow("PL", chunked)
+    expected = parse_batch("PL", ids)
+    assert table.column("valid").to_pylist() == list(expected.valid)
+    assert table.column("serial").to_pylist() == [expected.value("serial", i) for i in range(3)]
+    assert isinstance(validate_arrow("PL", chunked), pa.ChunkedArray)
+
+
+def test_fallback_country():
+    table = parse_arrow("FI", pa.array(["131052-308T", None]))
+    assert table.column("valid").to_pylist() == [True, False]
+    assert table.column("individual_number").to_pylist() == [308, None]
+
+
+def test_rejects_non_string_arrays():
+    with pytest.raises(TypeError):
+        validate_arrow("ZA", pa.array([1, 2]))
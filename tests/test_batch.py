@@ -0,0 +1,147 @@
+import datetime as dt
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from id_validation import ValidatorFactory  # noqa: E402
+from id_validation.batch import (  # noqa: E402
+    encode_fixed_width,
+    group_rows,
+    parse_batch,
+    parse_mixed,
+    parse_south_africa_batch,
+    validate_batch,
+    validate_mixed,
+)
+from id_validation.validators.kernels import KERNELS  # noqa: E402
+
+from tests.utils import TEMPLATES, fuzz, repair  # noqa: E402
+
+
+def test_every_template_has_a_kernel():
+    assert set(TEMPLATES) == set(KERNELS)
+
+
+@pytest.mark.parametrize("country", sorted(TEMPLATES))
+def test_kernel_matches_scalar_parse(country):
+    validator = ValidatorFactory.get_validator(country)
+    ids = fuzz(country)
+    result = parse_batch(country, ids)
+    assert result.valid.sum() > 50
+    for i, id_number in enumerate(ids):
+        try:
+            expected = validator.parse(id_number)
+        except Exception:
+            expected = None
+        assert result.to_parsed(i) == expected, id_number
+
+
+def test_south_africa_batch_matches_separate_batches():
+    ids = fuzz("ZA") + fuzz("ZA_OLD")
+    combined = parse_south_africa_batch(ids)
+    for country in ("ZA", "ZA_OLD"):
+        separate = parse_batch(country, ids)
+        assert np.array_equal(combined[country].valid, separate.valid)
+        assert [combined[country].to_parsed(i) for i in range(len(ids))] == [
+            separate.to_parsed(i) for i in range(len(ids))
+        ]
+
+
+def test_zimbabwe_kernel_buckets_by_length():
+    validator = ValidatorFactory.get_validator("ZW")
+    ids = ["50-025544-Q-12", "63-1174850-T-45", "63 1174850 T 45", "50-925544-Q-12", "63-751545-G-63", "x"]
+    result = parse_batch("ZW", ids)
+    assert list(result.valid) == [validator.validate(v) for v in ids]
+    assert result.categories["district"][result.columns["district"][1]] == "Mt. Darwin"
+    assert [result.to_parsed(i) for i in range(len(ids))] == [
+        validator.parse(v) if validator.validate(v) else None for v in ids
+    ]
+
+
+def test_italy_kernel_accepts_omocodic_codes():
+    validator = ValidatorFactory.get_validator("IT")
+    rng = random.Random("omocodia")
+    ids = []
+    for _ in range(200):
+        chars = list("RSSMRA85M01H501Z")
+        for i in rng.sample([6, 7, 9, 10, 12, 13, 14], rng.randint(1, 7)):
+            chars[i] = "LMNPQRSTUV"[int(chars[i])]
+        ids.append(repair("".join(chars), validator) or "".join(chars))
+    result = parse_batch("IT", ids)
+    assert result.valid.sum() > 150
+    for i, id_number in enumerate(ids):
+        expected = validator.parse(id_number) if validator.validate(id_number) else None
+        assert result.to_parsed(i) == expected, id_number
+
+
+def test_fallback_matches_scalar_parse():
+    validator = ValidatorFactory.get_validator("FI")
+    ids = ["131052-308T", "131052-308U", "131052-308T", "bad"]
+    result = parse_batch("FI", ids)
+    assert result.rows is not None
+    assert list(result.valid) == [validator.validate(v) for v in ids]
+    assert result.to_parsed(0) == validator.parse(ids[0])
+    assert result.value("dob", 0) == validator.parse(ids[0]).dob
+
+
+def test_validate_batch_returns_mask():
+    mask = validate_batch("ZA", ["7106245929185", "7106245929181", "710624 5929185"])
+    assert mask.dtype == bool
+    assert list(mask) == [True, False, True]
+
+
+def test_dob_column_is_datetime64():
+    result = parse_batch("PL", ["44051401458", "44051401459"])
+    assert result.columns["dob"].dtype == np.dtype("datetime64[D]")
+    assert result.value("dob", 0) == dt.date(1944, 5, 14)
+    assert result.value("dob", 1) is None
+
+
+def test_encode_fixed_width_flags_other_lengths():
+    matrix, fits = encode_fixed_width(["123", "12", "4é6"], 3)
+    assert list(fits) == [True, False, True]
+    assert bytes(matrix[0]) == b"123"
+    assert bytes(matrix[2]) == b"4?6"
+
+
+def test_unknown_country_raises():
+    with pytest.raises(ValueError):
+        parse_batch("XX", ["1"])
+
+
+def test_mixed_batch_scatters_results_back_in_input_order():
+    ids = ["7106245929185", "44051401458", "123", "7106245929181", "131052-308T", "1", "44051401458"]
+    countries = ["ZA", "PL", "XX", "ZA", "FI", None, "PL"]
+    result = parse_mixed(ids, countries)
+    assert result.valid.tolist() == [True, True, False, False, True, False, True]
+    assert result.known.tolist() == [True, True, False, True, True, False, True]
+    assert result.unknown_countries == ["XX", None]
+    for i, (v, c) in enumerate(zip(ids, countries)):
+        if result.known[i]:
+            validator = ValidatorFactory.get_validator(c)
+            expected = validator.parse(v) if validator.validate(v) else None
+            assert result.to_parsed(i) == expected
+        else:
+            assert result.to_parsed(i) is None
+    assert result.groups["PL"][0].tolist() == [1, 6]
+
+    valid, known = validate_mixed(ids, countries)
+    assert valid.tolist() == result.valid.tolist()
+    assert known.tolist() == result.known.tolist()
+
+
+def test_group_rows_is_stable():
+    groups = group_rows(["PL", "ZA", "PL", float("nan"), "QQ", "ZA"])
+    assert [(code, positions.tolist()) for code, positions in groups] == [
+        ("PL", [0, 2]),
+        ("ZA", [1, 5]),
+        (None, [3, 4]),
+    ]
+
+
+def test_mixed_batch_checks_lengths():
+    with pytest.raises(ValueError):
+        parse_mixed(["1", "2"], ["ZA"])
+    assert len(parse_mixed([], [])) == 0
@@ -0,0 +1,62 @@
+import pytest
+
+from id_validation import ValidatorFactory, ValidationError
+from id_validation.belfiore import BelfioreTable, Municipality, build_table, lookup, pack_code
+from id_validation.validate_italy import _cf_check_char
+
+
+def _cf(cf15: str) -> str:
+    return cf15 + _cf_check_char(cf15)
+
+
+def test_packaged_table_decodes_comuni_and_countries():
+    assert lookup("H501") == Municipality("H501", "Roma", "RM", True)
+    assert lookup("F205").name == "Milano"
+    assert lookup("Z404").province == "EE"
+    assert lookup("Z105").active is False  # Czechoslovakia
+
+
+@pytest.mark.parametrize("code", ["Z999", "H5", "h501", "5501", ""])
+def test_unknown_codes(code):
+    assert lookup(code) is None
+
+
+def test_build_and_read_roundtrip():
+    entries = [
+        Municipality("Z404", "Stati Uniti", "EE", True),
+        Municipality("A001", "Abano Terme", "PD", True),
+        Municipality("A355", "Tortolì", "NU", False),
+    ]
+    table = BelfioreTable(build_table(entries))
+    assert len(table) == 3
+    assert [table.entry(i).code for i in range(3)] == ["A001", "A355", "Z404"]
+    for entry in entries:
+        assert table.lookup(entry.code) == entry
+    assert "A002" not in table
+
+
+def test_build_rejects_bad_and_duplicate_codes():
+    with pytest.raises(ValueError):
+        build_table([Municipality("ND", "Unknown", "", True)])
+    with pytest.raises(ValueError):
+        build_table([Municipality("A001", "a", "PD", True), Municipality("A001", "b", "PD", False)])
+
+
+def test_pack_code():
+    assert pack_code("A000") == 0
+    assert pack_code("Z999") == 25999
+    assert pack_code("A0O1") == -1
+
+
+def test_italy_parse_decodes_municipality():
+    parsed = ValidatorFactory.get_validator("IT").parse(_cf("RSSMRA85M01H501"))
+    assert parsed.extra["municipality"] == "Roma"
+    assert parsed.extra["province"] == "RM"
+
+
+def test_italy_unknown_municipality_is_flagged_or_rejected():
+    cf = _cf("RSSMRA85M01Z999")
+    parsed = ValidatorFactory.get_validator("IT").parse(cf)
+    assert parsed.extra["municipality"] is None and parsed.extra["province"] is None
+    with pytest.raises(ValidationError, match="municipality"):
+        ValidatorFactory.get_validator("IT", strict_municipality=True).parse(cf)
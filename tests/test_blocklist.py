@@ -0,0 +1,86 @@
+import random
+
+import pytest
+
+from id_validation import ValidatorFactory
+from id_validation.blocklist import Blocklist, BlockedIDError, BlocklistedValidator, build_blocklist
+from id_validation.layout import LAYOUTS
+from id_validation.validate import ValidationError
+
+
+def _pesels(n, seed=0):
+    rng = random.Random(seed)
+    return list(dict.fromkeys(LAYOUTS["PL"].generate(rng) for _ in range(n)))
+
+
+def test_membership_is_exact():
+    blocked = _pesels(500)
+    others = [v for v in _pesels(5000, seed=1) if v not in set(blocked)]
+    bl = Blocklist.from_ids(blocked)
+    assert len(bl) == len(blocked)
+    assert all(v in bl for v in blocked)
+    assert not any(v in bl for v in others)
+    # The Bloom filter alone lets a few through; roughly 1% at 10 bits per entry.
+    false_positives = sum(bl.might_contain(v) for v in others)
+    assert false_positives < len(others) * 0.03
+    assert bl.nbytes <= len(blocked) * 10 // 8 + 8
+
+
+def test_empty_and_odd_lengths():
+    assert "44051401458" not in Blocklist.from_ids([])
+    bl = Blocklist.from_ids(["123", "12345678901234"])
+    assert "123" in bl and "12345678901234" in bl
+    assert "12" not in bl and "1234" not in bl and "123456789012345" not in bl
+    assert b"123" in bl and 123 not in bl
+
+
+def test_file_round_trip(tmp_path):
+    path = tmp_path / "blocked.idbl"
+    blocked = _pesels(100)
+    data = build_blocklist(blocked, path)
+    assert path.read_bytes() == data
+    bl = Blocklist.from_path(path)
+    assert all(v in bl for v in blocked)
+    with pytest.raises(ValueError, match="blocklist"):
+        Blocklist(b"\0" * 64)
+
+
+def test_blocklisted_validator():
+    pl = ValidatorFactory.get_validator("PL")
+    blocked, allowed = _pesels(2, seed=3)
+    v = BlocklistedValidator(pl, Blocklist.from_ids([blocked], normalizer=pl.normalizer))
+    assert v.country_code == "PL"
+    assert v.parse(f" {allowed} ") == pl.parse(allowed)
+    with pytest.raises(BlockedIDError, match="blocklisted"):
+        v.parse(f" {blocked} ")
+    assert issubclass(BlockedIDError, ValidationError)
+    assert not v.validate(blocked)
+    with pytest.raises(ValidationError, match="checksum"):
+        v.parse("44051401459")
+
+
+def test_build_normalizes_entries():
+    za = ValidatorFactory.get_validator("ZA")
+    bl = Blocklist.from_ids(["800101 5009 087"], normalizer=za.normalizer)
+    assert "8001015009087" in bl
+
+
+def test_batch_drops_blocked_rows():
+    pytest.importorskip("numpy")
+    from id_validation.batch import parse_batch
+
+    ids = _pesels(20, seed=4)
+    bl = Blocklist.from_ids(ids[:5])
+    result = parse_batch("PL", ids, blocklist=bl)
+    assert result.valid.tolist() == [False] * 5 + [True] * 15
+    assert result.to_parsed(0) is None
+    for name in ("dob", "gender", "serial"):
+        assert [result.value(name, i) for i in range(5)] == [None] * 5, name
+    assert result.value("dob", 5) is not None
+
+    # Countries without a kernel take the scalar path.
+    mx = ["GODE900101HDFRRN08", "GODE900101HDFRRN08"]
+    result = parse_batch("MX", mx, blocklist=Blocklist.from_ids(mx[:1]))
+    assert result.valid.tolist() == [False, False]
+    assert result.to_parsed(1) is None
+    assert result.value("dob", 0) is None and result.value("state_code", 0) is None
@@ -0,0 +1,65 @@
+import pytest
+
+from id_validation.composite import CompositeValidator
+from id_validation.normalize import Normalizer
+from id_validation.registry import DOCUMENT_TYPES, Signature, register_document
+from id_validation.validate import ValidationError
+from id_validation.validators.base import BaseValidator, ParsedID
+
+
+@pytest.fixture
+def country():
+    calls = []
+
+    def document(id_type, signature, accept):
+        @register_document("QQ", id_type, signature)
+        class Document(BaseValidator):
+            country_code = "QQ"
+
+            def parse(self, id_number):
+                calls.append(id_type)
+                if not accept(id_number):
+                    raise ValidationError(f"Invalid {id_type}")
+                return ParsedID(country_code="QQ", id_number=id_number, id_type=id_type)
+
+        return Document
+
+    document("SHORT", Signature((4,), "0123456789"), str.isdigit)
+    document("EVEN", Signature((6,), "0123456789"), lambda v: int(v) % 2 == 0)
+    document("ANY6", Signature((6,), "0123456789"), str.isdigit)
+
+    class Composite(CompositeValidator):
+        country_code = "QQ"
+        normalizer = Normalizer(" ")
+
+    yield Composite(), calls
+    del DOCUMENT_TYPES["QQ"]
+
+
+def test_routes_to_the_single_matching_type(country):
+    v, calls = country
+    assert v.parse("12 34").id_type == "SHORT"
+    assert calls == ["SHORT"]
+
+
+def test_overlapping_signatures_are_tried_in_registration_order(country):
+    v, calls = country
+    assert v.parse("123456").id_type == "EVEN"
+    assert v.parse("123457").id_type == "ANY6"
+    assert calls == ["EVEN", "EVEN", "ANY6"]
+    assert v.route("123457") == ["EVEN", "ANY6"]
+
+
+def test_unroutable_ids_are_rejected_without_parsing(country):
+    v, calls = country
+    assert not v.validate("12345")
+    assert not v.validate("A234")
+    assert calls == []
+
+
+def test_composite_countries():
+    from id_validation import VALIDATORS
+
+    composites = {code for code, cls in VALIDATORS.items() if issubclass(cls, CompositeValidator)}
+    assert composites == {"ES"}  # AR/BR/CO/EC stay single-type; see id_validation.composite
+    assert set(DOCUMENT_TYPES["ES"]) == {"DNI", "NIE", "CIF"}
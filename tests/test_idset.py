@@ -0,0 +1,100 @@
+import pickle
+import random
+
+import numpy as np
+import pytest
+
+from id_validation import ValidatorFactory
+from id_validation.idset import COUNTRY_CODES, IdSet, dedupe, pack, unpack
+from id_validation.layout import LAYOUTS
+from id_validation.pool import ValidatorPool
+from id_validation.registry import VALIDATORS, register
+from id_validation.validators.base import BaseValidator, ParsedID
+
+from tests.utils import fuzz
+
+
+def _ids(country, n, seed=0):
+    rng = random.Random(seed)
+    return [LAYOUTS[country].generate(rng) for _ in range(n)]
+
+
+@pytest.mark.parametrize("country", ["ZA", "SI", "IT", "MX", "ZW", "BR"])
+def test_matches_a_set_of_normalized_strings(country):
+    validator = ValidatorFactory.get_validator(country)
+    ids = fuzz(country, 400)
+    expected = {(country, validator.normalize(v)) for v in ids if validator.validate(v)}
+    s = IdSet.from_ids(country, ids)
+    assert len(s) == len(expected)
+    assert set(s) == expected
+    assert s.isin(country, ids).tolist() == [(country, validator.normalize(v)) in expected for v in ids]
+
+
+def test_leading_zeros_round_trip():
+    keys, packed = pack("CO", ["007", "7", "0000000000000", "123456789012345", "1234567890123456", "12a", ""])
+    assert packed.tolist() == [True, True, True, True, False, False, False]
+    assert [v for _, v in unpack(keys[packed])] == ["007", "7", "0000000000000", "123456789012345"]
+    assert len(set(keys[packed].tolist())) == 4
+    with pytest.raises(ValueError, match="key slot"):
+        pack("XX", ["1"])
+
+
+def test_set_algebra():
+    a_ids, b_ids = _ids("PL", 300), _ids("PL", 300, seed=1) + _ids("PL", 50)
+    a, b = IdSet.from_ids("PL", a_ids), IdSet.from_ids("PL", b_ids)
+    sa, sb = set(a), set(b)
+    assert set(a | b) == sa | sb
+    assert set(a & b) == sa & sb
+    assert set(a - b) == sa - sb
+    mixed = a | IdSet.from_ids("EE", _ids("EE", 20))
+    assert mixed.countries() == ["EE", "PL"]
+    assert ("PL", a_ids[0]) in mixed and ("EE", a_ids[0]) not in mixed
+    assert mixed.isin("PL", a_ids).all()
+
+
+def test_dedupe_keeps_first_valid_occurrence():
+    pesels = _ids("PL", 5)
+    rows = [pesels[0], " " + pesels[0], pesels[1], "bogus", pesels[1], pesels[2]]
+    assert dedupe("PL", rows).tolist() == [True, False, True, False, False, True]
+    assert dedupe("IT", ["RSSMRA85M01H501Q", "rssmra85m01h501q"]).tolist() == [True, False]
+
+
+def test_footprint():
+    s = IdSet.from_ids("BG", _ids("BG", 10_000))
+    assert s.nbytes == 8 * len(s)
+    assert isinstance(s.keys, np.ndarray) and (np.diff(s.keys) > 0).all()
+
+
+def test_unknown_country():
+    with pytest.raises(ValueError):
+        IdSet.from_ids("QQ", ["1"])
+
+
+def test_keys_are_fixed_across_processes():
+    # ZA is slot 30 of COUNTRY_CODES: 30 << 55 | 13 digits << 51 | the digits.
+    s = IdSet.from_ids("ZA", ["7106245929185"])
+    assert s.keys.tolist() == [(30 << 55) | (13 << 51) | 7106245929185]
+    assert COUNTRY_CODES.index("ZA") == 30
+    assert set(VALIDATORS) <= set(COUNTRY_CODES)
+    mixed = s | IdSet.from_ids("IT", ["RSSMRA85M01H501Q"])
+    assert pickle.loads(pickle.dumps(mixed)) == mixed
+    assert IdSet.from_keys(mixed.keys.tolist(), mixed.other) == mixed
+    assert list(IdSet.from_keys([(30 << 55) | (13 << 51) | 7106245929185])) == [("ZA", "7106245929185")]
+
+
+def test_countries_outside_the_table_use_the_side_set():
+    @register("QQ")
+    class Validator(BaseValidator):
+        country_code = "QQ"
+
+        def parse(self, id_number):
+            return ParsedID(country_code="QQ", id_number=id_number)
+
+    pool = ValidatorPool()
+    try:
+        s = IdSet.from_ids("QQ", ["123", "123", "456"], pool=pool)
+        assert len(s.keys) == 0 and s.other == {("QQ", "123"), ("QQ", "456")}
+        assert s.isin("QQ", ["456", "789"], pool=pool).tolist() == [True, False]
+        assert dedupe("QQ", ["1", "1"], pool=pool).tolist() == [True, False]
+    finally:
+        del VALIDATORS["QQ"]
@@ -0,0 +1,295 @@
+import datetime as dt
+import random
+
+import pytest
+
+from id_validation import ValidatorFactory
+from id_validation.dates import CenturyGuessed, DateField, DatePrefix
+from id_validation.incremental import InputState, ReparseIncremental, Shape
+from id_validation.layout import LAYOUTS
+from id_validation.registry import VALIDATORS
+
+from tests.utils import fuzz
+
+
+INVALID, INCOMPLETE, COMPLETE_VALID = InputState.INVALID, InputState.INCOMPLETE, InputState.COMPLETE_VALID
+
+
+def _states(typer, text):
+    typer.reset()
+    return [typer.feed(ch) for ch in text]
+
+
+@pytest.mark.parametrize("country", sorted(LAYOUTS))
+def test_valid_ids_are_never_flagged_early(country):
+    validator = ValidatorFactory.get_validator(country)
+    typer = validator.incremental()
+    rng = random.Random(country)
+    for _ in range(200):
+        v = LAYOUTS[country].generate(rng)
+        assert _states(typer, v) == [INCOMPLETE] * (len(v) - 1) + [COMPLETE_VALID], v
+
+
+@pytest.mark.parametrize("country", sorted(LAYOUTS))
+def test_final_state_matches_validate_and_invalid_is_sticky(country):
+    validator = ValidatorFactory.get_validator(country)
+    typer = validator.incremental()
+    rng = random.Random(country)
+    for _ in range(300):
+        chars = list(LAYOUTS[country].generate(rng))
+        for _ in range(rng.randint(1, 2)):
+            chars[rng.randrange(len(chars))] = rng.choice("0123456789")
+        v = "".join(chars)
+        states = _states(typer, v)
+        assert (states[-1] is COMPLETE_VALID) == validator.validate(v), v
+        if INVALID in states:
+            assert set(states[states.index(INVALID) :]) == {INVALID}, v
+
+
+def test_errors_are_reported_on_the_first_bad_keystroke():
+    pl = ValidatorFactory.get_validator("PL").incremental()
+    assert _states(pl, "4413")[-1] is INVALID  # month 13 has no century offset
+    assert _states(pl, "44023")[-2:] == [INCOMPLETE, INVALID]  # no 30th of February
+    assert _states(pl, "44051401459")[-2:] == [INCOMPLETE, INVALID]  # wrong check digit
+
+    ee = ValidatorFactory.get_validator("EE").incremental()
+    assert _states(ee, "9") == [INVALID]  # no century/gender digit 9
+    assert _states(ee, "3") == [INCOMPLETE]
+
+
+def test_leap_day_depends_on_the_century():
+    # PESEL 2000-02-29 is valid (month + 20); 1900-02-29 is not.
+    pl = ValidatorFactory.get_validator("PL").incremental()
+    assert _states(pl, "002229")[-1] is INCOMPLETE
+    assert _states(pl, "000229")[-1] is INVALID
+    # Estonia: the century digit comes first, the year decides.
+    ee = ValidatorFactory.get_validator("EE").incremental()
+    assert _states(ee, "5040229")[-1] is INCOMPLETE
+    assert _states(ee, "5050229")[-1] is INVALID
+
+
+def test_separators_are_ignored_and_backspace_restores_state():
+    typer = ValidatorFactory.get_validator("PL").incremental()
+    assert typer.feed("440 514") is INCOMPLETE
+    assert typer.text == "440514"
+    assert typer.feed("9") is INCOMPLETE
+    assert typer.feed("1458") is INVALID
+    for _ in range(5):
+        typer.backspace()
+    assert typer.state is INCOMPLETE
+    assert typer.feed("01458") is COMPLETE_VALID
+    assert typer.feed("1") is INVALID  # too long
+    assert typer.backspace() is COMPLETE_VALID
+
+
+def test_fallback_for_validators_without_a_layout():
+    nl = ValidatorFactory.get_validator("NL").incremental()  # declares a checksum spec
+    assert _states(nl, "11122233")[-1] is INCOMPLETE
+    assert nl.feed("3") is COMPLETE_VALID
+    assert nl.feed("3") is INVALID
+    assert _states(nl, "12x") == [INCOMPLETE, INCOMPLETE, INVALID]
+
+    fi = ValidatorFactory.get_validator("FI").incremental()
+    assert _states(fi, "131052-308T")[-1] is COMPLETE_VALID
+    assert _states(fi, "131052-308")[-1] is INCOMPLETE
+
+
+CHECKSUM_SAMPLES = {
+    "ZA": "7106245929185",
+    "ZA_OLD": "4102068120179",
+    "RO": "1800101221144",
+    "SI": "0101006500006",
+    "CZ": "7801011230",
+    "NL": "111222333",
+    "PT": "123456789",
+    "AR": "20123456786",
+    "CA": "046454286",
+    "EC": "1710034065",
+}
+
+
+@pytest.mark.parametrize("country", sorted(CHECKSUM_SAMPLES))
+def test_checksum_formats_track_a_running_residue(country):
+    validator = ValidatorFactory.get_validator(country)
+    typer = validator.incremental()
+    assert type(typer).__name__ == "ChecksumIncremental"
+    sample = CHECKSUM_SAMPLES[country]
+    if not validator.short_lengths:
+        assert _states(typer, sample) == [INCOMPLETE] * (len(sample) - 1) + [COMPLETE_VALID]
+    rng = random.Random(country)
+    for _ in range(300):
+        chars = list(sample)
+        for _ in range(rng.randint(1, 2)):
+            chars[rng.randrange(len(chars))] = rng.choice("0123456789")
+        v = "".join(chars)
+        states = _states(typer, v)
+        assert (states[-1] is COMPLETE_VALID) == validator.validate(v), v
+        if INVALID in states:
+            assert set(states[states.index(INVALID) :]) == {INVALID}, v
+
+
+def test_checksum_formats_validate_only_at_complete_lengths(monkeypatch):
+    za = ValidatorFactory.get_validator("ZA")
+    calls = []
+    monkeypatch.setattr(za, "validate", lambda v: calls.append(v) or True)
+    typer = za.incremental()
+    assert _states(typer, "7106245929185")[-1] is COMPLETE_VALID
+    assert calls == ["7106245929185"]
+    calls.clear()
+    assert _states(typer, "7106245929181")[-1] is INVALID  # wrong Luhn digit, no re-parse needed
+    assert calls == []
+
+
+@pytest.mark.parametrize(
+    "country,text,first_invalid",
+    [
+        ("ZA", "9913", 4),  # month 13
+        ("ZA", "990231", 5),  # no 30th or 31st of February
+        ("ZA_OLD", "990230", 5),
+        ("CZ", "9913", 4),  # 13 is neither a month nor a month + 20/50/70
+        ("CZ", "9963", 4),
+        ("SK", "995230", 5),  # February (+50)
+        ("RO", "1991399", 5),
+        ("RO", "0", 1),  # no S digit 0
+        ("SI", "3102", 4),  # DDMMYYY: 31 February
+        ("SI", "2902001", 7),  # 2001 is not a leap year
+    ],
+)
+def test_checksum_formats_reject_impossible_dates_at_once(country, text, first_invalid):
+    states = _states(ValidatorFactory.get_validator(country).incremental(), text)
+    assert states.index(INVALID) == first_invalid - 1
+
+
+@pytest.mark.parametrize("country", ["ZA", "ZA_OLD", "RO", "SI"])
+def test_checksum_formats_with_dates_never_flag_valid_ids_early(country):
+    validator = ValidatorFactory.get_validator(country)
+    typer = validator.incremental()
+    ids = [validator.normalize(v) for v in fuzz(country, 400) if validator.validate(v)]
+    assert len(ids) > 100
+    for v in ids:
+        assert _states(typer, v) == [INCOMPLETE] * (len(v) - 1) + [COMPLETE_VALID], v
+
+
+def test_date_prefix_leap_days_follow_the_possible_centuries():
+    za = ValidatorFactory.get_validator("ZA").incremental()
+    assert _states(za, "000229")[-1] is INCOMPLETE  # 2000-02-29
+    assert _states(za, "010229")[-1] is INVALID
+    cz = ValidatorFactory.get_validator("CZ").incremental()
+    assert _states(cz, "005229")[-1] is INCOMPLETE  # a woman born 2000-02-29
+    assert _states(cz, "015229")[-1] is INVALID
+
+
+def test_date_prefix_matches_real_dates():
+    date = DateField(year=(0, 2), month=(2, 4), day=(4, 6), century=CenturyGuessed((1900, 2000)), month_offsets=(0, 50))
+    prefix = DatePrefix(date)
+    for yy in (0, 1, 4, 99):
+        for raw in range(100):
+            for dd in range(40):
+                month = raw - 50 if raw > 50 else raw
+                expected = False
+                for century in (1900, 2000):
+                    try:
+                        dt.date(century + yy, month, dd)
+                        expected = True
+                    except ValueError:
+                        pass
+                digits = [int(ch) for ch in f"{yy:02d}{raw:02d}{dd:02d}"]
+                assert prefix.feasible(digits) == expected, digits
+
+
+def test_legacy_short_rodne_cislo():
+    cz = ValidatorFactory.get_validator("CZ").incremental()
+    assert _states(cz, "780101123")[-1] is COMPLETE_VALID
+    assert cz.feed("0") is COMPLETE_VALID
+    assert cz.feed("0") is INVALID
+
+
+SHAPE_SAMPLES = {
+    "BE": "85073003328",
+    "BR": "52998224725",
+    "CL": "12.345.678-5",
+    "CO": "800197268-4",
+    "DK": "010203-4123",
+    "ES": "12345678Z",
+    "FI": "131052-308T",
+    "FR": "185072A00112381",
+    "HR": "12345678903",
+    "IT": "RSSMRA85M01H501Q",
+    "LV": "161175-19997",
+    "MX": "GODE900101HDFRRN08",
+    "NG": "35765421356",
+    "NO": "01019912368",
+    "SE": "811218-9876",
+    "TR": "10000000146",
+    "ZW": "50025544Q12",
+}
+
+
+def test_every_country_has_a_structured_incremental_validator():
+    for country in VALIDATORS:
+        assert not isinstance(ValidatorFactory.get_validator(country).incremental(), ReparseIncremental), country
+
+
+@pytest.mark.parametrize("country", sorted(SHAPE_SAMPLES))
+def test_shape_formats_are_never_flagged_early(country):
+    validator = ValidatorFactory.get_validator(country)
+    typer = validator.incremental()
+    assert type(typer).__name__ == "ShapeIncremental"
+    states = _states(typer, SHAPE_SAMPLES[country])
+    assert INVALID not in states and states[-1] is COMPLETE_VALID
+    assert typer.feed("0") is INVALID  # longer than the longest form
+
+
+@pytest.mark.parametrize(
+    "country,text,first_invalid",
+    [
+        ("ES", "12345678901234567890", 9),  # a DNI ends in a letter
+        ("IT", "RSSMRA85M01H501QQQQQ", 17),
+        ("MX", "1111", 1),  # a CURP starts with a letter
+        ("ZW", "!!!!", 1),
+        ("TR", "00000", 1),  # a TCKN cannot start with 0
+        ("FI", "131052X", 7),  # century sign
+        ("DK", "010203-41234", 12),
+    ],
+)
+def test_shape_formats_reject_impossible_input_at_once(country, text, first_invalid):
+    states = _states(ValidatorFactory.get_validator(country).incremental(), text)
+    assert states.index(INVALID) == first_invalid - 1
+    assert set(states[first_invalid - 1 :]) == {INVALID}
+
+
+def test_shape_formats_validate_only_complete_forms(monkeypatch):
+    se = ValidatorFactory.get_validator("SE")
+    calls = []
+    monkeypatch.setattr(se, "validate", lambda v: calls.append(v) or False)
+    typer = se.incremental()
+    # 10 digits is complete; the 12-digit form is still open, so a failed validate is not final.
+    assert _states(typer, "1981121898")[-1] is INCOMPLETE
+    assert calls == ["1981121898"]
+    assert typer.feed("76") is INVALID
+    assert calls == ["1981121898", "198112189876"]
+
+
+def test_shape_patterns():
+    digit = frozenset("0123456789")
+    assert set(Shape(r"^\d{1,2}(?:-[AB])?$").alternatives) == {
+        (digit,),
+        (digit, digit),
+        (digit, frozenset("-"), frozenset("AB")),
+        (digit, digit, frozenset("-"), frozenset("AB")),
+    }
+    assert Shape(r"[0-9LMNP-V\-]").alternatives == ((frozenset("0123456789LMNPQRSTUV-"),),)
+    for pattern in (r"\d+", r"[^0]", r"(\d", r"\d)", "."):
+        with pytest.raises(ValueError):
+            Shape(pattern)
+
+
+def test_reparse_fallback_stops_at_max_length():
+    class Validator(ValidatorFactory.get_validator("NG").__class__):
+        shape = None
+        max_length = 11
+
+    typer = Validator().incremental()
+    assert isinstance(typer, ReparseIncremental)
+    assert _states(typer, "35765421356") == [INCOMPLETE] * 10 + [COMPLETE_VALID]
+    assert typer.feed("1") is INVALID
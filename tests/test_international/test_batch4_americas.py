@@ -46,3 +46,7 @@ def test_mx_curp_multiple_scenarios():
 
     # invalid DOB (2003-02-29 doesn't exist, but checksum is correct)
     assert not v.validate("BADD030229MDFCCCA5")
+
+    # whitespace anywhere is ignored; non-ASCII digits are not
+    assert v.validate(" gode 900101\tHDFRRN08 ")
+    assert not v.validate("GODE\u0669\u0660\u0660101HDFRRN08")
@@ -65,3 +65,23 @@ def test_italy_codice_fiscale_invalid_checksum():
     bad = cf[:-1] + ("A" if cf[-1] != "A" else "B")
     with pytest.raises(ValidationError):
         v.parse(bad)
+
+
+def test_italy_codice_fiscale_omocodic():
+    v = ItalyCodiceFiscaleValidator()
+    # Digits at positions 15, 14 and 13 (1-indexed) replaced by omocodia letters.
+    cf15 = "RSSMRA85M01H5LM"  # H501 -> H5LM
+    cf = cf15 + cf_check_char(cf15)
+    parsed = v.parse(cf)
+    assert parsed.id_number == cf
+    assert parsed.dob.month == 8 and parsed.dob.day == 1
+    assert parsed.extra["municipality_code"] == "H501"
+    assert parsed.extra["omocodic"] is True
+    assert v.parse("RSSMRA85M01H501" + cf_check_char("RSSMRA85M01H501")).extra["omocodic"] is False
+
+
+@pytest.mark.parametrize("cf15", ["RSSMRA85M01H50A", "RSSMRA85M01HZ01", "RSSMR185M01H501"])
+def test_italy_codice_fiscale_rejects_letters_outside_omocodia(cf15):
+    v = ItalyCodiceFiscaleValidator()
+    with pytest.raises(ValidationError, match="format"):
+        v.parse(cf15 + cf_check_char(cf15))
@@ -1,5 +1,7 @@
 import pytest
 
+from id_validation import ValidatorFactory
+from id_validation.composite import CompositeValidator
 from id_validation.validate_spain import SpainDNINIEValidator
 from id_validation.validate import ValidationError
 
@@ -38,3 +40,29 @@ def test_spain_invalid_letter():
     bad = dni[:-1] + ("A" if dni[-1] != "A" else "B")
     with pytest.raises(ValidationError):
         v.parse(bad)
+
+
+@pytest.mark.parametrize("cif", ["A58818501", "B12345674", "Q2826000H", "P0800000B"])
+def test_spain_cif_valid(cif):
+    parsed = SpainDNINIEValidator().parse(cif)
+    assert parsed.id_type == "CIF"
+    assert parsed.extra["organization_type"] == cif[0]
+    assert parsed.extra["province_code"] == cif[1:3]
+
+
+@pytest.mark.parametrize("cif", ["A58818502", "A5881850A", "Q28260008", "I2826000H"])
+def test_spain_cif_invalid(cif):
+    with pytest.raises(ValidationError):
+        SpainDNINIEValidator().parse(cif)
+
+
+def test_spain_routes_by_signature():
+    v = ValidatorFactory.get_validator("ES")
+    assert isinstance(v, CompositeValidator)
+    assert v.route(make_dni(12345678)) == ["DNI"]
+    assert v.route(make_nie("Y", 1234567)) == ["NIE"]
+    assert v.route("b12345674") == ["CIF"]
+    assert v.route("12345") == []
+    assert set(v.document_validators) == {"DNI", "NIE", "CIF"}
+    with pytest.raises(ValidationError, match="DNI/NIE/CIF format"):
+        v.parse("12345")
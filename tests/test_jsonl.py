@@ -0,0 +1,96 @@
+import datetime as dt
+import io
+import json
+import random
+from enum import Enum
+
+import pytest
+
+from id_validation import ValidatorFactory
+from id_validation.jsonl import dumps, write_batch, write_jsonl
+from id_validation.layout import LAYOUTS
+from id_validation.validators.base import ParsedID
+
+
+def _generic(parsed):
+    def default(value):
+        if isinstance(value, dt.date):
+            return value.isoformat()
+        if isinstance(value, Enum):
+            return value.name
+        raise TypeError
+
+    data = {
+        "country_code": parsed.country_code,
+        "id_number": parsed.id_number,
+        "id_type": parsed.id_type,
+        "dob": parsed.dob,
+        "gender": parsed.gender,
+        "extra": parsed.extra or {},
+    }
+    return json.dumps(data, default=default, ensure_ascii=False, separators=(",", ":"))
+
+
+def _results():
+    out = [
+        ValidatorFactory.get_validator(country).parse(v)
+        for country, v in [
+            ("ZA", "7106245929185"),
+            ("IT", "RSSMRA85M01H501Q"),
+            ("MX", "GODE900101HDFRRN08"),
+            ("RO", "1800101221144"),
+            ("BE", "85073003328"),
+        ]
+    ]
+    rng = random.Random(0)
+    for layout in LAYOUTS.values():
+        out.extend(layout.parse(layout.generate(rng)) for _ in range(3))
+    return out
+
+
+def test_dumps_matches_json_dumps():
+    for parsed in _results():
+        assert dumps(parsed) == _generic(parsed)
+
+
+def test_unusual_values_and_keys():
+    class Kind(Enum):
+        A = 1
+
+    parsed = ParsedID(
+        country_code="XX",
+        id_number='1"\\\n',
+        extra={"100%": 1.5, 'q"uote': [1, None], "kind": Kind.A, "big": 1 << 70, "flag": False, "é": "ü"},
+    )
+    assert dumps(parsed) == _generic(parsed)
+    assert json.loads(dumps(parsed))["extra"]["kind"] == "A"
+
+
+def test_write_jsonl_chunks_and_invalid_rows():
+    results = _results() * 300 + [None]
+    out = io.StringIO()
+    assert write_jsonl(results, out) == len(results) - 1
+    lines = out.getvalue().splitlines()
+    assert lines == [_generic(p) for p in results[:-1]]
+
+    out = io.StringIO()
+    assert write_jsonl([None, results[0]], out, include_invalid=True) == 2
+    assert out.getvalue().splitlines()[0] == "null"
+
+
+@pytest.mark.parametrize("country", ["ZA", "RO", "IT", "PL", "BW", "MX"])
+def test_write_batch_matches_to_parsed(country):
+    pytest.importorskip("numpy")
+    from id_validation.batch import parse_batch
+
+    from tests.utils import fuzz
+
+    result = parse_batch(country, fuzz(country, 200))
+    assert result.valid.any() and not result.valid.all()
+    expected = [_generic(result.to_parsed(i)) for i in range(len(result)) if result.valid[i]]
+    out = io.StringIO()
+    assert write_batch(result, out) == len(expected)
+    assert out.getvalue().splitlines() == expected
+
+    out = io.StringIO()
+    assert write_batch(result, out, include_invalid=True) == len(result)
@@ -0,0 +1,132 @@
+import datetime as dt
+import random
+
+import pytest
+
+from id_validation import ValidatorFactory
+from id_validation.layout import (
+    LAYOUTS,
+    CenturyFromDigit,
+    DateField,
+    Field,
+    GenderDigit,
+    Layout,
+)
+from id_validation.suggest import ChecksumSpec
+from id_validation.validate import ValidationError
+
+
+@pytest.mark.parametrize("country", sorted(LAYOUTS))
+def test_generated_ids_validate(country):
+    layout = LAYOUTS[country]
+    validator = ValidatorFactory.get_validator(country)
+    rng = random.Random(country)
+    for _ in range(50):
+        v = layout.generate(rng)
+        assert validator.parse(v) == layout.parse(v)
+
+
+@pytest.mark.parametrize("country", sorted(c for c, layout in LAYOUTS.items() if layout.date is not None))
+def test_generate_with_dob_and_gender(country):
+    layout = LAYOUTS[country]
+    rng = random.Random(0)
+    for dob in (dt.date(1985, 7, 30), dt.date(2004, 2, 29)):
+        for gender in ("M", "F"):
+            parsed = layout.parse(layout.generate(rng, dob=dob, gender=gender))
+            assert (parsed.dob, parsed.gender) == (dob, gender)
+
+
+def test_generate_rejects_what_the_layout_cannot_encode():
+    with pytest.raises(ValueError, match="2300"):
+        LAYOUTS["LT"].generate(dob=dt.date(2300, 1, 1))
+    with pytest.raises(ValueError, match="date of birth"):
+        LAYOUTS["BW"].generate(dob=dt.date(1990, 1, 1))
+    with pytest.raises(ValueError, match="gender"):
+        LAYOUTS["BW"].generate(gender="X")
+
+
+def test_validators_expose_generate():
+    v = ValidatorFactory.get_validator("PL")
+    pesel = v.generate(random.Random(1), dob=dt.date(2010, 5, 17), gender="F")
+    assert pesel[2:4] == "25"  # month + 20 in the 2000s
+    assert v.validate(pesel)
+
+
+def test_two_stage_checksum_fallback():
+    # The first-stage sum of 3850730000 leaves 10, so the second weight set decides.
+    ee = LAYOUTS["EE"]
+    assert ee.parse("38507300007").extra == {"serial": 0, "checksum": 7}
+    with pytest.raises(ValidationError, match="checksum"):
+        ee.parse("38507300000")
+
+
+def test_layout_errors():
+    pl = LAYOUTS["PL"]
+    for bad, message in [
+        ("4405140145", "format"),
+        ("44051401458٣", "format"),
+        ("44051401459", "checksum"),
+        ("44131401459", "month"),
+        ("44023001455", "date of birth"),
+    ]:
+        with pytest.raises(ValidationError, match=message):
+            pl.parse(bad)
+
+
+@pytest.mark.parametrize(
+    "country, id_number, message",
+    [
+        ("BW", "12345", "Invalid Botswana ID format"),
+        ("EE", "123", "Invalid isikukood format"),
+        ("EE", "98507300005", "Invalid first digit"),
+        ("EE", "38513300000", "Invalid checksum"),  # checksum before date
+        ("LT", "123", "Invalid LT personal code format"),
+        ("LT", "78507300007", "Invalid first digit (century/gender)"),
+        ("LT", "38513300000", "Invalid date of birth"),  # date before checksum
+        ("PL", "123", "Invalid PESEL format"),
+        ("BG", "123", "Invalid EGN format"),
+    ],
+)
+def test_layout_validators_keep_their_messages(country, id_number, message):
+    with pytest.raises(ValidationError) as e:
+        ValidatorFactory.get_validator(country).parse(id_number)
+    assert str(e.value) == message
+
+
+def test_new_format_as_data():
+    # A made-up format: century digit, YYMMDD, gender digit, Luhn check digit.
+    layout = Layout(
+        country_code="XX",
+        id_type="TEST",
+        length=9,
+        checks=(ChecksumSpec.luhn(9),),
+        date=DateField(year=(1, 3), month=(3, 5), day=(5, 7), century=CenturyFromDigit(0, {1: 1900, 2: 2000})),
+        gender=GenderDigit.parity(7),
+        fields=(Field("century", kind="century"),),
+    )
+    assert layout.checksum_spec is layout.checks[0]
+    v = layout.generate(random.Random(2), dob=dt.date(1999, 12, 31), gender="M")
+    assert v.startswith("1991231")
+    parsed = layout.parse(v)
+    assert (parsed.dob, parsed.gender, parsed.extra) == (dt.date(1999, 12, 31), "M", {"century": 1900})
+
+
+def test_compiled_kernels_match_layout():
+    pytest.importorskip("numpy")
+    from id_validation.batch import parse_batch
+    from id_validation.validators.kernels import KERNELS
+
+    for country, layout in LAYOUTS.items():
+        assert KERNELS[country].widths == (layout.length,)
+        rng = random.Random(country)
+        ids = [layout.generate(rng) for _ in range(50)]
+        for v in ids[:50]:
+            i = rng.randrange(len(v))
+            ids.append(v[:i] + str(rng.randrange(10)) + v[i + 1 :])
+        result = parse_batch(country, ids)
+        for i, v in enumerate(ids):
+            try:
+                expected = layout.parse(v)
+            except ValidationError:
+                expected = None
+            assert result.to_parsed(i) == expected, (country, v)
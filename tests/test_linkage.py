@@ -0,0 +1,63 @@
+import random
+
+from id_validation import ValidatorFactory
+from id_validation.linkage import NearDuplicateIndex
+
+
+def _luhn_za(prefix12: str) -> str:
+    digits = [int(d) for d in prefix12]
+    total = sum(digits[-2::-2])
+    for d in digits[-1::-2]:
+        total += sum(divmod(d * 2, 10))
+    return prefix12 + str((10 - total % 10) % 10)
+
+
+def _brute_force(reference: list[str], q: str) -> list[str]:
+    out = []
+    for r in reference:
+        if len(r) != len(q) or r == q:
+            continue
+        diff = [i for i in range(len(q)) if r[i] != q[i]]
+        if len(diff) == 1:
+            out.append(r)
+        elif len(diff) == 2 and diff[1] == diff[0] + 1 and r[diff[0]] == q[diff[1]] and r[diff[1]] == q[diff[0]]:
+            out.append(r)
+    return sorted(out)
+
+
+def test_digit_neighbours_match_brute_force():
+    rng = random.Random(1)
+    reference = [f"{rng.randrange(10**6):06d}" for _ in range(3000)]
+    index = NearDuplicateIndex(ValidatorFactory.get_validator("ZA"), reference)
+    for q in rng.sample(reference, 50) + [f"{rng.randrange(10**6):06d}" for _ in range(50)]:
+        assert index.neighbours(q) == _brute_force(sorted(set(reference)), q)
+
+
+def test_string_neighbours_match_brute_force():
+    rng = random.Random(2)
+    alphabet = "ABC123"
+    reference = ["".join(rng.choice(alphabet) for _ in range(5)) for _ in range(1000)]
+    index = NearDuplicateIndex(ValidatorFactory.get_validator("IT"), reference)
+    for q in rng.sample(reference, 50):
+        assert index.neighbours(q) == _brute_force(sorted(set(reference)), q)
+
+
+def test_normalizes_queries_and_references():
+    v = ValidatorFactory.get_validator("ZA")
+    good = "7106245929185"
+    index = NearDuplicateIndex(v, [" 710624 5929185 "])
+    assert good in index
+    assert index.neighbours("7106245929158") == [good]  # transposed check digit
+    assert index.neighbours("71062 45929186") == [good]  # substitution + formatting
+    assert index.neighbours("71O6245929185") == [good]  # OCR letter O
+    assert index.neighbours(good) == []
+
+
+def test_only_valid_filters_neighbours():
+    v = ValidatorFactory.get_validator("ZA")
+    good = "7106245929185"
+    bad = _luhn_za("710624592918")[:-1] + "6"
+    index = NearDuplicateIndex(v, [good, bad])
+    q = "7106245929187"
+    assert index.neighbours(q) == [good, bad]
+    assert index.neighbours(q, only_valid=True) == [good]
@@ -0,0 +1,53 @@
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+SCRIPT = Path(__file__).resolve().parents[1] / "scripts" / "memory_benchmark.py"
+
+
+@pytest.fixture(scope="module")
+def bench():
+    spec = importlib.util.spec_from_file_location("memory_benchmark", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_every_country_has_inputs(bench):
+    from id_validation import VALIDATORS, ValidatorFactory
+
+    for country in VALIDATORS:
+        (v,) = bench._inputs(country, 1)
+        assert ValidatorFactory.get_validator(country).validate(v), country
+
+
+def test_measure_parse_breakdown(bench):
+    row = bench.measure_parse("ZA", 500)
+    assert row["retained"] > 0 and row["peak"] >= row["retained"]
+    assert row["dates"] > 0 and row["extra"] > 0
+    assert bench.measure_parse("NL", 500)["dates"] == 0
+
+
+def test_tables_include_lookup_tables(bench):
+    tables = bench.measure_tables()
+    assert "validate_zimbabwe._REGION_LOOKUP" in tables
+    assert "validate_zimbabwe.REGION_LOOKUP" not in tables  # alias counted once
+
+
+def test_check_flags_regressions(bench):
+    measured = {"parse_per_million": {"ZA": {"peak": 120, "retained": 100}}, "import": {"a.py": 50}, "tables": {}}
+    budgets = {"tolerance": 0.1, "parse_per_million": {"ZA": {"peak": 100, "retained": 100}}, "import": {"a.py": 10}}
+    failures = bench.check(measured, budgets)
+    assert len(failures) == 2
+    assert failures[0].startswith("parse_per_million.ZA.peak")
+    assert failures[1].startswith("import.a.py")
+
+
+def test_budgets_file_covers_registered_countries(bench):
+    import json
+
+    from id_validation import VALIDATORS
+
+    budgets = json.loads(bench.BUDGETS_PATH.read_text())
+    assert set(budgets["parse_per_million"]) == set(VALIDATORS)
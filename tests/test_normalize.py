@@ -0,0 +1,115 @@
+import re
+
+import pytest
+
+from id_validation import ValidatorFactory
+from id_validation.normalize import Normalizer
+from id_validation.validate import ValidationError
+
+
+SAMPLES = [
+    " 85.07.30-033.28 ",
+    "rssmra 85m01h501q\t",
+    " 529.982.247-25",
+    "50-025544-Q-12",
+    "78 01 01/1230",
+    "ñ ß x y",
+    "12\x003",
+    "-\t50025544Q12\n-",
+    "\u3000-50-025544-Q-12 ",
+    "",
+    "   ",
+]
+
+# Normalizer declarations and the hand-written normalizations they replace.
+EQUIVALENTS = [
+    (Normalizer(), lambda s: s.strip()),
+    (Normalizer(" "), lambda s: s.strip().replace(" ", "")),
+    (Normalizer(" -."), lambda s: s.strip().replace(" ", "").replace("-", "").replace(".", "")),
+    (Normalizer(" /"), lambda s: s.strip().replace(" ", "").replace("/", "")),
+    (Normalizer(" ", upper=True), lambda s: s.strip().upper().replace(" ", "")),
+    (Normalizer(".-", upper=True), lambda s: s.strip().upper().replace(".", "").replace("-", "")),
+    (Normalizer(whitespace=True), lambda s: re.sub(r"\s+", "", s.strip())),
+    (Normalizer(whitespace=True, upper=True), lambda s: "".join(s.split()).upper()),
+    (Normalizer(digits_only=True), lambda s: re.sub(r"[^0-9]", "", s.strip())),
+    (Normalizer(" -", strip_after=True), lambda s: s.replace("-", "").replace(" ", "").strip()),
+]
+
+
+@pytest.mark.parametrize("normalizer, reference", EQUIVALENTS, ids=[repr(n) for n, _ in EQUIVALENTS])
+def test_matches_reference(normalizer, reference):
+    for sample in SAMPLES:
+        assert normalizer(sample) == reference(sample), repr(sample)
+
+
+@pytest.mark.parametrize("normalizer", [n for n, _ in EQUIVALENTS], ids=[repr(n) for n, _ in EQUIVALENTS])
+def test_many_matches_scalar(normalizer):
+    assert normalizer.many(SAMPLES) == [normalizer(s) for s in SAMPLES]
+    assert normalizer.many(SAMPLES[:4]) == [normalizer(s) for s in SAMPLES[:4]]
+    assert normalizer.many([]) == []
+
+
+def test_validators_declare_normalizers():
+    assert ValidatorFactory.get_validator("BE").normalize(" 85.07.30-033.28 ") == "85073003328"
+    assert ValidatorFactory.get_validator("ZW").normalize_many(["50-025544-Q-12"]) == ["50025544Q12"]
+
+
+def test_zimbabwe_keeps_baseline_order():
+    # Separators are removed before stripping, as the original ZW normalize did.
+    v = ValidatorFactory.get_validator("ZW")
+    assert v.normalize("-\t50-025544-Q-12\t-") == "50025544Q12"
+    assert v.normalize(b"-\t50025544Q12 -") == "50025544Q12"
+    assert v.normalize_many(["-\t50025544Q12", "50025544Q12-\n"]) == ["50025544Q12", "50025544Q12"]
+    assert v.validate("-\t50-025544-Q-12")
+
+
+def test_france_accepts_spaced_and_compact_forms():
+    v = ValidatorFactory.get_validator("FR")
+    compact = "185057800608491"
+    assert v.validate(compact)
+    assert v.parse("1 85 05 78 006 084 91").id_number == compact
+    assert v.validate("1\t85 05 78 006 084\t91")
+
+
+@pytest.mark.parametrize("normalizer", [n for n, _ in EQUIVALENTS], ids=[repr(n) for n, _ in EQUIVALENTS])
+def test_bytes_like_input_matches_str(normalizer):
+    for sample in SAMPLES:
+        raw = sample.encode("utf-8")
+        expected = normalizer(sample)
+        assert normalizer(raw) == expected, repr(sample)
+        assert normalizer(bytearray(raw)) == expected, repr(sample)
+        assert normalizer(memoryview(raw)) == expected, repr(sample)
+    encoded = [s.encode("utf-8") for s in SAMPLES]
+    assert normalizer.many(encoded) == [normalizer(s) for s in SAMPLES]
+    assert normalizer.many(encoded[:4]) == [normalizer(s) for s in SAMPLES[:4]]
+    mixed = [SAMPLES[0], encoded[1], memoryview(encoded[2]), bytearray(encoded[3])]
+    assert normalizer.many(mixed) == [normalizer(s) for s in SAMPLES[:4]]
+
+
+def test_bytes_like_input_is_rejected_cleanly():
+    n = Normalizer(" ")
+    with pytest.raises(ValidationError):
+        n(b"\xff\xfe")
+    with pytest.raises(TypeError):
+        n(1234)  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize(
+    "country, id_number",
+    [("ZA", "7106245929185"), ("BE", "85.07.30-033.28"), ("IT", "RSSMRA85M01H501Q"), ("MX", "GODE900101HDFRRN08")],
+)
+def test_validators_accept_bytes_like_input(country, id_number):
+    v = ValidatorFactory.get_validator(country)
+    expected = v.parse(id_number)
+    raw = id_number.encode("ascii")
+    for value in (raw, bytearray(raw), memoryview(raw)):
+        assert v.validate(value)
+        assert v.parse(value) == expected
+
+
+def test_parse_batch_accepts_bytes_like_input():
+    from id_validation.batch import parse_batch
+
+    ids = [b"7106245929185", bytearray(b"7106245929181"), memoryview(b" 7106245929185 "), "7106245929185"]
+    assert parse_batch("ZA", ids).valid.tolist() == [True, False, True, True]
+    assert parse_batch("FI", [b"131052-308T", b"131052-308X"]).valid.tolist() == [True, False]
@@ -0,0 +1,55 @@
+import datetime as dt
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+import id_validation.pandas_accessor  # noqa: E402,F401
+
+
+def test_validate_single_country():
+    s = pd.Series(["7106245929185", "7106245929181", None, "710624 5929185"], index=[10, 11, 12, 13], name="id")
+    result = s.idv.validate("ZA")
+    assert list(result) == [True, False, False, True]
+    assert list(result.index) == [10, 11, 12, 13]
+    assert result.name == "id"
+
+
+def test_parse_kernel_country():
+    s = pd.Series(["44051401458", "44051401459"])
+    df = s.idv.parse("PL")
+    assert list(df["valid"]) == [True, False]
+    assert df.loc[0, "dob"] == pd.Timestamp(dt.date(1944, 5, 14))
+    assert pd.isna(df.loc[1, "dob"])
+    assert df.loc[0, "gender"] == "M"
+    assert df.loc[0, "id_type"] == "PESEL"
+    assert df.loc[0, "checksum"] == 8
+    assert pd.isna(df.loc[1, "serial"])
+
+
+def test_parse_fallback_country():
+    s = pd.Series(["131052-308T", "bad"])
+    df = s.idv.parse("FI")
+    assert list(df["valid"]) == [True, False]
+    assert df.loc[0, "individual_number"] == 308
+    assert df.loc[0, "gender"] == "F"
+
+
+def test_validate_mixed_countries():
+    df = pd.DataFrame(
+        {
+            "country": ["ZA", "PL", "XX", "ZA", None, "IT"],
+            "national_id": ["7106245929185", "44051401458", "123", "7106245929181", "1", "RSSMRA85M01H501Q"],
+        }
+    )
+    assert list(df.national_id.idv.validate(df.country)) == [True, True, False, False, False, True]
+
+
+def test_parse_mixed_countries_keeps_input_order():
+    ids = pd.Series(["44051401458", "7106245929185", "bad"], index=["a", "b", "c"])
+    df = ids.idv.parse(["PL", "ZA", "ZA"])
+    assert list(df.index) == ["a", "b", "c"]
+    assert list(df["valid"]) == [True, True, False]
+    assert df.loc["a", "dob"] == pd.Timestamp(1944, 5, 14)
+    assert df.loc["b", "citizenship"] == "PERMANENT_RESIDENT"
+    assert pd.isna(df.loc["a", "citizenship"])
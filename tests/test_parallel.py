@@ -0,0 +1,61 @@
+import pytest
+
+pytest.importorskip("numpy")
+
+import numpy as np  # noqa: E402
+
+from id_validation.batch import parse_batch  # noqa: E402
+from id_validation.parallel import NO_DOB, Reason, parse_parallel, validate_parallel  # noqa: E402
+
+from tests.utils import fuzz  # noqa: E402
+
+
+@pytest.mark.parametrize("country", ["ZA", "PL", "IT", "BW", "MX", "FI"])
+@pytest.mark.parametrize("workers", [1, 2])
+def test_matches_parse_batch(country, workers):
+    ids = (fuzz(country, 150) if country != "FI" else ["131052-308T", "131052-308X"] * 40) + ["", "1", "ß" * 13]
+    expected = parse_batch(country, ids)
+    result = parse_parallel(country, ids, workers=workers, chunk_size=64)
+    assert result.valid.tolist() == expected.valid.tolist()
+    if "dob" in expected.columns:
+        assert np.array_equal(result.dob, expected.columns["dob"], equal_nan=True)
+    else:
+        assert (result.dob_days == NO_DOB).all()
+    assert set(result.reason[result.valid].tolist()) <= {Reason.VALID}
+    assert Reason.VALID not in result.reason[~result.valid].tolist()
+    assert result.reason[-3] == Reason.LENGTH
+
+
+def test_reason_codes():
+    result = parse_parallel("ZA", ["7106245929185", "7106245929186", "71062459291", "x" * 40], workers=1)
+    assert result.reason.tolist() == [Reason.VALID, Reason.INVALID, Reason.LENGTH, Reason.LENGTH]
+    assert result.dob[0] == np.datetime64("1971-06-24")
+
+
+def test_parsed_results_come_back_through_wire_buffers():
+    ids = fuzz("PL", 100)
+    expected = parse_batch("PL", ids)
+    result = parse_parallel("PL", ids, workers=2, chunk_size=32, parsed=True)
+    assert result.parsed == [expected.to_parsed(i) for i in range(len(ids))]
+
+
+def test_empty_input():
+    assert len(parse_parallel("ZA", [], workers=2)) == 0
+    assert validate_parallel("ZA", ["7106245929185"], workers=2).tolist() == [True]
+
+
+@pytest.mark.parametrize("country, parsed", [("ZA", True), ("FI", False), ("FI", True)])
+def test_overlong_rows_are_not_packed(country, parsed, monkeypatch):
+    import id_validation.parallel as parallel
+
+    sizes = []
+    size = parallel._Block.size
+    monkeypatch.setattr(parallel._Block, "size", staticmethod(lambda n, width: sizes.append(width) or size(n, width)))
+    good = {"ZA": "7106245929185", "FI": "131052-308T"}[country]
+    result = parse_parallel(country, [good, "9" * 100_000, "ü" * 40], workers=1, parsed=parsed)
+    assert sizes == [len(good)]
+    assert result.valid.tolist() == [True, False, False]
+    assert result.reason.tolist() == [Reason.VALID, Reason.LENGTH, Reason.LENGTH]
+    assert result.dob[0] == np.datetime64({"ZA": "1971-06-24", "FI": "1952-10-13"}[country])
+    if parsed:
+        assert result.parsed[0].id_number == good and result.parsed[1:] == [None, None]
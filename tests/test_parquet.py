@@ -0,0 +1,80 @@
+import datetime as dt
+import random
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+ds = pytest.importorskip("pyarrow.dataset")
+
+from id_validation.batch import validate_batch  # noqa: E402
+from id_validation.layout import LAYOUTS  # noqa: E402
+from id_validation.parquet import PartitionedParquetWriter, write_parquet  # noqa: E402
+
+from tests.utils import fuzz  # noqa: E402
+
+
+def _read(root):
+    dataset = ds.dataset(root, partitioning="hive")
+    # Files of one country may differ in schema (see test_scalar_fallback_columns_appear_late).
+    schema = pa.unify_schemas([dataset.schema] + [f.physical_schema for f in dataset.get_fragments()])
+    return ds.dataset(root, partitioning="hive", schema=schema).to_table().sort_by("row")
+
+
+def test_mixed_stream_is_partitioned_and_typed(tmp_path):
+    za, pl = fuzz("ZA", 300), fuzz("PL", 300)
+    ids = [v for pair in zip(za, pl) for v in pair] + ["x"]
+    countries = ["ZA", "PL"] * len(za) + ["QQ"]
+    counts = write_parquet(tmp_path, iter(ids), iter(countries), chunk_size=97, row_group_size=128)
+    assert counts == {"ZA": len(za), "PL": len(pl)}
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["country_code=PL", "country_code=ZA"]
+
+    table = _read(tmp_path)
+    assert table.column("row").to_pylist() == list(range(len(ids) - 1))
+    assert table.schema.field("dob").type == pa.date32()
+    assert pa.types.is_dictionary(table.schema.field("gender").type)
+    assert table.column("country_code").to_pylist() == countries[:-1]
+    expected = [bool(v) for pair in zip(validate_batch("ZA", za), validate_batch("PL", pl)) for v in pair]
+    assert table.column("valid").to_pylist() == expected
+
+    f = pq.ParquetFile(tmp_path / "country_code=ZA" / "part-00000.parquet")
+    assert f.metadata.num_row_groups > 1
+    assert all(f.metadata.row_group(i).num_rows >= 128 for i in range(f.metadata.num_row_groups - 1))
+
+
+def test_single_country_and_valid_only(tmp_path):
+    rng = random.Random(0)
+    ids = [LAYOUTS["PL"].generate(rng) for _ in range(50)] + ["bogus"]
+    assert write_parquet(tmp_path, ids, "PL", include_invalid=False) == {"PL": 50}
+    table = _read(tmp_path)
+    assert table.column("valid").to_pylist() == [True] * 50
+    assert table.column("id_number").to_pylist() == ids[:50]
+    assert isinstance(table.column("dob")[0].as_py(), dt.date)
+
+
+def test_known_row_values(tmp_path):
+    write_parquet(tmp_path, ["7106245929185", "7106245929186", " 710624 5929 185"], "ZA")
+    rows = _read(tmp_path).to_pylist()
+    assert [r["id_number"] for r in rows] == ["7106245929185", "7106245929186", "7106245929185"]
+    assert [r["valid"] for r in rows] == [True, False, True]
+    assert rows[0]["dob"] == dt.date(1971, 6, 24) and rows[0]["gender"] == "M"
+    assert rows[0]["citizenship"] == "PERMANENT_RESIDENT" and rows[0]["country_code"] == "ZA"
+    assert rows[1]["dob"] is None and rows[1]["gender"] is None
+
+
+def test_scalar_fallback_columns_appear_late(tmp_path):
+    with PartitionedParquetWriter(tmp_path, row_group_size=2) as writer:
+        writer.write("DK", ["bad", "worse"])
+        writer.write("DK", ["010203-4123"])
+        writer.write("DK", ["nope"])
+    assert writer.rows_written == {"DK": 4}
+    directory = tmp_path / "country_code=DK"
+    assert sorted(p.name for p in directory.iterdir()) == ["part-00000.parquet", "part-00001.parquet"]
+    table = _read(tmp_path)
+    assert table.column("valid").to_pylist() == [False, False, True, False]
+    assert table.column("sequence").to_pylist() == [None, None, 4123, None]
+
+
+def test_unknown_country():
+    with pytest.raises(ValueError):
+        write_parquet("unused", ["1"], "QQ")
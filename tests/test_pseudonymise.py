@@ -0,0 +1,79 @@
+import datetime as dt
+import hashlib
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from id_validation.pseudonymise import pseudonymise_batch  # noqa: E402
+
+KEY = b"test-key-0123456789"
+
+
+def _token(v, digest_size=32):
+    return hashlib.blake2b(v.encode(), key=KEY, digest_size=digest_size).digest()
+
+
+def test_tokens_match_keyed_blake2_of_normalized_id():
+    result = pseudonymise_batch("ZA", ["800101 5009 087", "8001015009088", "", "8001015009087"], KEY)
+    assert result.valid.tolist() == [True, False, False, True]
+    assert result.tokens[0] == result.tokens[3] == _token("8001015009087")
+    assert result.tokens[1] == b"" and result.token_hex(1) is None
+    assert result.token_hex(0) == _token("8001015009087").hex()
+
+
+def test_plaintext_and_sensitive_fields_are_dropped():
+    result = pseudonymise_batch("PL", ["44051401458"], KEY, digest_size=16)
+    assert result.id_numbers is None
+    assert result.tokens.dtype.itemsize == 16 and result.tokens[0] == _token("44051401458", 16)
+    assert "dob" not in result.columns and "serial" not in result.columns
+    assert result.value("dob_year", 0) == 1944
+    assert result.value("gender", 0) == "M"
+    with pytest.raises(ValueError, match="without id_numbers"):
+        result.to_parsed(0)
+
+
+def test_region_fields_are_kept():
+    result = pseudonymise_batch("RO", ["1800101221144"], KEY)
+    assert result.valid[0]
+    assert "county_name" in result.columns and result.value("county_name", 0)
+
+
+def test_scalar_fallback_country():
+    result = pseudonymise_batch("MX", ["GODE900101HDFRRN08", "nope"], KEY)
+    assert result.valid.tolist() == [True, False]
+    assert result.tokens[0] == _token("GODE900101HDFRRN08")
+    assert result.value("dob_year", 0) == 1990 and result.value("dob_year", 1) is None
+    assert result.rows is None
+
+
+def test_key_separates_tokens():
+    a = pseudonymise_batch("ZA", ["8001015009087"], KEY).tokens[0]
+    b = pseudonymise_batch("ZA", ["8001015009087"], b"other-key").tokens[0]
+    assert a != b
+    with pytest.raises(ValueError):
+        pseudonymise_batch("ZA", ["8001015009087"], b"k" * 65)
+
+
+def test_dob_year_matches_parse_batch():
+    from id_validation.batch import parse_batch
+
+    ids = ["8001015009087", "0002290001082"]
+    parsed = parse_batch("ZA", ids)
+    result = pseudonymise_batch("ZA", ids, KEY)
+    for i in range(len(ids)):
+        dob = parsed.value("dob", i)
+        assert result.value("dob_year", i) == (dob.year if isinstance(dob, dt.date) else None)
+
+
+def test_kernel_declared_regions_are_kept():
+    zw = pseudonymise_batch("ZW", ["50-025544-Q-12"], KEY)
+    assert zw.valid[0]
+    assert zw.value("registration_region", 0) == "Mutasa"
+    assert zw.value("district", 0) == "Chivi"
+    assert "sequence_number" not in zw.columns and "check_letter" not in zw.columns
+
+    mx = pseudonymise_batch("MX", ["GODE900101HDFRRN08"], KEY)
+    assert mx.value("state_code", 0) == "DF"
+    assert mx.value("state_name", 0) == "Ciudad de México"
+    assert "homonym" not in mx.columns
@@ -0,0 +1,67 @@
+"""Tests for the combined ZA / ZA_OLD classifier."""
+
+import pytest
+
+from id_validation.validate_southafrica import (
+    ApartheidSouthAfricaValidator,
+    PostApartheidSouthAfricaValidator,
+    classify_south_africa,
+    classify_south_africa_batch,
+)
+
+
+@pytest.mark.parametrize(
+    "id_number, codes",
+    [
+        ("4102068120179", ("ZA", "ZA_OLD")),
+        ("7106245929185", ("ZA",)),
+        ("4102068123900", ("ZA_OLD",)),
+        ("4102068120385", ()),
+        ("7106245929285", ()),
+        ("", ()),
+    ],
+)
+def test_country_codes(id_number, codes):
+    assert classify_south_africa(id_number).country_codes == codes
+
+
+@pytest.mark.parametrize("id_number", ["4102068120179", "7106245929185", "4102068123900", "41020 68120179 "])
+def test_parsed_matches_validators(id_number):
+    result = classify_south_africa(id_number)
+    for validator, parsed in (
+        (PostApartheidSouthAfricaValidator(), result.za),
+        (ApartheidSouthAfricaValidator(), result.za_old),
+    ):
+        expected = validator.parse(id_number) if validator.validate(id_number) else None
+        assert parsed == expected
+
+
+def test_parsed_ids_are_built_lazily_and_cached():
+    result = classify_south_africa("4102068120179")
+    assert "za" not in vars(result)
+    assert result.za is result.za
+
+
+def test_invalid_reports_error():
+    result = classify_south_africa("7106245929285")
+    assert result.error == "Invalid checksum"
+    assert result.za is None and result.za_old is None
+
+
+@pytest.mark.parametrize("id_number", [b"\xff\xfe", bytearray(b"41020\xff")])
+def test_undecodable_reports_error(id_number):
+    result = classify_south_africa(id_number)
+    assert result.error == "ID number is not valid UTF-8"
+    assert result.country_codes == ()
+
+
+def test_batch_undecodable_row_does_not_abort():
+    results = classify_south_africa_batch(["4102068120179", b"\xff\xfe", "7106245929185"])
+    assert [r.country_codes for r in results] == [("ZA", "ZA_OLD"), (), ("ZA",)]
+    assert results[1].error == "ID number is not valid UTF-8"
+
+
+def test_batch_reuses_results_for_duplicates():
+    results = classify_south_africa_batch(["4102068120179", "7106245929185", "4102068120179"])
+    assert [r.country_codes for r in results] == [("ZA", "ZA_OLD"), ("ZA",), ("ZA", "ZA_OLD")]
+    assert results[0] is results[2]
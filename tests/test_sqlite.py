@@ -0,0 +1,72 @@
+import json
+import sqlite3
+
+import pytest
+
+from id_validation.pool import ValidatorPool
+from id_validation.sqlite import register_functions
+
+
+@pytest.fixture
+def conn():
+    conn = sqlite3.connect(":memory:")
+    register_functions(conn)
+    conn.execute("CREATE TABLE people (country TEXT, national_id TEXT)")
+    conn.executemany(
+        "INSERT INTO people VALUES (?, ?)",
+        [
+            ("ZA", "7106245929185"),
+            ("ZA", "7106245929181"),
+            ("PL", "44051401458"),
+            ("XX", "123"),
+            ("ZA", None),
+        ],
+    )
+    yield conn
+    conn.close()
+
+
+def test_id_valid(conn):
+    rows = conn.execute("SELECT id_valid(country, national_id) FROM people").fetchall()
+    assert [r[0] for r in rows] == [1, 0, 1, None, None]
+
+
+def test_id_dob_and_gender(conn):
+    row = conn.execute("SELECT id_dob('ZA', '7106245929185'), id_gender('ZA', '7106245929185')").fetchone()
+    assert row == ("1971-06-24", "M")
+    assert conn.execute("SELECT id_dob('ZA', '7106245929181')").fetchone() == (None,)
+
+
+def test_id_parse_returns_json(conn):
+    (text,) = conn.execute("SELECT id_parse('PL', '44051401458')").fetchone()
+    data = json.loads(text)
+    assert data["country_code"] == "PL"
+    assert data["dob"] == "1944-05-14"
+    assert data["extra"]["checksum"] == 8
+
+
+def test_functions_usable_in_generated_columns(conn):
+    conn.execute(
+        "CREATE TABLE ids (country TEXT, national_id TEXT, "
+        "valid INTEGER GENERATED ALWAYS AS (id_valid(country, national_id)) VIRTUAL)"
+    )
+    conn.execute("INSERT INTO ids (country, national_id) VALUES ('ZA', '7106245929185')")
+    assert conn.execute("SELECT valid FROM ids").fetchone() == (1,)
+
+
+def test_integer_column_values_are_accepted(conn):
+    assert conn.execute("SELECT id_valid('PL', 44051401458)").fetchone() == (1,)
+
+
+def test_blob_column_values_are_accepted(conn):
+    assert conn.execute("SELECT id_valid('PL', ?)", (b"44051401458",)).fetchone() == (1,)
+    assert conn.execute("SELECT id_valid('PL', ?)", (b"\xff\xfe",)).fetchone() == (0,)
+
+
+def test_pool_reuses_instances():
+    pool = ValidatorPool()
+    assert pool.get("ZA") is pool.get("ZA")
+    assert pool.get("DK", strict_checksum=True) is not pool.get("DK")
+    assert "ZA" in pool
+    with pytest.raises(ValueError):
+        pool.get("XX")
@@ -0,0 +1,92 @@
+import random
+
+import pytest
+
+from id_validation import ValidatorFactory
+from id_validation.suggest import ChecksumSpec, substitution_cost
+
+
+# Countries whose validators declare a ChecksumSpec for all-digit input.
+_SPEC_COUNTRIES = ["ZA", "ZA_OLD", "PL", "RO", "SI", "BG", "NL", "PT", "CA", "AR", "EC", "CZ", "SK"]
+
+_SEED_IDS = {
+    "ZA": "7106245929185",
+    "ZA_OLD": "4102068120179",
+    "PL": "44051401458",
+    "RO": "1800101221144",
+    "SI": "0101006500006",
+    "BG": "7523169263",
+    "NL": "111222333",
+    "PT": "123456789",
+    "CA": "046454286",
+    "AR": "20123456786",
+    "EC": "1710034065",
+    "CZ": "7801011230",
+    "SK": "7801011230",
+}
+
+
+def _digit_edits(v: str):
+    for i, ch in enumerate(v):
+        for d in "0123456789":
+            if d != ch:
+                yield v[:i] + d + v[i + 1 :]
+    for i in range(len(v) - 1):
+        if v[i] != v[i + 1]:
+            yield v[:i] + v[i + 1] + v[i] + v[i + 2 :]
+
+
+def _typos(v: str, rng: random.Random, n: int):
+    edits = [e for e in _digit_edits(v)]
+    return rng.sample(edits, n)
+
+
+@pytest.mark.parametrize("country", _SPEC_COUNTRIES)
+def test_solved_candidates_match_brute_force(country):
+    v = ValidatorFactory.get_validator(country)
+    seed = _SEED_IDS[country]
+    assert v.validate(seed)
+    assert v.checksum_spec is not None
+
+    rng = random.Random(country)
+    for typo in _typos(seed, rng, 40):
+        if v.validate(typo):
+            continue
+        expected = {c for c in _digit_edits(typo) if v.validate(c)}
+        suggestions = v.suggest(typo)
+        assert set(suggestions) == expected, typo
+        assert seed in suggestions
+
+
+def test_suggest_returns_empty_for_valid_id():
+    v = ValidatorFactory.get_validator("ZA")
+    assert v.suggest("7106245929185") == []
+
+
+def test_transposition_ranked_first():
+    v = ValidatorFactory.get_validator("PL")
+    typo = "44051401485"  # last two digits swapped
+    assert not v.validate(typo)
+    assert v.suggest(typo)[0] == "44051401458"
+
+
+def test_fallback_for_letter_checksums():
+    v = ValidatorFactory.get_validator("ES")
+    # DNI with a mistyped digit: the correct number is among the suggestions.
+    suggestions = v.suggest("12345688Z")
+    assert "12345678Z" in suggestions
+    assert all(v.validate(s) for s in suggestions)
+
+
+def test_ocr_confusion_preferred():
+    assert substitution_cost("O", "0") < substitution_cost("4", "5") < substitution_cost("1", "9")
+
+
+def test_dk_spec_only_when_strict():
+    assert ValidatorFactory.get_validator("DK").checksum_spec is None
+    assert ValidatorFactory.get_validator("DK", strict_checksum=True).checksum_spec is not None
+
+
+def test_spec_rejects_mismatched_contributions():
+    with pytest.raises(ValueError):
+        ChecksumSpec(length=3, modulus=10, contributions=((0,) * 10,), check_values=tuple(range(10)))
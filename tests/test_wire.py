@@ -0,0 +1,124 @@
+import datetime as dt
+import pickle
+import random
+import struct
+
+import pytest
+
+from id_validation import ValidatorFactory
+from id_validation.layout import LAYOUTS
+from id_validation.validators.base import ParsedID
+from id_validation.validate import ValidationError
+from id_validation.wire import decode_batch, decode_parsed, encode_batch, encode_parsed
+
+SAMPLES = [
+    ("ZA", "7106245929185"),
+    ("BE", "85073003328"),
+    ("IT", "RSSMRA85M01H501Q"),
+    ("MX", "GODE900101HDFRRN08"),
+    ("ES", "12345678Z"),
+    ("RO", "1800101221144"),
+    ("FI", "131052-308T"),
+]
+
+
+def _parsed():
+    out = []
+    for country, v in SAMPLES:
+        try:
+            out.append(ValidatorFactory.get_validator(country).parse(v))
+        except ValidationError:
+            pass
+    rng = random.Random(0)
+    for country, layout in LAYOUTS.items():
+        out.extend(layout.parse(layout.generate(rng)) for _ in range(5))
+    return out
+
+
+def test_round_trip_real_results():
+    results = _parsed()
+    assert len(results) > 30
+    results.insert(3, None)
+    assert decode_batch(encode_batch(results)) == results
+
+
+def test_round_trip_unusual_extra_values():
+    parsed = [
+        ParsedID(
+            country_code="XX",
+            id_number="ÅÄÖ-1",
+            extra={
+                "none": None,
+                "flag": True,
+                "n": -5,
+                "ratio": 0.5,
+                "when": dt.date(1899, 12, 31),
+                "name": "Zürich",
+                "pair": (1, -2),
+                "stamp": dt.datetime(2000, 1, 1, 12, 0, 0, 7),
+            },
+        ),
+        ParsedID(
+            country_code="XX",
+            id_number="2",
+            extra={"none": None, "flag": None, "n": None, "ratio": 1.5, "when": None, "name": None, "pair": (), "stamp": None},
+        ),
+    ]
+    decoded = decode_batch(encode_batch(parsed))
+    assert decoded == parsed
+    assert type(decoded[0].extra["stamp"]) is dt.datetime
+    assert decode_parsed(encode_parsed(ParsedID("XX", "1", extra={}))) == ParsedID("XX", "1", extra={})
+    assert decode_parsed(encode_parsed(None)) is None
+    assert decode_batch(encode_batch([])) == []
+
+
+@pytest.mark.parametrize(
+    "extra",
+    [
+        {"big": 1 << 80},
+        {"pair": (1, "a")},
+        {"obj": object()},
+        {"aware": dt.datetime(2000, 1, 1, tzinfo=dt.timezone.utc)},
+    ],
+)
+def test_unsupported_values_raise_type_error(extra):
+    with pytest.raises(TypeError):
+        encode_parsed(ParsedID("XX", "1", extra=extra))
+
+
+def test_mixed_column_raises_type_error():
+    rows = [ParsedID("XX", "1", extra={"v": 1}), ParsedID("XX", "2", extra={"v": "1"})]
+    with pytest.raises(TypeError, match="mixes"):
+        encode_batch(rows)
+
+
+def test_decoder_never_unpickles():
+    import id_validation.wire as wire
+
+    assert "pickle" not in vars(wire)
+    data = bytearray(encode_parsed(ParsedID("XX", "1", extra={"v": 1})))
+    data[data.index(b"q")] = ord("p")  # the old pickle encoding code
+    with pytest.raises(ValueError, match="encoding"):
+        decode_batch(bytes(data))
+
+
+def test_nullable_string_column_layout():
+    rows = [ParsedID("XX", str(i), extra={"city": "Oslo" if i % 2 else None}) for i in range(10)]
+    data = encode_batch(rows)
+    assert decode_batch(data) == rows
+    # Bitmap (2 bytes) plus five u32 offsets and five UTF-8 strings, not ten.
+    assert data.endswith(bytes([0b10101010, 0b10]) + struct.pack("<5I", 4, 8, 12, 16, 20) + b"Oslo" * 5)
+
+
+def test_smaller_than_pickle():
+    # Distinct objects, so pickle's memo cannot shortcut repeats.
+    results = decode_batch(encode_batch(_parsed() * 20))
+    assert len(encode_batch(results)) < len(pickle.dumps(results, protocol=pickle.HIGHEST_PROTOCOL)) * 0.75
+
+
+def test_rejects_foreign_buffers():
+    data = encode_batch([None])
+    with pytest.raises(ValueError, match="version"):
+        decode_batch(data[:4] + b"\x63" + data[5:])
+    with pytest.raises(ValueError, match="parse-result"):
+        decode_batch(b"\0" * 16)
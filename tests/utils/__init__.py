@@ -1,5 +1,6 @@
 """Test utilities for id_validation tests."""
 
+from .fuzz import TEMPLATES, fuzz, repair
 from .generators import (
     CitizenshipType,
     Gender,
@@ -12,6 +13,9 @@ __all__ = [
     "CitizenshipType",
     "Gender",
     "Race",
+    "TEMPLATES",
+    "fuzz",
     "generate_apartheid_south_africa_id",
     "generate_south_africa_id",
+    "repair",
 ]
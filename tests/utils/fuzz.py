@@ -0,0 +1,69 @@
+"""Deterministic mixes of valid and invalid IDs for the batch-level tests.
+
+Every country with a batch kernel has a template in ``TEMPLATES``.
+"""
+
+from __future__ import annotations
+
+import random
+
+from id_validation import ValidatorFactory
+
+
+# Templates with a plausible date/region layout; the last two digits are repaired to a valid checksum.
+TEMPLATES = {
+    "ZA": "7106245929185",
+    "ZA_OLD": "4102068120179",
+    "NG": "35765421356",
+    "BW": "123415678",
+    "BE": "85073003328",
+    "BG": "7523169263",
+    "EE": "38507301234",
+    "LT": "38507301234",
+    "NO": "30078510036",
+    "NL": "111222333",
+    "PL": "44051401458",
+    "PT": "123456789",
+    "RO": "1800101221144",
+    "SI": "0101006500006",
+    "HR": "12345678901",
+    "TR": "12345678901",
+    "IT": "RSSMRA85M01H501Z",
+    "AR": "20123456786",
+    "BR": "52998224725",
+    "CA": "046454286",
+    "EC": "1710034065",
+    "MX": "GODE900101HDFRRN08",
+    "ZW": "50025544Q12",
+}
+
+
+def repair(v: str, validator) -> str | None:
+    """``v`` with its last characters changed until ``validator`` accepts it, or None."""
+    candidates = [v[:-2] + f"{n:02d}" for n in range(100)]
+    candidates += [v[:-1] + ch for ch in "ABCDEFGHIJKLMNOPQRSTUVWXYZ"]
+    candidates += [v[:-3] + ch + v[-2:] for ch in "ABCDEFGHIJKLMNOPQRSTUVWXYZ"]
+    for candidate in candidates:
+        if validator.validate(candidate):
+            return candidate
+    return None
+
+
+def fuzz(country: str, n: int = 400) -> list[str]:
+    """A valid seed ID, ``n`` deterministic mutations of it (some repaired) and a few edge cases."""
+    validator = ValidatorFactory.get_validator(country)
+    rng = random.Random(country)
+    seed = repair(TEMPLATES[country], validator)
+    assert seed is not None, country
+    out = [seed]
+    for _ in range(n):
+        chars = list(seed)
+        for _ in range(rng.randint(1, 3)):
+            i = rng.randrange(len(chars))
+            chars[i] = rng.choice("0123456789" if chars[i].isdigit() else "ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+        v = "".join(chars)
+        if rng.random() < 0.6:
+            v = repair(v, validator) or v
+        out.append(v)
+    out += ["", "12", seed + "1", seed[:-1] + "X", " " + seed + " "]
+    return out